@@ -1,5 +1,7 @@
 from django.db import models
 
+from core.versioning import TrackedQuerySet
+
 
 class AboutContent(models.Model):
     ICON_CHOICES = [
@@ -16,6 +18,8 @@ class AboutContent(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = TrackedQuerySet.as_manager()
+    
     class Meta:
         ordering = ['order']
         verbose_name_plural = 'About Content'
@@ -38,6 +42,8 @@ class AboutHighlight(models.Model):
     order = models.IntegerField(default=0)
     is_active = models.BooleanField(default=True)
     
+    objects = TrackedQuerySet.as_manager()
+    
     class Meta:
         ordering = ['order']
     
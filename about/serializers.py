@@ -1,15 +1,18 @@
-from rest_framework import serializers
+from core.fast import FastListSerializer
+from core.serializers import DynamicFieldsModelSerializer
 from .models import AboutContent, AboutHighlight
 
 
-class AboutHighlightSerializer(serializers.ModelSerializer):
+class AboutHighlightSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = AboutHighlight
         fields = ['id', 'title', 'description', 'icon', 'order', 'is_active']
+        list_serializer_class = FastListSerializer
 
 
-class AboutContentSerializer(serializers.ModelSerializer):
+class AboutContentSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = AboutContent
         fields = ['id', 'section_title', 'description', 'order', 'is_active', 'created_at', 'updated_at']
+        list_serializer_class = FastListSerializer
 
@@ -2,6 +2,8 @@ from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
+from core.mixins import ConditionalGetMixin, ResponseCacheMixin, SparseFieldsMixin
+from core.streaming import StreamingListMixin
 from .models import AboutContent, AboutHighlight
 from .serializers import AboutContentSerializer, AboutHighlightSerializer
 
@@ -10,13 +12,13 @@ class NoPagination(PageNumberPagination):
     page_size = None
 
 
-class AboutContentViewSet(viewsets.ReadOnlyModelViewSet):
+class AboutContentViewSet(ResponseCacheMixin, ConditionalGetMixin, StreamingListMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     queryset = AboutContent.objects.filter(is_active=True)
     serializer_class = AboutContentSerializer
     pagination_class = NoPagination
 
 
-class AboutHighlightViewSet(viewsets.ReadOnlyModelViewSet):
+class AboutHighlightViewSet(ResponseCacheMixin, ConditionalGetMixin, StreamingListMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     queryset = AboutHighlight.objects.filter(is_active=True)
     serializer_class = AboutHighlightSerializer
     pagination_class = NoPagination
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
 import os
+import tempfile
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -51,6 +52,7 @@ INSTALLED_APPS = [
     "experience",
     "contact",
     "technologies",
+    "core",
 ]
 
 MIDDLEWARE = [
@@ -95,6 +97,27 @@ DATABASES = {
 }
 
 
+# Caches
+# "responses" is the shared tier of the API response cache (core.response_cache);
+# a file cache is shared by all worker processes on the host.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "responses": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv(
+            "RESPONSE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "buildwithsharma-responses")
+        ),
+        "TIMEOUT": 60 * 60 * 24,
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    },
+}
+
+# Size limit of the per-process response cache tier, in bytes
+RESPONSE_CACHE_LOCAL_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_LOCAL_MAX_BYTES", 32 * 1024 * 1024))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -149,9 +172,20 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
-    'PAGE_SIZE': 10
+    'PAGE_SIZE': 10,
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.ORJSONRenderer',
+        'core.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
+# Public site URL, used for links in the blog feeds and the sitemap
+SITE_URL = os.getenv('SITE_URL', 'https://buildwithsharma.com')
+
+# Seconds between flushes of the buffered blog post view counts (0 only flushes at exit)
+BLOG_VIEW_FLUSH_INTERVAL = int(os.getenv('BLOG_VIEW_FLUSH_INTERVAL', 30))
+
 # Groq AI Settings
 GROQ_API_KEY = os.getenv('GROQ_API_KEY', '')
 GROQ_MODEL = os.getenv('GROQ_MODEL', 'llama-3.3-70b-versatile')
\ No newline at end of file
@@ -16,6 +16,7 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from blog.views import sitemap, sitemap_page
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -25,4 +26,7 @@ urlpatterns = [
     path("api/experience/", include("experience.urls")),
     path("api/contact/", include("contact.urls")),
     path("api/technologies/", include("technologies.urls")),
+    path("api/bundle/", include("core.urls")),
+    path("sitemap.xml", sitemap, name="sitemap"),
+    path("sitemap-<int:page>.xml", sitemap_page, name="sitemap-page"),
 ]
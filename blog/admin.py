@@ -1,5 +1,6 @@
 from django.contrib import admin
 from .models import BlogPost
+from . import search
 
 
 @admin.register(BlogPost)
@@ -10,3 +11,11 @@ class BlogPostAdmin(admin.ModelAdmin):
     prepopulated_fields = {'slug': ('title',)}
     date_hierarchy = 'date'
     ordering = ['-date']
+    
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Use the FTS5 index instead of icontains scans over the content column
+        """
+        if not search.build_match_query(search_term):
+            return queryset, False
+        return queryset.filter(pk__in=search.matching_ids(search_term)), False
@@ -0,0 +1,98 @@
+"""
+Pre-encoded and pre-compressed blog post payloads.
+
+When a post is saved, its detail JSON payload and its raw content HTML are
+rendered once and stored as identity/gzip/brotli bytes in BlogPostEncoding.
+The detail endpoint then picks a variant by Accept-Encoding and sends the
+stored bytes without serializing or compressing anything per request.
+"""
+import gzip
+
+from core.renderers import ORJSONRenderer
+
+from .models import BlogPostEncoding
+from .serializers import BlogPostSerializer
+
+# Brotli is optional; without it only gzip variants are produced
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _gzip(data):
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+COMPRESSORS = {'gzip': _gzip}
+if brotli is not None:
+    COMPRESSORS['br'] = lambda data: brotli.compress(data, quality=11)
+
+# Preferred order when the client accepts several encodings equally
+PREFERENCE = ['br', 'gzip', 'identity']
+
+
+def render_detail(post):
+    """Render the detail payload exactly as BlogPostViewSet.retrieve would"""
+    return ORJSONRenderer().render(BlogPostSerializer(post).data)
+
+
+def build_variants(post):
+    """Return {(kind, encoding): bytes} for one post"""
+    sources = {
+        'detail': render_detail(post),
+        'content': (post.content or '').encode('utf-8'),
+    }
+    variants = {('detail', 'identity'): sources['detail']}
+    for kind, data in sources.items():
+        for encoding, compress in COMPRESSORS.items():
+            variants[(kind, encoding)] = compress(data)
+    return variants
+
+
+def compress_post(post):
+    """Replace the stored variants for one post"""
+    BlogPostEncoding.objects.filter(post=post).delete()
+    BlogPostEncoding.objects.bulk_create([
+        BlogPostEncoding(post=post, kind=kind, encoding=encoding, payload=payload)
+        for (kind, encoding), payload in build_variants(post).items()
+    ])
+
+
+def parse_accept_encoding(header):
+    """Return {coding: q} from an Accept-Encoding header"""
+    accepted = {}
+    for item in (header or '').split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def choose_encoding(header, available=None):
+    """
+    Pick the best compressed content-coding for an Accept-Encoding header
+    among the available ones. Identity is used when no compression is
+    acceptable or the client explicitly ranks it higher.
+    """
+    available = available or list(COMPRESSORS)
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get('*', 0.0)
+    best, best_quality = 'identity', accepted.get('identity', 0.0)
+    for coding in PREFERENCE:
+        if coding not in available or coding == 'identity':
+            continue
+        quality = accepted.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
@@ -0,0 +1,83 @@
+"""
+Helpers for working with the HTML content of blog posts.
+"""
+import html
+import re
+
+from django.utils.html import strip_tags
+from django.utils.text import slugify
+
+
+def html_to_text(value):
+    """Return the visible text of an HTML fragment"""
+    return html.unescape(strip_tags(value or ''))
+
+
+# Average reading speed for technical content
+WORDS_PER_MINUTE = 150
+
+# Tags are replaced by a space so adjacent blocks (</h2><p>) don't join words
+_TAG_RE = re.compile(r'<[^>]*>')
+
+
+def count_words(content):
+    """Number of words in the visible text of HTML content, tags excluded"""
+    return len(html.unescape(_TAG_RE.sub(' ', content or '')).split())
+
+
+def read_minutes(word_count):
+    """Whole minutes to read ``word_count`` words, at least 1"""
+    return max(1, round(word_count / WORDS_PER_MINUTE))
+
+
+def format_read_time(minutes):
+    return f'{minutes} min read'
+
+
+_HEADING_RE = re.compile(r'<h([23])\b[^>]*>(.*?)</h\1\s*>', re.IGNORECASE | re.DOTALL)
+
+
+def build_toc(content):
+    """
+    Split HTML content into sections at <h2>/<h3> headings.
+
+    Returns a list of table-of-contents entries, one per section, each with
+    ``index``, ``anchor``, ``level`` (2 or 3, or 0 for text before the first
+    heading), ``title`` and the section's ``start``/``end`` byte offsets
+    into the UTF-8 encoded content.
+    """
+    content = content or ''
+    if not content.strip():
+        return []
+    headings = list(_HEADING_RE.finditer(content))
+
+    # (char offset, level, title) for every section start
+    starts = []
+    if not headings or content[:headings[0].start()].strip():
+        starts.append((0, 0, ''))
+    for match in headings:
+        starts.append((match.start(), int(match.group(1)), html_to_text(match.group(2)).strip()))
+
+    toc = []
+    anchors = set()
+    byte_offset = 0
+    char_offset = 0
+    for index, (start, level, title) in enumerate(starts):
+        byte_offset += len(content[char_offset:start].encode('utf-8'))
+        char_offset = start
+        end = starts[index + 1][0] if index + 1 < len(starts) else len(content)
+        anchor = base = slugify(title) or f'section-{index}'
+        counter = 2
+        while anchor in anchors:
+            anchor = f'{base}-{counter}'
+            counter += 1
+        anchors.add(anchor)
+        toc.append({
+            'index': index,
+            'anchor': anchor,
+            'level': level,
+            'title': title,
+            'start': byte_offset,
+            'end': byte_offset + len(content[start:end].encode('utf-8')),
+        })
+    return toc
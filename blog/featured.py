@@ -0,0 +1,51 @@
+"""
+Cached pointer to the featured post.
+
+A partial unique constraint allows a single featured post, so the pointer
+is just its id. It is only dropped when a save or delete changes which
+published post is featured. Other processes may still hold an old id, so
+readers load the post with the featured / published conditions and
+re-resolve the pointer once if it went stale. "No featured post" is never
+cached; that lookup is a seek on the constraint's index.
+"""
+from django.core.cache import cache
+
+from .models import BlogPost
+
+CACHE_KEY = 'blog:featured'
+
+
+def get_id():
+    """Id of the published featured post, or None"""
+    post_id = cache.get(CACHE_KEY)
+    if post_id is None:
+        post_id = BlogPost.objects.filter(is_published=True, featured=True).values_list('pk', flat=True).first()
+        if post_id is not None:
+            cache.set(CACHE_KEY, post_id, None)
+    return post_id
+
+
+def forget():
+    cache.delete(CACHE_KEY)
+
+
+def get_post(queryset=None):
+    """The featured post from ``queryset`` (e.g. with restricted fields), or None"""
+    queryset = BlogPost.objects.all() if queryset is None else queryset
+    for _ in range(2):
+        post_id = get_id()
+        if post_id is None:
+            return None
+        post = queryset.filter(pk=post_id, is_published=True, featured=True).first()
+        if post is not None:
+            return post
+        forget()
+    return None
+
+
+def post_changed(instance, deleted=False):
+    """Drop the pointer if ``instance`` became or stopped being the featured post"""
+    current = cache.get(CACHE_KEY)
+    is_featured = not deleted and instance.featured and instance.is_published
+    if current is not None and (current == instance.pk) != is_featured:
+        forget()
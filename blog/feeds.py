@@ -0,0 +1,244 @@
+"""
+RSS / Atom feeds and the sitemap, assembled from cached per-post fragments.
+
+Each post's ``<item>``, ``<entry>`` and ``<url>`` element is rendered once
+and cached under ``(post id, updated_at)``, so an edited post gets a new key
+and nothing has to be invalidated. A request reads the ``(id, updated_at)``
+pairs of the listed posts, fetches their fragments with one cache call and
+only loads and renders the posts whose fragments are missing, e.g. the
+post added by the daily generator. The header and footer are cheap and
+rendered per request.
+
+Sitemaps with more than ``SITEMAP_LIMIT`` URLs are served as a sitemap
+index pointing at ``/sitemap-<n>.xml`` pages.
+"""
+import hashlib
+from datetime import datetime, time, timezone as dt_timezone
+from io import StringIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import feedgenerator
+from django.utils.xmlutils import SimplerXMLGenerator
+
+from .models import BlogPost
+
+FEED_LIMIT = 20
+# Sitemap protocol maximum of URLs per file
+SITEMAP_LIMIT = 50000
+FRAGMENT_TIMEOUT = 60 * 60 * 24 * 30
+
+FEED_TITLE = 'BuildWithSharma Blog'
+FEED_DESCRIPTION = 'Articles on web development, cloud architecture and software engineering'
+
+# Fields the fragments are rendered from
+FRAGMENT_FIELDS = ('id', 'title', 'slug', 'excerpt', 'author', 'date', 'category', 'updated_at')
+
+SITEMAP_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+SITEMAP_CONTENT_TYPE = 'application/xml; charset=utf-8'
+
+
+def site_url(path=''):
+    return settings.SITE_URL.rstrip('/') + path
+
+
+def post_url(slug):
+    return site_url(f'/blog/{slug}')
+
+
+class LatestDateMixin:
+    """Take the feed's last update from the ``updated`` keyword instead of the items"""
+
+    def latest_post_date(self):
+        return self.feed.get('updated') or super().latest_post_date()
+
+
+class RssFeed(LatestDateMixin, feedgenerator.Rss201rev2Feed):
+    item_tag = 'item'
+
+    def write_header(self, handler):
+        handler.startElement('rss', self.rss_attributes())
+        handler.startElement('channel', self.root_attributes())
+        self.add_root_elements(handler)
+
+    def footer(self):
+        return '</channel></rss>'
+
+
+class AtomFeed(LatestDateMixin, feedgenerator.Atom1Feed):
+    item_tag = 'entry'
+
+    def write_header(self, handler):
+        handler.startElement('feed', self.root_attributes())
+        self.add_root_elements(handler)
+
+    def footer(self):
+        return '</feed>'
+
+
+FEEDS = {
+    'rss': (RssFeed, '/api/blog/feed.xml'),
+    'atom': (AtomFeed, '/api/blog/atom.xml'),
+}
+
+
+def _render(write, document=False):
+    stream = StringIO()
+    handler = SimplerXMLGenerator(stream, 'utf-8', short_empty_elements=True)
+    if document:
+        handler.startDocument()
+    write(handler)
+    return stream.getvalue()
+
+
+def _as_datetime(value):
+    return datetime.combine(value, time.min, tzinfo=dt_timezone.utc)
+
+
+def _fragment_key(kind, post_id, updated_at):
+    # The site URL is part of every fragment
+    site = hashlib.md5(settings.SITE_URL.encode('utf-8')).hexdigest()[:8]
+    return f'blog:xml:{kind}:{site}:{post_id}:{updated_at.timestamp()}'
+
+
+def get_fragments(kind, rows, render):
+    """
+    Return the fragments for ``[(post id, updated_at)]`` in order, rendering
+    (and caching) only the missing ones with ``render(post)``
+    """
+    keys = [_fragment_key(kind, post_id, updated_at) for post_id, updated_at in rows]
+    fragments = cache.get_many(keys)
+    missing = {post_id: key for (post_id, _), key in zip(rows, keys) if key not in fragments}
+    if missing:
+        rendered = {}
+        for post in BlogPost.objects.filter(pk__in=missing).order_by().only(*FRAGMENT_FIELDS):
+            rendered[missing[post.pk]] = render(post)
+        cache.set_many(rendered, FRAGMENT_TIMEOUT)
+        fragments.update(rendered)
+    # A post deleted in between has no fragment and is left out
+    return [fragments[key] for key in keys if key in fragments]
+
+
+def get_feed_rows():
+    """``[(id, updated_at)]`` of the latest published posts, newest first"""
+    return list(BlogPost.objects.filter(is_published=True).values_list('id', 'updated_at')[:FEED_LIMIT])
+
+
+def _new_feed(kind, updated=None):
+    feed_class, path = FEEDS[kind]
+    return feed_class(
+        title=FEED_TITLE,
+        link=site_url('/blog'),
+        description=FEED_DESCRIPTION,
+        feed_url=site_url(path),
+        language=settings.LANGUAGE_CODE,
+        updated=updated,
+    )
+
+
+def render_item(kind, post):
+    """Render the ``<item>`` / ``<entry>`` element of one post"""
+    feed = _new_feed(kind)
+    feed.add_item(
+        title=post.title,
+        link=post_url(post.slug),
+        description=post.excerpt,
+        author_name=post.author,
+        pubdate=_as_datetime(post.date),
+        updateddate=post.updated_at,
+        unique_id=post_url(post.slug),
+        unique_id_is_permalink=True,
+        categories=[post.category] if post.category else [],
+    )
+    item = feed.items[0]
+
+    def write(handler):
+        handler.startElement(feed.item_tag, feed.item_attributes(item))
+        feed.add_item_elements(handler, item)
+        handler.endElement(feed.item_tag)
+
+    return _render(write)
+
+
+def render_feed(kind, rows):
+    """Assemble the RSS or Atom document for the given ``(id, updated_at)`` rows"""
+    updated = max((updated_at for _, updated_at in rows), default=None)
+    feed = _new_feed(kind, updated=updated)
+    items = get_fragments(kind, rows, lambda post: render_item(kind, post))
+    return _render(feed.write_header, document=True) + ''.join(items) + feed.footer()
+
+
+def render_url(post):
+    """Render the sitemap ``<url>`` element of one post"""
+    def write(handler):
+        handler.startElement('url', {})
+        handler.addQuickElement('loc', post_url(post.slug))
+        handler.addQuickElement('lastmod', post.updated_at.date().isoformat())
+        handler.endElement('url')
+
+    return _render(write)
+
+
+def get_sitemap_rows():
+    """``[(id, updated_at)]`` of every published post, oldest first so pages stay stable"""
+    posts = BlogPost.objects.filter(is_published=True).order_by('date', 'created_at')
+    return list(posts.values_list('id', 'updated_at'))
+
+
+def get_static_urls():
+    """Pages listed before the posts"""
+    return [site_url('/'), site_url('/blog')]
+
+
+def sitemap_page_count(rows):
+    total = len(get_static_urls()) + len(rows)
+    return max(1, -(-total // SITEMAP_LIMIT))
+
+
+def page_slice(page):
+    """Post rows range of 1-based ``page``, accounting for the static URLs first"""
+    statics = len(get_static_urls())
+    start = max(0, (page - 1) * SITEMAP_LIMIT - statics)
+    return start, page * SITEMAP_LIMIT - statics
+
+
+def render_sitemap(rows, page=1):
+    """One ``<urlset>`` document: the static pages (on page 1) and a page of posts"""
+    start, end = page_slice(page)
+    page_rows = rows[start:end]
+
+    def write(handler):
+        for url in get_static_urls():
+            handler.startElement('url', {})
+            handler.addQuickElement('loc', url)
+            handler.endElement('url')
+
+    header = _render(lambda handler: None, document=True) + f'<urlset xmlns="{SITEMAP_NS}">'
+    statics = _render(write) if page == 1 else ''
+    urls = get_fragments('sitemap', page_rows, render_url)
+    return header + statics + ''.join(urls) + '</urlset>'
+
+
+def render_sitemap_index(rows):
+    """``<sitemapindex>`` listing one ``/sitemap-<n>.xml`` per page"""
+    def write(handler):
+        handler.startDocument()
+        handler.startElement('sitemapindex', {'xmlns': SITEMAP_NS})
+        for page in range(1, sitemap_page_count(rows) + 1):
+            start, end = page_slice(page)
+            updated = max((updated_at for _, updated_at in rows[start:end]), default=None)
+            handler.startElement('sitemap', {})
+            handler.addQuickElement('loc', site_url(f'/sitemap-{page}.xml'))
+            if updated:
+                handler.addQuickElement('lastmod', updated.date().isoformat())
+            handler.endElement('sitemap')
+        handler.endElement('sitemapindex')
+
+    return _render(write)
+
+
+def get_etag(rows, *parts):
+    """Validator for a document built from ``rows``"""
+    items = [f'{pk}:{updated_at.timestamp()}' for pk, updated_at in rows]
+    text = '|'.join([settings.SITE_URL, *map(str, parts)] + items)
+    return hashlib.md5(text.encode('utf-8')).hexdigest()
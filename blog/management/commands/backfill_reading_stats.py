@@ -0,0 +1,66 @@
+"""
+Django management command to backfill word_count, read_minutes and read_time
+Run once after deploying the reading stats columns; posts saved afterwards
+compute them on save
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from blog import compression, snapshots
+from blog.models import BlogPost
+
+FIELDS = ['word_count', 'read_minutes', 'read_time', 'updated_at']
+
+
+class Command(BaseCommand):
+    help = 'Compute word_count, read_minutes and read_time from the content of existing blog posts'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Number of posts loaded and updated per batch (default: 500)',
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        last_pk = 0
+        checked = updated = 0
+
+        while True:
+            posts = list(
+                BlogPost.objects.filter(pk__gt=last_pk)
+                .order_by('pk')
+                .only('pk', 'content', 'word_count', 'read_minutes', 'read_time')[:chunk_size]
+            )
+            if not posts:
+                break
+            last_pk = posts[-1].pk
+            checked += len(posts)
+
+            now = timezone.now()
+            changed = []
+            for post in posts:
+                before = (post.word_count, post.read_minutes, post.read_time)
+                post.set_reading_stats()
+                if (post.word_count, post.read_minutes, post.read_time) != before:
+                    # Bump updated_at so ETags and cached payloads change too
+                    post.updated_at = now
+                    changed.append(post)
+            if not changed:
+                continue
+
+            with transaction.atomic():
+                BlogPost.objects.bulk_update(changed, FIELDS)
+                # The stored detail payloads include the stats
+                for post in BlogPost.objects.filter(pk__in=[post.pk for post in changed]):
+                    compression.compress_post(post)
+            updated += len(changed)
+            self.stdout.write(f'  Updated {updated} post(s), checked {checked}')
+
+        if updated:
+            snapshots.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully backfilled reading stats: {updated} of {checked} post(s) updated')
+        )
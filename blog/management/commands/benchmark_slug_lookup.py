@@ -0,0 +1,67 @@
+"""
+Django management command to benchmark blog post slug lookups
+Compares the old exception-driven retrieve path with the slug -> pk map
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.http import Http404
+from django.test.utils import CaptureQueriesContext
+from rest_framework.generics import get_object_or_404
+from blog import slugs
+from blog.models import BlogPost
+
+
+def legacy_lookup(queryset, value):
+    """The retrieve logic BlogPostViewSet used before the slug route"""
+    try:
+        return get_object_or_404(queryset, pk=value)
+    except:
+        return BlogPost.objects.filter(slug=value, is_published=True).first()
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the old and new blog post slug lookup paths'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=2000,
+            help='Number of lookups per path (default: 2000)',
+        )
+
+    def handle(self, *args, **options):
+        queryset = BlogPost.objects.filter(is_published=True)
+        slug_list = list(queryset.values_list('slug', flat=True))
+        if not slug_list:
+            self.stdout.write(self.style.WARNING('No published blog posts to benchmark against.'))
+            return
+
+        iterations = options['iterations']
+        slugs.clear()
+        paths = [
+            ('legacy (pk attempt + slug fallback)', lambda slug: legacy_lookup(queryset, slug)),
+            ('slug map (single query)', lambda slug: slugs.resolve(queryset, slug)),
+        ]
+
+        results = []
+        for name, lookup in paths:
+            # Warm up so the slug map is populated before timing
+            for slug in slug_list:
+                lookup(slug)
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                for i in range(iterations):
+                    lookup(slug_list[i % len(slug_list)])
+                elapsed = time.perf_counter() - start
+            results.append((name, elapsed, len(queries) / iterations))
+
+        baseline = results[0][1]
+        self.stdout.write(f'{iterations} lookups over {len(slug_list)} published post(s):')
+        for name, elapsed, queries_per_lookup in results:
+            self.stdout.write(
+                f'  {name:<38} {elapsed * 1000 / iterations:8.3f} ms/lookup  '
+                f'{queries_per_lookup:.2f} queries/lookup  {baseline / elapsed:5.2f}x'
+            )
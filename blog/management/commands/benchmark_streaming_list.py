@@ -0,0 +1,103 @@
+"""
+Django management command to benchmark the streamed blog list
+Compares peak Python memory, time-to-first-byte and total time of the
+buffered DRF list response with the ?stream=1 response
+"""
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.test import APIRequestFactory
+from blog.models import BlogPost
+from blog.views import BlogPostViewSet
+
+
+def consume(response):
+    """Read the whole body, returning (seconds to first chunk, total bytes)"""
+    start = time.perf_counter()
+    if response.streaming:
+        first_chunk = None
+        size = 0
+        for chunk in response.streaming_content:
+            if first_chunk is None:
+                first_chunk = time.perf_counter() - start
+            size += len(chunk)
+        return first_chunk, size
+    response.render()
+    return time.perf_counter() - start, len(response.content)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark memory and time-to-first-byte of the buffered and streamed blog list'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=5000,
+            help='Number of temporary published posts to add for the run (default: 5000)',
+        )
+        parser.add_argument(
+            '--excerpt-size',
+            type=int,
+            default=400,
+            help='Excerpt length in characters of the temporary posts (default: 400)',
+        )
+
+    def handle(self, *args, **options):
+        view = BlogPostViewSet.as_view({'get': 'list'})
+        factory = APIRequestFactory()
+        modes = [
+            ('buffered', {'stream': '0'}),
+            ('streamed', {'stream': '1'}),
+        ]
+
+        # Temporary rows are bulk inserted (no signals) and rolled back afterwards
+        with transaction.atomic():
+            self.create_rows(options['rows'], options['excerpt_size'])
+            total = BlogPost.objects.filter(is_published=True).count()
+
+            results = []
+            for name, params in modes:
+                request = factory.get('/api/blog/posts/', params, HTTP_ACCEPT='application/json')
+                tracemalloc.start()
+                start = time.perf_counter()
+                response = view(request)
+                handler_time = time.perf_counter() - start
+                first_byte, size = consume(response)
+                elapsed = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                results.append((name, handler_time + first_byte, elapsed, peak, size))
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(f'Blog list over {total} published post(s):')
+        for name, first_byte, elapsed, peak, size in results:
+            self.stdout.write(
+                f'  {name:<9} first byte {first_byte * 1000:9.1f} ms  total {elapsed * 1000:9.1f} ms  '
+                f'peak {peak / 1024 / 1024:8.2f} MiB  body {size / 1024:9.1f} KiB'
+            )
+        if results[0][4] != results[1][4]:
+            self.stdout.write(self.style.ERROR('Buffered and streamed bodies differ in size'))
+
+    def create_rows(self, count, excerpt_size):
+        start = date(2000, 1, 1)
+        excerpt = ('lorem ipsum dolor sit amet ' * (excerpt_size // 27 + 1))[:excerpt_size]
+        BlogPost.objects.bulk_create(
+            [
+                BlogPost(
+                    title=f'Benchmark post {i}',
+                    slug=f'benchmark-streaming-post-{i}',
+                    excerpt=excerpt,
+                    content='',
+                    date=start + timedelta(days=i % 5000),
+                    read_time='5 min read',
+                    category='Benchmark',
+                )
+                for i in range(count)
+            ],
+            batch_size=500,
+        )
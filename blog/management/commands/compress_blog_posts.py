@@ -0,0 +1,38 @@
+"""
+Django management command to (re)build the pre-compressed blog post variants
+Run once after deploying to backfill existing posts
+"""
+from django.core.management.base import BaseCommand
+from blog import compression
+from blog.models import BlogPost
+
+
+class Command(BaseCommand):
+    help = 'Build pre-encoded gzip/brotli variants of blog post content and detail payloads'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--missing',
+            action='store_true',
+            help='Only process posts that have no stored variants yet',
+        )
+
+    def handle(self, *args, **options):
+        posts = BlogPost.objects.all()
+        if options['missing']:
+            posts = posts.filter(encodings__isnull=True)
+        
+        if compression.brotli is None:
+            self.stdout.write(
+                self.style.WARNING('brotli is not installed, only gzip variants will be built.')
+            )
+        
+        count = 0
+        for post in posts.iterator(chunk_size=100):
+            compression.compress_post(post)
+            count += 1
+            self.stdout.write(f'  Compressed: "{post.title}"')
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully compressed {count} blog post(s)')
+        )
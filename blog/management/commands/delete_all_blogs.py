@@ -3,6 +3,7 @@ Django management command to delete all blog posts
 """
 from django.core.management.base import BaseCommand
 from blog.models import BlogPost
+from blog import snapshots
 
 
 class Command(BaseCommand):
@@ -29,7 +30,9 @@ class Command(BaseCommand):
             )
             return
         
-        deleted_count, _ = BlogPost.objects.all().delete()
+        # Rebuild the list snapshot once instead of once per deleted post
+        with snapshots.deferred():
+            deleted_count, _ = BlogPost.objects.all().delete()
         
         self.stdout.write(
             self.style.SUCCESS(
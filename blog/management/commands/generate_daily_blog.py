@@ -1,15 +1,34 @@
 """
 Django management command to generate a daily blog post using Groq AI
 Run this command daily (via cron job or scheduled task) to automatically create blog posts
+Use --count/--concurrency or --start-date/--end-date to backfill several posts at once
 """
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from django.utils.text import slugify
 from blog.models import BlogPost
 from blog.services import GroqAIService
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+import statistics
+import time
 import traceback
 
+# Attempts to insert a post when a concurrent writer takes the same slug
+SLUG_ATTEMPTS = 5
+
+
+def unique_slug(title):
+    """First free ``<slug>``, ``<slug>-1``, ... for the title"""
+    base_slug = slugify(title)
+    slug = base_slug
+    counter = 1
+    while BlogPost.objects.filter(slug=slug).exists():
+        slug = f"{base_slug}-{counter}"
+        counter += 1
+    return slug
+
 
 class Command(BaseCommand):
     help = 'Generate a daily blog post using Groq AI'
@@ -28,90 +47,170 @@ class Command(BaseCommand):
         parser.add_argument(
             '--force',
             action='store_true',
-            help='Force generation even if a post already exists for today',
+            help='Force generation even if a post already exists for the date',
+        )
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=1,
+            help='Number of posts to generate, dated today (default: 1)',
+        )
+        parser.add_argument(
+            '--start-date',
+            type=date.fromisoformat,
+            help='First date (YYYY-MM-DD) of a range to backfill, one post per day',
+        )
+        parser.add_argument(
+            '--end-date',
+            type=date.fromisoformat,
+            help='Last date (YYYY-MM-DD) of the range (default: today)',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='Number of generation requests in flight at once (default: 4)',
         )
 
+    def get_dates(self, options):
+        """The date of every post to generate"""
+        start, end = options['start_date'], options['end_date']
+        if start is None and end is None:
+            if options['count'] < 1:
+                raise CommandError('--count must be at least 1.')
+            return [timezone.now().date()] * options['count']
+        if options['count'] != 1:
+            raise CommandError('Use either --count or --start-date/--end-date.')
+        start = start or end
+        end = end or timezone.now().date()
+        if start > end:
+            raise CommandError('--start-date must not be after --end-date.')
+        return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
     def handle(self, *args, **options):
-        self.stdout.write('Starting daily blog post generation...')
-        
-        try:
-            # Check if a post already exists for today
-            today = timezone.now().date()
-            existing_post = BlogPost.objects.filter(date=today).first()
-            
-            if existing_post and not options['force']:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f'Blog post already exists for today: {existing_post.title}'
-                    )
-                )
+        dates = self.get_dates(options)
+        if options['concurrency'] < 1:
+            raise CommandError('--concurrency must be at least 1.')
+        if len(dates) == 1:
+            self.stdout.write('Starting daily blog post generation...')
+        else:
+            self.stdout.write(f'Starting generation of {len(dates)} blog posts...')
+
+        # Skip dates that already have a post
+        if not options['force']:
+            existing = {}
+            for post in BlogPost.objects.filter(date__in=set(dates)).only('title', 'date'):
+                existing.setdefault(post.date, post)
+            for post_date, post in existing.items():
+                label = 'today' if post_date == timezone.now().date() else post_date.isoformat()
+                self.stdout.write(self.style.WARNING(f'Blog post already exists for {label}: {post.title}'))
+            if existing:
                 self.stdout.write('Use --force to generate a new post anyway.')
+            dates = [post_date for post_date in dates if post_date not in existing]
+            if not dates:
                 return
-            
-            # Initialize Groq AI service
-            try:
-                groq_service = GroqAIService()
-            except ValueError as e:
-                self.stdout.write(
-                    self.style.ERROR(f'Groq AI configuration error: {str(e)}')
-                )
-                self.stdout.write(
-                    'Please set GROQ_API_KEY in your environment variables or settings.'
-                )
-                return
-            
-            # Generate blog post
-            category = options.get('category')
-            topic = options.get('topic')
-            
-            self.stdout.write('Generating blog post with Groq AI...')
-            blog_data = groq_service.generate_blog_post(topic=topic, category=category)
-            
-            # Create slug from title
-            slug = slugify(blog_data['title'])
-            
-            # Ensure slug is unique
-            base_slug = slug
-            counter = 1
-            while BlogPost.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            
-            # Generate image URL with topic information
-            image_url = groq_service.generate_image_url(
-                blog_data['title'],
-                blog_data['category'],
-                topic=topic
-            )
-            
-            # Create blog post
-            blog_post = BlogPost.objects.create(
-                title=blog_data['title'],
-                excerpt=blog_data['excerpt'],
-                content=blog_data['content'],
-                author=blog_data['author'],
-                date=today,
-                read_time=blog_data['read_time'],
-                category=blog_data['category'],
-                image=image_url,
-                slug=slug,
-                featured=False,  # Only one featured post at a time
-                is_published=True,
-            )
-            
+
+        # Initialize Groq AI service, shared by all generations
+        try:
+            groq_service = GroqAIService()
+        except ValueError as e:
             self.stdout.write(
-                self.style.SUCCESS(
-                    f'Successfully generated blog post: "{blog_post.title}"'
-                )
+                self.style.ERROR(f'Groq AI configuration error: {str(e)}')
             )
-            self.stdout.write(f'  Category: {blog_post.category}')
-            self.stdout.write(f'  Read time: {blog_post.read_time}')
-            self.stdout.write(f'  Slug: {blog_post.slug}')
-            
-        except Exception as e:
             self.stdout.write(
-                self.style.ERROR(f'Error generating blog post: {str(e)}')
+                'Please set GROQ_API_KEY in your environment variables or settings.'
             )
-            self.stdout.write(traceback.format_exc())
-            raise
+            return
+
+        topic = options.get('topic')
+        jobs = []
+        for index, post_date in enumerate(dates):
+            # Several posts for one day get different default categories
+            category = options.get('category') or groq_service.category_for_date(post_date, dates[:index].count(post_date))
+            jobs.append((post_date, category))
+
+        self.stdout.write('Generating blog posts with Groq AI...' if len(jobs) > 1 else 'Generating blog post with Groq AI...')
+        started = time.perf_counter()
+        latencies = []
+        failures = 0
+
+        # Generation runs in the pool; this thread is the only one writing to the database
+        with ThreadPoolExecutor(max_workers=min(options['concurrency'], len(jobs))) as pool:
+            futures = {
+                pool.submit(self.generate, groq_service, topic, category): (post_date, category)
+                for post_date, category in jobs
+            }
+            for future in as_completed(futures):
+                post_date, category = futures[future]
+                try:
+                    blog_data, latency = future.result()
+                    latencies.append(latency)
+                    blog_post = self.create_post(groq_service, blog_data, post_date, topic)
+                except Exception as e:
+                    failures += 1
+                    self.stdout.write(
+                        self.style.ERROR(f'Error generating blog post for {post_date} ({category}): {str(e)}')
+                    )
+                    self.stdout.write(''.join(traceback.format_exception(e)))
+                    continue
+
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f'Successfully generated blog post: "{blog_post.title}"'
+                    )
+                )
+                self.stdout.write(f'  Date: {blog_post.date}')
+                self.stdout.write(f'  Category: {blog_post.category}')
+                self.stdout.write(f'  Read time: {blog_post.read_time}')
+                self.stdout.write(f'  Slug: {blog_post.slug}')
+                self.stdout.write(f'  Generation time: {latency:.1f}s')
 
+        self.write_summary(len(jobs), failures, time.perf_counter() - started, latencies)
+        if failures:
+            raise CommandError(f'{failures} of {len(jobs)} blog post(s) failed to generate.')
+
+    def generate(self, groq_service, topic, category):
+        """Run one generation request; returns the blog data and the call latency"""
+        call_started = time.perf_counter()
+        blog_data = groq_service.generate_blog_post(topic=topic, category=category)
+        return blog_data, time.perf_counter() - call_started
+
+    def create_post(self, groq_service, blog_data, post_date, topic):
+        """Insert a generated post under a free slug, retrying if another writer takes it first"""
+        # Generate image URL with topic information
+        image_url = groq_service.generate_image_url(
+            blog_data['title'],
+            blog_data['category'],
+            topic=topic
+        )
+        for attempt in range(SLUG_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    return BlogPost.objects.create(
+                        title=blog_data['title'],
+                        excerpt=blog_data['excerpt'],
+                        content=blog_data['content'],
+                        author=blog_data['author'],
+                        date=post_date,
+                        category=blog_data['category'],
+                        image=image_url,
+                        slug=unique_slug(blog_data['title']),
+                        featured=False,  # Keep the current featured post (one at most, see BlogPost.save())
+                        is_published=True,
+                    )
+            except IntegrityError:
+                if attempt == SLUG_ATTEMPTS - 1:
+                    raise
+
+    def write_summary(self, total, failures, elapsed, latencies):
+        if total == 1:
+            return
+        self.stdout.write(f'Generated {total - failures} of {total} blog posts in {elapsed:.1f}s')
+        if latencies:
+            self.stdout.write(
+                f'  Per-call latency: min {min(latencies):.1f}s, '
+                f'median {statistics.median(latencies):.1f}s, '
+                f'mean {statistics.mean(latencies):.1f}s, '
+                f'max {max(latencies):.1f}s'
+            )
+            self.stdout.write(f'  Speedup over sequential calls: {sum(latencies) / elapsed:.1f}x')
@@ -0,0 +1,37 @@
+"""
+Django management command to rebuild the pre-encoded blog list snapshots
+"""
+from django.core.management.base import BaseCommand, CommandError
+from blog import snapshots
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild the pre-encoded blog list snapshots. Saves, deletes and BlogPost.objects bulk '
+        'writes rebuild them automatically; run this after raw SQL or migration data changes.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only compare stored snapshots against the live query (exit non-zero on mismatch)',
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            stale = [key for key in snapshots.BUILDERS if not snapshots.check(key)]
+            for key in snapshots.BUILDERS:
+                status = 'STALE' if key in stale else 'OK'
+                self.stdout.write(f'  [{status}] {key}')
+            if stale:
+                raise CommandError(f'{len(stale)} snapshot(s) out of date. Run without --check to rebuild.')
+            self.stdout.write(self.style.SUCCESS('All snapshots match the live query'))
+            return
+
+        snapshots.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Successfully rebuilt {len(snapshots.BUILDERS)} snapshot(s)'
+            )
+        )
@@ -0,0 +1,24 @@
+"""
+Django management command to recompute related posts for every blog post
+"""
+from django.core.management.base import BaseCommand
+from blog import related
+
+
+class Command(BaseCommand):
+    help = 'Recompute term vectors and precomputed related-post lists for all blog posts'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=256,
+            help='Number of posts scored per similarity block (default: 256)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding related posts...')
+        count = related.rebuild(chunk_size=options['chunk_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully computed related posts for {count} published blog post(s)')
+        )
@@ -0,0 +1,16 @@
+"""
+Django management command to rebuild the blog full-text search index
+"""
+from django.core.management.base import BaseCommand
+from blog import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the FTS5 full-text search index for blog posts'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding blog search index...')
+        count = search.rebuild_index()
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully indexed {count} blog post(s)')
+        )
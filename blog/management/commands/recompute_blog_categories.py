@@ -0,0 +1,27 @@
+"""
+Django management command to recompute the blog category facet and date archive counts
+"""
+from django.core.management.base import BaseCommand, CommandError
+from blog import rollups
+
+
+class Command(BaseCommand):
+    help = 'Recompute the incrementally maintained blog category and archive counts from scratch'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only verify the stored counts against the live table (exit non-zero on mismatch)',
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            stale = rollups.check()
+            if stale:
+                raise CommandError(f'Out of date: {", ".join(stale)}. Run without --check to recompute.')
+            self.stdout.write(self.style.SUCCESS('Category and archive counts match the live table'))
+            return
+
+        rollups.recompute()
+        self.stdout.write(self.style.SUCCESS('Successfully recomputed category and archive counts'))
@@ -1,11 +1,55 @@
 """
 Django management command to regenerate content for blog posts that are missing content
+With --all, generation requests run on a bounded worker pool, results are written in
+bulk_update batches and recorded in a checkpoint file so a crashed run can resume
+without regenerating posts it already paid for
 """
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from django.conf import settings
 from django.core.management.base import BaseCommand
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Length
+from django.utils import timezone
+from blog import compression, related, search, snapshots
+from blog.content import build_toc
 from blog.models import BlogPost
 from blog.services import GroqAIService
-from django.utils.text import slugify
+
+# Posts with less content than this (in characters) are regenerated
+MIN_CONTENT_LENGTH = 500
+
+# Columns written for a regenerated post; toc and the reading stats derive from content
+UPDATE_FIELDS = ['content', 'excerpt', 'toc', 'word_count', 'read_minutes', 'read_time', 'updated_at']
+
+DEFAULT_CHECKPOINT = Path(settings.BASE_DIR) / '.regenerate_blog_content.jsonl'
+
+
+def posts_missing_content():
+    """Posts whose content is empty or shorter than MIN_CONTENT_LENGTH, filtered in SQL"""
+    return BlogPost.objects.annotate(content_length=Length('content')).filter(
+        models.Q(content__isnull=True) | models.Q(content_length__lt=MIN_CONTENT_LENGTH)
+    )
+
+
+def load_checkpoint(path):
+    """Return ``{post id: generated data}`` recorded by an earlier run"""
+    results = {}
+    try:
+        with open(path, encoding='utf-8') as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A line cut short by the crash
+                    continue
+                results[entry['id']] = entry
+    except FileNotFoundError:
+        pass
+    return results
 
 
 class Command(BaseCommand):
@@ -22,10 +66,37 @@ class Command(BaseCommand):
             action='store_true',
             help='Regenerate content for all posts missing content',
         )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='Number of generation requests in flight at once with --all (default: 4)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=10,
+            help='Number of regenerated posts written per transaction with --all (default: 10)',
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=Path,
+            default=DEFAULT_CHECKPOINT,
+            help=f'Checkpoint file of generated content, used to resume an interrupted --all run (default: {DEFAULT_CHECKPOINT})',
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Discard an existing checkpoint instead of resuming from it',
+        )
 
     def handle(self, *args, **options):
+        if not options['slug'] and not options['all']:
+            self.list_posts()
+            return
+
         self.stdout.write('Regenerating blog post content...')
-        
+
         try:
             groq_service = GroqAIService()
         except ValueError as e:
@@ -36,23 +107,22 @@ class Command(BaseCommand):
                 'Please set GROQ_API_KEY in your environment variables or settings.'
             )
             return
-        
+
         if options['slug']:
             # Regenerate specific post
             try:
                 post = BlogPost.objects.get(slug=options['slug'])
                 self.stdout.write(f'Regenerating content for: "{post.title}"')
-                
+
                 blog_data = groq_service.generate_blog_post(
                     topic=None,
                     category=post.category
                 )
-                
+
                 post.content = blog_data['content']
                 post.excerpt = blog_data['excerpt']
-                post.read_time = blog_data['read_time']
                 post.save()
-                
+
                 self.stdout.write(
                     self.style.SUCCESS(
                         f'Successfully regenerated content for: "{post.title}"'
@@ -64,53 +134,107 @@ class Command(BaseCommand):
                 self.stdout.write(
                     self.style.ERROR(f'Blog post with slug "{options["slug"]}" not found')
                 )
-        elif options['all']:
-            # Regenerate all posts missing content
-            posts = BlogPost.objects.filter(
-                models.Q(content__isnull=True) | 
-                models.Q(content='')
-            )
-            # Filter posts with very short content (less than 500 chars)
-            posts = [p for p in posts if not p.content or len(p.content) < 500]
-            
-            updated_count = 0
+        else:
+            self.regenerate_all(groq_service, options)
+
+    def list_posts(self):
+        # Find posts missing content
+        posts = list(posts_missing_content().only('slug', 'title'))
+
+        if len(posts) == 0:
+            self.stdout.write('No blog posts missing content found.')
+            self.stdout.write('Use --all to regenerate all posts or --slug <slug> for specific post.')
+        else:
+            self.stdout.write(f'Found {len(posts)} blog post(s) missing content:')
             for post in posts:
-                self.stdout.write(f'Regenerating content for: "{post.title}"')
-                
+                self.stdout.write(f'  - {post.slug}: "{post.title}"')
+            self.stdout.write('\nUse --all to regenerate all or --slug <slug> for specific post.')
+
+    def regenerate_all(self, groq_service, options):
+        checkpoint = options['checkpoint']
+        if options['restart']:
+            checkpoint.unlink(missing_ok=True)
+
+        # Content generated by an interrupted run is written without calling the API again,
+        # but only for posts that still miss content, so later edits are not overwritten
+        done = load_checkpoint(checkpoint)
+        missing = list(posts_missing_content().only('id', 'title', 'category').order_by('pk'))
+        pending = [done[post.pk] for post in missing if post.pk in done]
+        if done:
+            self.stdout.write(f'Resuming from {checkpoint}: {len(pending)} post(s) already generated')
+            if len(done) > len(pending):
+                self.stdout.write(f'  Skipped {len(done) - len(pending)} checkpoint entry(ies) for posts that no longer miss content')
+        posts = [post for post in missing if post.pk not in done]
+        self.stdout.write(f'Found {len(posts)} blog post(s) to regenerate')
+
+        updated_count = failed_count = 0
+        # Workers only call the API; this thread appends to the checkpoint and writes the database
+        with open(checkpoint, 'a', encoding='utf-8') as log, \
+                ThreadPoolExecutor(max_workers=max(1, options['concurrency'])) as pool:
+            futures = {
+                pool.submit(groq_service.generate_blog_post, topic=None, category=post.category): post
+                for post in posts
+            }
+            for future in as_completed(futures):
+                post = futures[future]
                 try:
-                    blog_data = groq_service.generate_blog_post(
-                        topic=None,
-                        category=post.category
-                    )
-                    
-                    post.content = blog_data['content']
-                    post.excerpt = blog_data['excerpt']
-                    post.read_time = blog_data['read_time']
-                    post.save()
-                    
-                    updated_count += 1
-                    self.stdout.write(f'  [OK] Updated: {len(post.content)} characters')
+                    blog_data = future.result()
                 except Exception as e:
+                    failed_count += 1
                     self.stdout.write(
-                        self.style.ERROR(f'  [ERROR] Error: {str(e)}')
+                        self.style.ERROR(f'  [ERROR] "{post.title}": {str(e)}')
                     )
-            
+                    continue
+
+                entry = {'id': post.pk, 'content': blog_data['content'], 'excerpt': blog_data['excerpt']}
+                log.write(json.dumps(entry) + '\n')
+                log.flush()
+                os.fsync(log.fileno())
+                self.stdout.write(f'  [OK] "{post.title}": {len(entry["content"])} characters')
+
+                pending.append(entry)
+                if len(pending) >= options['batch_size']:
+                    updated_count += self.write_batch(pending)
+                    pending = []
+
+            updated_count += self.write_batch(pending)
+
+        if failed_count:
             self.stdout.write(
-                self.style.SUCCESS(
-                    f'Successfully regenerated content for {updated_count} blog post(s)'
+                self.style.WARNING(
+                    f'{failed_count} post(s) failed; run the command again to retry them '
+                    f'(progress is kept in {checkpoint})'
                 )
             )
         else:
-            # Find posts missing content
-            all_posts = BlogPost.objects.all()
-            posts = [p for p in all_posts if not p.content or len(p.content) < 500]
-            
-            if len(posts) == 0:
-                self.stdout.write('No blog posts missing content found.')
-                self.stdout.write('Use --all to regenerate all posts or --slug <slug> for specific post.')
-            else:
-                self.stdout.write(f'Found {len(posts)} blog post(s) missing content:')
-                for post in posts:
-                    self.stdout.write(f'  - {post.slug}: "{post.title}"')
-                self.stdout.write('\nUse --all to regenerate all or --slug <slug> for specific post.')
+            checkpoint.unlink(missing_ok=True)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Successfully regenerated content for {updated_count} blog post(s)'
+            )
+        )
 
+    def write_batch(self, entries):
+        """Write generated content with one bulk_update and refresh the derived data"""
+        if not entries:
+            return 0
+        contents = {entry['id']: entry for entry in entries}
+        now = timezone.now()
+        with transaction.atomic():
+            # A post edited since its content was generated is left alone
+            posts = list(posts_missing_content().filter(pk__in=contents).select_for_update())
+            for post in posts:
+                post.content = contents[post.pk]['content']
+                post.excerpt = contents[post.pk]['excerpt']
+                post.toc = build_toc(post.content)
+                post.set_reading_stats()
+                post.updated_at = now
+            BlogPost.objects.bulk_update(posts, UPDATE_FIELDS)
+
+            # bulk_update sends no signals, so refresh what save() would have
+            for post in posts:
+                search.index_post(post)
+                compression.compress_post(post)
+                related.schedule_update(post.pk)
+            snapshots.schedule_rebuild()
+        return len(posts)
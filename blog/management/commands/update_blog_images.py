@@ -4,6 +4,7 @@ This fixes 404 errors by updating to the new reliable image service
 """
 from django.core.management.base import BaseCommand
 from blog.models import BlogPost
+from blog import snapshots
 from blog.services import GroqAIService
 
 
@@ -83,15 +84,16 @@ class Command(BaseCommand):
             # Update all posts
             posts = BlogPost.objects.all()
             updated_count = 0
-            for post in posts:
-                old_image = post.image
-                post.image = groq_service.generate_image_url(
-                    post.title,
-                    post.category
-                )
-                post.save()
-                updated_count += 1
-                self.stdout.write(f'  Updated: "{post.title}"')
+            with snapshots.deferred():
+                for post in posts:
+                    old_image = post.image
+                    post.image = groq_service.generate_image_url(
+                        post.title,
+                        post.category
+                    )
+                    post.save()
+                    updated_count += 1
+                    self.stdout.write(f'  Updated: "{post.title}"')
             
             self.stdout.write(
                 self.style.SUCCESS(
@@ -103,14 +105,15 @@ class Command(BaseCommand):
             posts = BlogPost.objects.filter(image__isnull=True) | BlogPost.objects.filter(image='')
             updated_count = 0
             
-            for post in posts:
-                post.image = groq_service.generate_image_url(
-                    post.title,
-                    post.category
-                )
-                post.save()
-                updated_count += 1
-                self.stdout.write(f'  Updated: "{post.title}"')
+            with snapshots.deferred():
+                for post in posts:
+                    post.image = groq_service.generate_image_url(
+                        post.title,
+                        post.category
+                    )
+                    post.save()
+                    updated_count += 1
+                    self.stdout.write(f'  Updated: "{post.title}"')
             
             if updated_count == 0:
                 self.stdout.write('No blog posts with empty images found.')
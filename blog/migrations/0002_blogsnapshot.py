@@ -0,0 +1,23 @@
+# Generated by Django 5.2.10 on 2026-10-18 14:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogSnapshot",
+            fields=[
+                (
+                    "key",
+                    models.CharField(max_length=100, primary_key=True, serialize=False),
+                ),
+                ("payload", models.BinaryField()),
+                ("built_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.10 on 2026-10-18 14:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0002_blogsnapshot"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                condition=models.Q(("is_published", True)),
+                fields=["-date", "-created_at"],
+                name="blog_pub_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                condition=models.Q(("featured", True), ("is_published", True)),
+                fields=["-date", "-created_at"],
+                name="blog_pub_featured_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                condition=models.Q(("featured", False), ("is_published", True)),
+                fields=["-date", "-created_at"],
+                name="blog_pub_recent_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(fields=["-date", "-created_at"], name="blog_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                condition=models.Q(("is_published", True)),
+                fields=["is_published", "updated_at"],
+                name="blog_pub_updated_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.10 on 2026-10-18 15:20
+
+import html
+
+from django.db import migrations
+from django.utils.html import strip_tags
+
+
+def create_fts_table(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    BlogPost = apps.get_model("blog", "BlogPost")
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS blog_blogpost_fts "
+            "USING fts5(title, excerpt, content, tokenize='porter unicode61')"
+        )
+        rows = BlogPost.objects.values_list("pk", "title", "excerpt", "content")
+        cursor.executemany(
+            "INSERT INTO blog_blogpost_fts (rowid, title, excerpt, content) VALUES (%s, %s, %s, %s)",
+            [
+                (pk, title, html.unescape(strip_tags(excerpt)), html.unescape(strip_tags(content)))
+                for pk, title, excerpt, content in rows
+            ],
+        )
+
+
+def drop_fts_table(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS blog_blogpost_fts")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0003_blogpost_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts_table, drop_fts_table),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.10 on 2026-10-18 15:40
+
+from django.db import migrations, models
+
+from blog.content import build_toc
+
+
+def backfill_toc(apps, schema_editor):
+    BlogPost = apps.get_model("blog", "BlogPost")
+    posts = list(BlogPost.objects.only("pk", "content"))
+    for post in posts:
+        post.toc = build_toc(post.content)
+    BlogPost.objects.bulk_update(posts, ["toc"], batch_size=200)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0004_blogpost_fts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogpost",
+            name="toc",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.RunPython(backfill_toc, migrations.RunPython.noop),
+    ]
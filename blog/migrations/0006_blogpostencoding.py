@@ -0,0 +1,65 @@
+# Generated by Django 5.2.10 on 2026-10-18 15:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0005_blogpost_toc"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogPostEncoding",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("content", "Content HTML"),
+                            ("detail", "Detail JSON payload"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "encoding",
+                    models.CharField(
+                        choices=[
+                            ("identity", "identity"),
+                            ("gzip", "gzip"),
+                            ("br", "br"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("payload", models.BinaryField()),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="encodings",
+                        to="blog.blogpost",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("post", "kind", "encoding"),
+                        name="blog_post_encoding_unique",
+                    )
+                ],
+            },
+        ),
+    ]
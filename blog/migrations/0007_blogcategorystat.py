@@ -0,0 +1,48 @@
+# Generated by Django 5.2.10 on 2026-10-18 15:10
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def populate_category_stats(apps, schema_editor):
+    BlogPost = apps.get_model("blog", "BlogPost")
+    BlogCategoryStat = apps.get_model("blog", "BlogCategoryStat")
+    rows = (
+        BlogPost.objects.filter(is_published=True)
+        .order_by()
+        .values("category")
+        .annotate(post_count=Count("id"), latest_date=Max("date"))
+    )
+    BlogCategoryStat.objects.bulk_create([BlogCategoryStat(**row) for row in rows])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0006_blogpostencoding"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogCategoryStat",
+            fields=[
+                (
+                    "category",
+                    models.CharField(max_length=100, primary_key=True, serialize=False),
+                ),
+                ("post_count", models.PositiveIntegerField(default=0)),
+                ("latest_date", models.DateField(blank=True, null=True)),
+            ],
+            options={
+                "ordering": ["category"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                condition=models.Q(("is_published", True)),
+                fields=["category", "-date"],
+                name="blog_pub_category_date_idx",
+            ),
+        ),
+        migrations.RunPython(populate_category_stats, migrations.RunPython.noop),
+    ]
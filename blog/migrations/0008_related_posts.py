@@ -0,0 +1,69 @@
+# Generated by Django 5.2.10 on 2026-10-18 15:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0007_blogcategorystat"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogPostVector",
+            fields=[
+                (
+                    "post",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="vector",
+                        serialize=False,
+                        to="blog.blogpost",
+                    ),
+                ),
+                ("vector", models.BinaryField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name="RelatedPost",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("score", models.FloatField()),
+                ("rank", models.PositiveSmallIntegerField()),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_posts",
+                        to="blog.blogpost",
+                    ),
+                ),
+                (
+                    "related",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_from",
+                        to="blog.blogpost",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["post", "rank"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("post", "rank"), name="blog_related_post_rank_unique"
+                    )
+                ],
+            },
+        ),
+    ]
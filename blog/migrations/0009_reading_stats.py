@@ -0,0 +1,35 @@
+# Generated by Django 5.2.10 on 2026-10-18 15:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0008_related_posts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogpost",
+            name="word_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="blogpost",
+            name="read_minutes",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name="blogpost",
+            name="read_time",
+            field=models.CharField(editable=False, max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                condition=models.Q(("is_published", True)),
+                fields=["read_minutes"],
+                name="blog_pub_read_minutes_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,50 @@
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+
+def populate_archive_stats(apps, schema_editor):
+    BlogPost = apps.get_model("blog", "BlogPost")
+    BlogArchiveStat = apps.get_model("blog", "BlogArchiveStat")
+    rows = (
+        BlogPost.objects.filter(is_published=True)
+        .order_by()
+        .values(year=ExtractYear("date"), month=ExtractMonth("date"))
+        .annotate(post_count=Count("id"))
+    )
+    BlogArchiveStat.objects.bulk_create([BlogArchiveStat(**row) for row in rows])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0009_reading_stats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogArchiveStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("year", models.PositiveSmallIntegerField()),
+                ("month", models.PositiveSmallIntegerField()),
+                ("post_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "ordering": ["-year", "-month"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("year", "month"), name="blog_archive_month_unique"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_archive_stats, migrations.RunPython.noop),
+    ]
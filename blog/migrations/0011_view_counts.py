@@ -0,0 +1,54 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0010_blogarchivestat"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogPostViewCount",
+            fields=[
+                (
+                    "post",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="view_stats",
+                        serialize=False,
+                        to="blog.blogpost",
+                    ),
+                ),
+                ("view_count", models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["-view_count", "post"], name="blog_view_count_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="BlogPopularPost",
+            fields=[
+                (
+                    "post",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="popular",
+                        serialize=False,
+                        to="blog.blogpost",
+                    ),
+                ),
+                ("rank", models.PositiveSmallIntegerField(unique=True)),
+                ("view_count", models.PositiveBigIntegerField()),
+            ],
+            options={
+                "ordering": ["rank"],
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def keep_latest_featured(apps, schema_editor):
+    """
+    Unfeature all but the latest featured post so the constraint can be added.
+
+    The update sends no signals, so the stored variants of the
+    unfeatured posts and the list snapshot would still say
+    ``"featured": true``. They are dropped instead: requests for those posts
+    fall back to the serializer and the snapshot is rebuilt on first read. Run
+    ``compress_blog_posts --missing`` afterwards to restore the variants.
+    """
+    BlogPost = apps.get_model("blog", "BlogPost")
+    BlogPostEncoding = apps.get_model("blog", "BlogPostEncoding")
+    BlogSnapshot = apps.get_model("blog", "BlogSnapshot")
+    featured = BlogPost.objects.filter(featured=True).order_by("-date", "-created_at")
+    latest = featured.values_list("pk", flat=True).first()
+    if latest is None:
+        return
+    unfeatured = list(featured.exclude(pk=latest).values_list("pk", flat=True))
+    if unfeatured:
+        BlogPost.objects.filter(pk__in=unfeatured).update(featured=False, updated_at=timezone.now())
+        BlogPostEncoding.objects.filter(post_id__in=unfeatured).delete()
+        BlogSnapshot.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0011_view_counts"),
+    ]
+
+    operations = [
+        migrations.RunPython(keep_latest_featured, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="blogpost",
+            name="blog_pub_featured_date_idx",
+        ),
+        migrations.AddConstraint(
+            model_name="blogpost",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("featured", True)),
+                fields=("featured",),
+                name="blog_single_featured_post",
+            ),
+        ),
+    ]
@@ -1,4 +1,8 @@
-from django.db import models
+from django.db import models, transaction
+
+from core.versioning import TrackedQuerySet
+
+from .content import build_toc, count_words, format_read_time, read_minutes
 
 
 class BlogPost(models.Model):
@@ -7,7 +11,10 @@ class BlogPost(models.Model):
     content = models.TextField(blank=True)
     author = models.CharField(max_length=100, default='BuildWithSharma')
     date = models.DateField()
-    read_time = models.CharField(max_length=20)
+    # Derived from content on save, see BlogPost.save()
+    read_time = models.CharField(max_length=20, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    read_minutes = models.PositiveSmallIntegerField(default=0, editable=False)
     category = models.CharField(max_length=100)
     image = models.URLField(max_length=500, blank=True)
     featured = models.BooleanField(default=False)
@@ -15,9 +22,226 @@ class BlogPost(models.Model):
     is_published = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Section table of contents with byte offsets into content, see build_toc()
+    toc = models.JSONField(default=list, blank=True, editable=False)
+    
+    objects = TrackedQuerySet.as_manager()
     
     class Meta:
         ordering = ['-date', '-created_at']
+        # Boolean filters compile to bare column tests (WHERE "is_published"),
+        # which SQLite cannot seek on, so the public access paths use partial
+        # indexes whose conditions match those filters exactly.
+        indexes = [
+            # Published list and cursor pages
+            models.Index(
+                fields=['-date', '-created_at'],
+                condition=models.Q(is_published=True),
+                name='blog_pub_date_idx',
+            ),
+            # recent action
+            models.Index(
+                fields=['-date', '-created_at'],
+                condition=models.Q(is_published=True, featured=False),
+                name='blog_pub_recent_date_idx',
+            ),
+            # generate_daily_blog: date=? ORDER BY -date, -created_at
+            models.Index(fields=['-date', '-created_at'], name='blog_date_idx'),
+            # Category facet maintenance: latest published date per category
+            models.Index(
+                fields=['category', '-date'],
+                condition=models.Q(is_published=True),
+                name='blog_pub_category_date_idx',
+            ),
+            # List ?ordering=read_minutes and ?max_read_minutes=
+            models.Index(
+                fields=['read_minutes'],
+                condition=models.Q(is_published=True),
+                name='blog_pub_read_minutes_idx',
+            ),
+            # Conditional GET validators: COUNT(*), MAX(updated_at) over published
+            # posts; is_published is included so the index covers the query
+            models.Index(
+                fields=['is_published', 'updated_at'],
+                condition=models.Q(is_published=True),
+                name='blog_pub_updated_idx',
+            ),
+        ]
+        constraints = [
+            # A single featured post; also the index of the featured lookup
+            models.UniqueConstraint(
+                fields=['featured'],
+                condition=models.Q(featured=True),
+                name='blog_single_featured_post',
+            ),
+        ]
     
     def __str__(self):
         return self.title
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored values so save/delete signals can compute deltas
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+    
+    def set_reading_stats(self):
+        """Compute word_count, read_minutes and read_time from the content"""
+        self.word_count = count_words(self.content)
+        self.read_minutes = read_minutes(self.word_count)
+        self.read_time = format_read_time(self.read_minutes)
+    
+    def save(self, *args, **kwargs):
+        self.toc = build_toc(self.content)
+        self.set_reading_stats()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'content' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'toc', 'word_count', 'read_minutes', 'read_time'}
+        if self.featured and (update_fields is None or 'featured' in update_fields):
+            with transaction.atomic():
+                self.unfeature_others()
+                super().save(*args, **kwargs)
+        else:
+            super().save(*args, **kwargs)
+    
+    def unfeature_others(self):
+        """
+        Clear the flag on the currently featured post, so this one can take
+        its place without violating the single featured post constraint
+        """
+        others = BlogPost.objects.filter(featured=True).select_for_update()
+        if self.pk is not None:
+            others = others.exclude(pk=self.pk)
+        # Saved one by one so its payloads and validators are refreshed
+        for post in others:
+            post.featured = False
+            post.save(update_fields=['featured', 'updated_at'])
+
+
+class BlogSnapshot(models.Model):
+    """Pre-encoded response body for a blog endpoint, rebuilt whenever posts change."""
+    key = models.CharField(max_length=100, primary_key=True)
+    payload = models.BinaryField()
+    built_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.key
+
+
+class BlogCategoryStat(models.Model):
+    """Published post count and latest post date per category, maintained on write."""
+    category = models.CharField(max_length=100, primary_key=True)
+    post_count = models.PositiveIntegerField(default=0)
+    latest_date = models.DateField(null=True, blank=True)
+    
+    objects = TrackedQuerySet.as_manager()
+    
+    class Meta:
+        ordering = ['category']
+    
+    def __str__(self):
+        return f"{self.category} ({self.post_count})"
+
+
+class BlogArchiveStat(models.Model):
+    """Published post count per year and month of the post date, maintained on write."""
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    post_count = models.PositiveIntegerField(default=0)
+    
+    objects = TrackedQuerySet.as_manager()
+    
+    class Meta:
+        ordering = ['-year', '-month']
+        constraints = [
+            models.UniqueConstraint(fields=['year', 'month'], name='blog_archive_month_unique'),
+        ]
+    
+    def __str__(self):
+        return f"{self.year}-{self.month:02d} ({self.post_count})"
+
+
+class BlogPostViewCount(models.Model):
+    """Total detail views of a post, incremented in batches by blog.viewcounts."""
+    post = models.OneToOneField(BlogPost, primary_key=True, related_name='view_stats', on_delete=models.CASCADE)
+    view_count = models.PositiveBigIntegerField(default=0)
+    
+    class Meta:
+        indexes = [
+            # Popular ranking rebuilt after each flush
+            models.Index(fields=['-view_count', 'post'], name='blog_view_count_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.post_id}: {self.view_count} views"
+
+
+class BlogPopularPost(models.Model):
+    """Most viewed published posts, ranked once per view count flush."""
+    post = models.OneToOneField(BlogPost, primary_key=True, related_name='popular', on_delete=models.CASCADE)
+    rank = models.PositiveSmallIntegerField(unique=True)
+    view_count = models.PositiveBigIntegerField()
+    
+    objects = TrackedQuerySet.as_manager()
+    
+    class Meta:
+        ordering = ['rank']
+    
+    def __str__(self):
+        return f"#{self.rank} {self.post_id} ({self.view_count} views)"
+
+
+class BlogPostVector(models.Model):
+    """Hashed term-frequency vector of a post, used to compute TF-IDF similarity."""
+    post = models.OneToOneField(BlogPost, primary_key=True, related_name='vector', on_delete=models.CASCADE)
+    vector = models.BinaryField()
+    
+    def __str__(self):
+        return f"Vector for {self.post_id}"
+
+
+class RelatedPost(models.Model):
+    """Precomputed top-k most similar published posts for a post."""
+    post = models.ForeignKey(BlogPost, related_name='related_posts', on_delete=models.CASCADE)
+    related = models.ForeignKey(BlogPost, related_name='related_from', on_delete=models.CASCADE)
+    score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+    
+    objects = TrackedQuerySet.as_manager()
+    
+    class Meta:
+        ordering = ['post', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'rank'], name='blog_related_post_rank_unique'),
+        ]
+    
+    def __str__(self):
+        return f"{self.post_id} -> {self.related_id} ({self.score:.3f})"
+
+
+class BlogPostEncoding(models.Model):
+    """Pre-encoded (and optionally pre-compressed) bytes for one post, produced at write time."""
+    KIND_CHOICES = [
+        ('content', 'Content HTML'),
+        ('detail', 'Detail JSON payload'),
+    ]
+    
+    ENCODING_CHOICES = [
+        ('identity', 'identity'),
+        ('gzip', 'gzip'),
+        ('br', 'br'),
+    ]
+    
+    post = models.ForeignKey(BlogPost, related_name='encodings', on_delete=models.CASCADE)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    encoding = models.CharField(max_length=10, choices=ENCODING_CHOICES)
+    payload = models.BinaryField()
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'kind', 'encoding'], name='blog_post_encoding_unique'),
+        ]
+    
+    def __str__(self):
+        return f"{self.post_id} {self.kind} ({self.encoding})"
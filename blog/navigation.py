@@ -0,0 +1,31 @@
+"""
+Previous / next links for the blog post detail response.
+
+Each neighbour is a correlated subquery on the detail query itself, so
+both come back in the same round trip as the post. A subquery is one seek
+on the published ``(-date, -created_at)`` index: the nearest older or newer
+published post in chronological order, ties on ``date`` broken by
+``created_at``. The neighbour is returned as a JSON object of ``FIELDS``.
+"""
+from django.db.models import OuterRef, Q, Subquery
+from django.db.models.functions import JSONObject
+
+from .models import BlogPost
+
+FIELDS = ('slug', 'title', 'date')
+
+
+def _neighbour(older):
+    if older:
+        window = Q(date__lt=OuterRef('date')) | Q(date=OuterRef('date'), created_at__lt=OuterRef('created_at'))
+        posts = BlogPost.objects.filter(is_published=True, date__lte=OuterRef('date')).order_by('-date', '-created_at')
+    else:
+        window = Q(date__gt=OuterRef('date')) | Q(date=OuterRef('date'), created_at__gt=OuterRef('created_at'))
+        posts = BlogPost.objects.filter(is_published=True, date__gte=OuterRef('date')).order_by('date', 'created_at')
+    link = JSONObject(**{field: field for field in FIELDS})
+    return Subquery(posts.filter(window).values_list(link, flat=True)[:1])
+
+
+def with_neighbours(queryset):
+    """Annotate ``nav_prev`` / ``nav_next`` (dict or None) on the posts of ``queryset``"""
+    return queryset.annotate(nav_prev=_neighbour(older=True), nav_next=_neighbour(older=False))
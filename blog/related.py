@@ -0,0 +1,254 @@
+"""
+Related posts from TF-IDF similarity.
+
+Each post gets a hashed term-frequency vector (BlogPostVector) built from
+its title, excerpt and content. Similarities are cosine scores between
+TF-IDF weighted vectors, with IDF computed from the document frequencies
+of the current published corpus. The top ``TOP_K`` neighbours of every post
+are stored in RelatedPost so the request path is a single indexed lookup.
+
+Updates are incremental and deferred to the end of the transaction:
+``schedule_update()`` collects the posts saved or deleted in a transaction
+and ``update_posts()`` runs once on commit. It loads the corpus once,
+compares the changed vectors against it in one matrix product, replaces
+their own neighbour lists, and only inserts them into the lists of posts
+whose current k-th score they beat. Lists that contained an unpublished,
+deleted or weakened post are recomputed. ``rebuild()`` recomputes every
+list from scratch.
+"""
+import math
+import re
+import threading
+import zlib
+from collections import Counter
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Q
+
+from .content import html_to_text
+from .models import BlogPost, BlogPostVector, RelatedPost
+
+DIMENSIONS = 2048
+TOP_K = 10
+
+# Fields whose changes require the vector and neighbour lists to be updated
+SOURCE_FIELDS = ('title', 'excerpt', 'content', 'is_published')
+
+# Field weights applied to term counts
+TITLE_WEIGHT = 3
+EXCERPT_WEIGHT = 2
+
+STOP_WORDS = frozenset("""
+    a about above after again all also an and any are as at be because been before being
+    below between both but by can could did do does doing down during each few for from
+    further had has have having here how i if in into is it its itself just more most my
+    no nor not now of off on once only or other our out over own same she should so some
+    such than that the their them then there these they this those through to too under
+    until up very was we were what when where which while who why will with would you
+    your yours use using used one two new like get make way need want well
+""".split())
+
+_TOKEN_RE = re.compile(r'[a-z][a-z0-9+#]+')
+
+
+def tokenize(text):
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def term_vector(post):
+    """Sublinear hashed term-frequency vector for one post"""
+    counts = Counter()
+    for weight, text in (
+        (TITLE_WEIGHT, post.title),
+        (EXCERPT_WEIGHT, html_to_text(post.excerpt)),
+        (1, html_to_text(post.content)),
+    ):
+        for token in tokenize(text):
+            counts[zlib.crc32(token.encode('utf-8')) % DIMENSIONS] += weight
+
+    vector = np.zeros(DIMENSIONS, dtype=np.float32)
+    for index, count in counts.items():
+        vector[index] = 1.0 + math.log(count)
+    return vector
+
+
+def load_corpus():
+    """Return (post ids, term matrix) for every published post with a vector"""
+    rows = BlogPostVector.objects.filter(post__is_published=True).values_list('post_id', 'vector')
+    ids = []
+    vectors = []
+    for post_id, vector in rows.iterator(chunk_size=500):
+        ids.append(post_id)
+        vectors.append(np.frombuffer(bytes(vector), dtype=np.float32))
+    matrix = np.vstack(vectors) if vectors else np.zeros((0, DIMENSIONS), dtype=np.float32)
+    return np.array(ids, dtype=np.int64), matrix
+
+
+def tfidf(matrix):
+    """Row-normalised TF-IDF weights for a term matrix"""
+    document_frequency = np.count_nonzero(matrix, axis=0)
+    idf = np.log((1 + len(matrix)) / (1 + document_frequency)) + 1
+    weighted = matrix * idf.astype(np.float32)
+    norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return weighted / norms, idf
+
+
+def _top_k(ids, scores, exclude):
+    order = np.argsort(-scores, kind='stable')
+    return [
+        (int(ids[i]), float(scores[i]))
+        for i in order
+        if ids[i] != exclude and scores[i] > 0
+    ][:TOP_K]
+
+
+def _replace_neighbours(post_id, neighbours):
+    RelatedPost.objects.filter(post_id=post_id).delete()
+    RelatedPost.objects.bulk_create([
+        RelatedPost(post_id=post_id, related_id=related_id, score=score, rank=rank)
+        for rank, (related_id, score) in enumerate(neighbours)
+    ])
+
+
+def _refresh(ids, weighted, post_ids):
+    for index, post_id in enumerate(ids.tolist()):
+        if post_id in post_ids:
+            _replace_neighbours(post_id, _top_k(ids, weighted @ weighted[index], exclude=post_id))
+
+
+def refresh_lists(post_ids):
+    """Recompute the neighbour lists of the given posts against the corpus"""
+    post_ids = set(post_ids)
+    if not post_ids:
+        return
+    ids, matrix = load_corpus()
+    weighted, _ = tfidf(matrix)
+    _refresh(ids, weighted, post_ids)
+
+
+def affected_by(post_id):
+    """Ids of the posts whose neighbour lists include ``post_id``"""
+    return list(RelatedPost.objects.filter(related_id=post_id).values_list('post_id', flat=True))
+
+
+def update_posts(post_ids, stale=()):
+    """
+    Store the vectors of the given posts and update the neighbour lists they
+    affect, loading the corpus once. The lists of ``stale`` posts (e.g. ones
+    that contained a deleted post) are recomputed as well.
+    """
+    refresh = set(stale)
+    posts = list(BlogPost.objects.filter(pk__in=post_ids).only('pk', 'title', 'excerpt', 'content', 'is_published'))
+    with transaction.atomic():
+        for post in posts:
+            BlogPostVector.objects.update_or_create(post=post, defaults={'vector': term_vector(post).tobytes()})
+
+        unpublished = [post.pk for post in posts if not post.is_published]
+        if unpublished:
+            refresh.update(RelatedPost.objects.filter(related_id__in=unpublished).values_list('post_id', flat=True))
+            RelatedPost.objects.filter(Q(post_id__in=unpublished) | Q(related_id__in=unpublished)).delete()
+
+        ids, matrix = load_corpus()
+        weighted, _ = tfidf(matrix)
+        position = {post_id: index for index, post_id in enumerate(ids.tolist())}
+        changed = [post.pk for post in posts if post.is_published and post.pk in position]
+        if changed:
+            # One row of scores against the whole corpus per changed post
+            scores = weighted[[position[post_id] for post_id in changed]] @ weighted.T
+            for post_id, row in zip(changed, scores):
+                _replace_neighbours(post_id, _top_k(ids, row, exclude=post_id))
+
+            current = {}
+            rows = RelatedPost.objects.exclude(post_id__in=changed).values_list('post_id', 'related_id', 'score')
+            for other_id, related_id, score in rows:
+                current.setdefault(other_id, []).append((related_id, score))
+
+            changed_ids = set(changed)
+            for index, other_id in enumerate(ids.tolist()):
+                if other_id in changed_ids or other_id in refresh:
+                    continue
+                existing = current.get(other_id, [])
+                neighbours = [item for item in existing if item[0] not in changed_ids]
+                candidates = [
+                    (post_id, float(scores[row, index]))
+                    for row, post_id in enumerate(changed)
+                    if post_id != other_id and scores[row, index] > 0
+                ]
+                merged = sorted(neighbours + candidates, key=lambda item: -item[1])[:TOP_K]
+                listed = {related_id for related_id, _ in existing} & changed_ids
+                if listed - {related_id for related_id, _ in merged}:
+                    # A changed post dropped out of this list, so find its replacement
+                    refresh.add(other_id)
+                elif merged != sorted(existing, key=lambda item: -item[1]):
+                    _replace_neighbours(other_id, merged)
+        _refresh(ids, weighted, refresh - set(changed))
+
+
+def update_post(post):
+    """Store the vector for one post and update the neighbour lists it affects"""
+    update_posts([post.pk])
+
+
+_state = threading.local()
+
+
+def _pending():
+    if not hasattr(_state, 'posts'):
+        _state.posts, _state.stale = set(), set()
+    return _state
+
+
+def _update_pending():
+    pending = _pending()
+    post_ids, stale = pending.posts, pending.stale
+    pending.posts, pending.stale = set(), set()
+    if post_ids or stale:
+        update_posts(post_ids, stale)
+
+
+def schedule_update(post_id=None, stale=(), using=None):
+    """
+    Update the post (and recompute the ``stale`` lists) once the current
+    transaction commits. All writes of one transaction share one update.
+    """
+    pending = _pending()
+    if post_id is not None:
+        pending.posts.add(post_id)
+    pending.stale.update(stale)
+    connection = transaction.get_connection(using)
+    if any(func is _update_pending for _, func, _ in connection.run_on_commit):
+        return
+    transaction.on_commit(_update_pending, using=using)
+
+
+def rebuild(chunk_size=256):
+    """
+    Recompute every vector and every neighbour list. Returns the number of
+    published posts processed.
+    """
+    with transaction.atomic():
+        BlogPostVector.objects.all().delete()
+        BlogPostVector.objects.bulk_create(
+            [
+                BlogPostVector(post=post, vector=term_vector(post).tobytes())
+                for post in BlogPost.objects.only('pk', 'title', 'excerpt', 'content').iterator(chunk_size=200)
+            ],
+            batch_size=500,
+        )
+        ids, matrix = load_corpus()
+        weighted, _ = tfidf(matrix)
+
+        RelatedPost.objects.all().delete()
+        for start in range(0, len(ids), chunk_size):
+            block = weighted[start:start + chunk_size] @ weighted.T
+            rows = []
+            for offset, scores in enumerate(block):
+                post_id = int(ids[start + offset])
+                rows.extend(
+                    RelatedPost(post_id=post_id, related_id=related_id, score=score, rank=rank)
+                    for rank, (related_id, score) in enumerate(_top_k(ids, scores, exclude=post_id))
+                )
+            RelatedPost.objects.bulk_create(rows, batch_size=500)
+    return len(ids)
@@ -0,0 +1,134 @@
+"""
+Incrementally maintained aggregates over published blog posts.
+
+Each rollup keeps one row per key (e.g. per category) and is updated with
+small per-row deltas from the BlogPost save/delete signals instead of a
+GROUP BY per request. ``recompute()`` rebuilds a rollup from scratch and
+``check()`` compares the stored rows with the live aggregate.
+"""
+from django.db import transaction
+from django.db.models import Count, F, Max, Value
+from django.db.models.functions import Coalesce, ExtractMonth, ExtractYear, Greatest
+
+from .models import BlogArchiveStat, BlogCategoryStat, BlogPost
+
+# BlogPost fields the rollups depend on
+TRACKED_FIELDS = ('category', 'date', 'is_published')
+
+
+def get_state(post):
+    return {field: getattr(post, field) for field in TRACKED_FIELDS}
+
+
+def get_previous_state(post):
+    """
+    The tracked values as last loaded from the database, or None if they
+    are not all known (e.g. the post was created in memory or deferred)
+    """
+    loaded = getattr(post, '_loaded_values', None) or {}
+    if not all(field in loaded for field in TRACKED_FIELDS):
+        return None
+    return {field: loaded[field] for field in TRACKED_FIELDS}
+
+
+class CategoryRollup:
+    model = BlogCategoryStat
+
+    def add(self, state):
+        category, date = state['category'], state['date']
+        updated = self.model.objects.filter(category=category).update(
+            post_count=F('post_count') + 1,
+            latest_date=Greatest(Coalesce('latest_date', Value(date)), Value(date)),
+        )
+        if not updated:
+            self.model.objects.create(category=category, post_count=1, latest_date=date)
+
+    def remove(self, state):
+        category, date = state['category'], state['date']
+        self.model.objects.filter(category=category).update(post_count=F('post_count') - 1)
+        self.model.objects.filter(category=category, post_count__lte=0).delete()
+        # Only look up a new latest date when the removed post held it
+        if self.model.objects.filter(category=category, latest_date__lte=date).exists():
+            latest = BlogPost.objects.filter(is_published=True, category=category).aggregate(
+                latest=Max('date')
+            )['latest']
+            self.model.objects.filter(category=category).update(latest_date=latest)
+
+    def build(self):
+        rows = (
+            BlogPost.objects.filter(is_published=True)
+            .order_by()
+            .values('category')
+            .annotate(post_count=Count('id'), latest_date=Max('date'))
+        )
+        return [self.model(**row) for row in rows]
+
+    def rows(self, objects):
+        return sorted((obj.category, obj.post_count, obj.latest_date) for obj in objects)
+
+
+class ArchiveRollup:
+    model = BlogArchiveStat
+
+    def add(self, state):
+        year, month = state['date'].year, state['date'].month
+        updated = self.model.objects.filter(year=year, month=month).update(post_count=F('post_count') + 1)
+        if not updated:
+            self.model.objects.create(year=year, month=month, post_count=1)
+
+    def remove(self, state):
+        year, month = state['date'].year, state['date'].month
+        self.model.objects.filter(year=year, month=month).update(post_count=F('post_count') - 1)
+        self.model.objects.filter(year=year, month=month, post_count__lte=0).delete()
+
+    def build(self):
+        rows = (
+            BlogPost.objects.filter(is_published=True)
+            .order_by()
+            .values(year=ExtractYear('date'), month=ExtractMonth('date'))
+            .annotate(post_count=Count('id'))
+        )
+        return [self.model(**row) for row in rows]
+
+    def rows(self, objects):
+        return sorted((obj.year, obj.month, obj.post_count) for obj in objects)
+
+
+ROLLUPS = [
+    CategoryRollup(),
+    ArchiveRollup(),
+]
+
+
+def record_change(old, new):
+    """
+    Apply one post's change to every rollup. ``old``/``new`` are tracked
+    states from get_state(), or None for a created/deleted post.
+    """
+    before = old if old and old['is_published'] else None
+    after = new if new and new['is_published'] else None
+    if before == after:
+        return
+    with transaction.atomic():
+        for rollup in ROLLUPS:
+            if before:
+                rollup.remove(before)
+            if after:
+                rollup.add(after)
+
+
+def recompute():
+    """Rebuild every rollup from the live table"""
+    with transaction.atomic():
+        for rollup in ROLLUPS:
+            rollup.model.objects.all().delete()
+            rollup.model.objects.bulk_create(rollup.build())
+
+
+def check():
+    """Return the names of rollups whose stored rows differ from the live aggregate"""
+    return [
+        rollup.model.__name__
+        for rollup in ROLLUPS
+        if rollup.rows(rollup.model.objects.all()) != rollup.rows(rollup.build())
+    ]
@@ -0,0 +1,123 @@
+"""
+Full-text search over blog posts backed by an SQLite FTS5 table.
+
+``blog_blogpost_fts`` holds the tag-stripped title, excerpt and content of
+every post with ``rowid`` equal to the post's primary key. It is kept in
+sync by the BlogPost save/delete signals and can be rebuilt with the
+``rebuild_search_index`` management command.
+"""
+import re
+
+from django.db import connection
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape
+
+from .content import html_to_text
+from .models import BlogPost
+
+FTS_TABLE = 'blog_blogpost_fts'
+
+# Column weights for bm25(): title, excerpt, content
+RANK_WEIGHTS = (10.0, 4.0, 1.0)
+
+# Control characters used as snippet markers so the text can be escaped
+# before the <mark> tags are inserted
+_MARK_START = '\x02'
+_MARK_END = '\x03'
+
+
+def build_match_query(text):
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+
+    Every word is quoted so FTS5 operators in user input are ignored, and
+    the last word is a prefix match so partially typed queries still hit.
+    Returns an empty string when the text contains no searchable words.
+    """
+    words = re.findall(r'\w+', text or '')
+    if not words:
+        return ''
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def is_available():
+    """The FTS5 table is only created on SQLite (migration 0004)"""
+    return connection.vendor == 'sqlite'
+
+
+def index_post(post):
+    """Insert or replace the index row for one post"""
+    if not is_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [post.pk])
+        cursor.execute(
+            f'INSERT INTO {FTS_TABLE} (rowid, title, excerpt, content) VALUES (%s, %s, %s, %s)',
+            [post.pk, post.title, html_to_text(post.excerpt), html_to_text(post.content)],
+        )
+
+
+def remove_post(pk):
+    if not is_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [pk])
+
+
+def rebuild_index(chunk_size=500):
+    """Re-index every post. Returns the number of posts indexed."""
+    count = 0
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE}')
+        rows = BlogPost.objects.values_list('pk', 'title', 'excerpt', 'content').iterator(chunk_size=chunk_size)
+        batch = []
+        for pk, title, excerpt, content in rows:
+            batch.append((pk, title, html_to_text(excerpt), html_to_text(content)))
+            if len(batch) >= chunk_size:
+                cursor.executemany(f'INSERT INTO {FTS_TABLE} (rowid, title, excerpt, content) VALUES (%s, %s, %s, %s)', batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            cursor.executemany(f'INSERT INTO {FTS_TABLE} (rowid, title, excerpt, content) VALUES (%s, %s, %s, %s)', batch)
+            count += len(batch)
+    return count
+
+
+def search(text, limit=20):
+    """
+    Return published posts matching ``text``, best match first.
+
+    Each post carries ``rank`` (bm25 score, lower is better) and ``snippet``
+    (escaped HTML with matches wrapped in <mark> tags). The content column
+    is not loaded.
+    """
+    match = build_match_query(text)
+    if not match:
+        return []
+
+    weights = ', '.join(str(weight) for weight in RANK_WEIGHTS)
+    posts = BlogPost.objects.raw(
+        f'''
+        SELECT p.id, p.title, p.excerpt, p.author, p.date, p.read_time, p.word_count,
+               p.read_minutes, p.category, p.image, p.featured, p.slug,
+               bm25({FTS_TABLE}, {weights}) AS rank,
+               snippet({FTS_TABLE}, -1, %s, %s, '…', 24) AS snippet
+        FROM {FTS_TABLE}
+        JOIN blog_blogpost p ON p.id = {FTS_TABLE}.rowid
+        WHERE {FTS_TABLE} MATCH %s AND p.is_published
+        ORDER BY rank
+        LIMIT %s
+        ''',
+        [_MARK_START, _MARK_END, match, limit],
+    )
+    results = list(posts)
+    for post in results:
+        post.snippet = escape(post.snippet).replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>')
+    return results
+
+
+def matching_ids(text):
+    """Subquery of post ids matching ``text``, for filtering querysets"""
+    return RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [build_match_query(text)])
@@ -1,17 +1,57 @@
 from rest_framework import serializers
-from .models import BlogPost
+from core.fast import FastListSerializer
+from core.serializers import DynamicFieldsModelSerializer
+from .models import BlogPost, BlogArchiveStat, BlogCategoryStat
 
 
-class BlogPostSerializer(serializers.ModelSerializer):
+class BlogPostSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = BlogPost
         fields = ['id', 'title', 'excerpt', 'content', 'author', 'date', 'read_time', 
-                  'category', 'image', 'featured', 'slug', 'is_published', 'created_at', 'updated_at']
+                  'word_count', 'read_minutes', 'category', 'image', 'featured', 'slug', 'is_published', 'created_at', 'updated_at']
+        list_serializer_class = FastListSerializer
+    
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Previous / next links annotated by blog.navigation (?nav=1)
+        if hasattr(instance, 'nav_prev'):
+            data['prev'] = instance.nav_prev
+            data['next'] = instance.nav_next
+        return data
 
 
-class BlogPostListSerializer(serializers.ModelSerializer):
+class BlogPostListSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = BlogPost
         fields = ['id', 'title', 'excerpt', 'author', 'date', 'read_time', 
-                  'category', 'image', 'featured', 'slug']
+                  'word_count', 'read_minutes', 'category', 'image', 'featured', 'slug']
+        list_serializer_class = FastListSerializer
 
+
+class BlogPostSearchSerializer(BlogPostListSerializer):
+    rank = serializers.FloatField(read_only=True)
+    snippet = serializers.CharField(read_only=True)
+    
+    class Meta(BlogPostListSerializer.Meta):
+        fields = BlogPostListSerializer.Meta.fields + ['rank', 'snippet']
+
+
+class BlogPostPopularSerializer(BlogPostListSerializer):
+    view_count = serializers.IntegerField(read_only=True)
+    
+    class Meta(BlogPostListSerializer.Meta):
+        fields = BlogPostListSerializer.Meta.fields + ['view_count']
+
+
+class BlogCategoryStatSerializer(DynamicFieldsModelSerializer):
+    class Meta:
+        model = BlogCategoryStat
+        fields = ['category', 'post_count', 'latest_date']
+        list_serializer_class = FastListSerializer
+
+
+class BlogArchiveStatSerializer(DynamicFieldsModelSerializer):
+    class Meta:
+        model = BlogArchiveStat
+        fields = ['year', 'month', 'post_count']
+        list_serializer_class = FastListSerializer
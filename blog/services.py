@@ -6,6 +6,7 @@ from groq import Groq
 from django.conf import settings
 from datetime import datetime
 import re
+from .content import count_words, format_read_time, read_minutes
 
 # Try to load dotenv if available
 try:
@@ -18,6 +19,8 @@ except ImportError:
 class GroqAIService:
     """Service for interacting with Groq AI to generate blog content"""
     
+    CATEGORIES = ['React', 'Django', 'AWS', 'DevOps', 'Frontend', 'Backend', 'Mobile', 'Cloud', 'JavaScript', 'Python']
+    
     def __init__(self):
         self.api_key = getattr(settings, 'GROQ_API_KEY', os.getenv('GROQ_API_KEY'))
         if not self.api_key:
@@ -26,6 +29,11 @@ class GroqAIService:
         self.client = Groq(api_key=self.api_key)
         self.model = getattr(settings, 'GROQ_MODEL', 'llama-3.3-70b-versatile')
     
+    @classmethod
+    def category_for_date(cls, date, offset=0):
+        """Default category for a post dated ``date``; ``offset`` varies it between posts of one day"""
+        return cls.CATEGORIES[(date.weekday() + offset) % len(cls.CATEGORIES)]
+    
     def generate_blog_post(self, topic=None, category=None):
         """
         Generate a blog post using Groq AI
@@ -37,13 +45,9 @@ class GroqAIService:
         Returns:
             dict with title, excerpt, content, category, read_time
         """
-        # Define categories and topics
-        categories = ['React', 'Django', 'AWS', 'DevOps', 'Frontend', 'Backend', 'Mobile', 'Cloud', 'JavaScript', 'Python']
-        
         if not category:
             # Select a category based on day of week for variety
-            day_of_week = datetime.now().weekday()
-            category = categories[day_of_week % len(categories)]
+            category = self.category_for_date(datetime.now().date())
         
         if not topic:
             # Generate topic based on category
@@ -197,10 +201,8 @@ class GroqAIService:
                 cleaned_content = cleaned_content.replace(excerpt_match.group(0), '', 1)
             blog_content = cleaned_content.strip() if cleaned_content.strip() else content
         
-        # Calculate read time (average reading speed: 150 words per minute for technical content)
-        word_count = len(blog_content.split())
-        read_time_minutes = max(1, round(word_count / 150))  # Slower for detailed technical content
-        read_time = f"{read_time_minutes} min read"
+        # Calculate read time from the visible text (BlogPost.save() recomputes it the same way)
+        read_time = format_read_time(read_minutes(count_words(blog_content)))
         
         return {
             'title': title[:300],  # Ensure it fits in model field
@@ -0,0 +1,88 @@
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from core import versioning
+
+from . import compression, featured, related, rollups, search, slugs, snapshots
+from .models import BlogPost
+
+
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+def rebuild_snapshots(sender, instance, using, **kwargs):
+    snapshots.schedule_rebuild(using=using)
+
+
+@receiver(versioning.bulk_write, sender=BlogPost)
+def rebuild_snapshots_on_bulk_write(sender, using, **kwargs):
+    # update() and friends send no per-row signals
+    snapshots.schedule_rebuild(using=using)
+
+
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+def forget_slug(sender, instance, **kwargs):
+    slugs.forget(instance.pk)
+
+
+@receiver(post_save, sender=BlogPost)
+def update_featured_on_save(sender, instance, **kwargs):
+    featured.post_changed(instance)
+
+
+@receiver(post_delete, sender=BlogPost)
+def update_featured_on_delete(sender, instance, **kwargs):
+    featured.post_changed(instance, deleted=True)
+
+
+@receiver(post_save, sender=BlogPost)
+def index_post(sender, instance, **kwargs):
+    search.index_post(instance)
+
+
+@receiver(post_delete, sender=BlogPost)
+def unindex_post(sender, instance, **kwargs):
+    search.remove_post(instance.pk)
+
+
+@receiver(post_save, sender=BlogPost)
+def compress_post(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None:
+        # Only some columns were written; render what is actually stored
+        instance = BlogPost.objects.get(pk=instance.pk)
+    compression.compress_post(instance)
+
+
+@receiver(post_save, sender=BlogPost)
+def update_rollups_on_save(sender, instance, created, **kwargs):
+    old = None if created else rollups.get_previous_state(instance)
+    if not created and old is None:
+        # Previous values unknown, so no delta can be computed
+        rollups.recompute()
+    else:
+        rollups.record_change(old, rollups.get_state(instance))
+    instance._loaded_values = {**getattr(instance, '_loaded_values', {}), **rollups.get_state(instance)}
+
+
+@receiver(post_delete, sender=BlogPost)
+def update_rollups_on_delete(sender, instance, **kwargs):
+    old = rollups.get_previous_state(instance) or rollups.get_state(instance)
+    rollups.record_change(old, None)
+
+
+@receiver(post_save, sender=BlogPost)
+def update_related(sender, instance, using, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(related.SOURCE_FIELDS):
+        return
+    related.schedule_update(instance.pk, using=using)
+
+
+@receiver(pre_delete, sender=BlogPost)
+def collect_related(sender, instance, **kwargs):
+    # The RelatedPost rows pointing at this post are gone by post_delete
+    instance._related_from = related.affected_by(instance.pk)
+
+
+@receiver(post_delete, sender=BlogPost)
+def refresh_related(sender, instance, using, **kwargs):
+    related.schedule_update(stale=getattr(instance, '_related_from', []), using=using)
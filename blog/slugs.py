@@ -0,0 +1,63 @@
+"""
+Process-local slug -> primary key map for blog post lookups.
+
+Slug URLs are resolved with a single query: a cached slug is fetched by
+primary key (guarded by the slug so stale entries from other workers can
+never return the wrong post), and an unknown slug is fetched through the
+unique slug index and remembered. Entries are dropped when a post is saved
+or deleted in this process.
+"""
+import threading
+
+_lock = threading.Lock()
+_slug_to_pk = {}
+_pk_to_slug = {}
+
+
+def is_pk(lookup):
+    """
+    True if a URL lookup is a numeric id. ``str.isdigit()`` alone also
+    accepts Unicode digits such as ``²``, which int() rejects.
+    """
+    return lookup.isascii() and lookup.isdigit()
+
+
+def get_pk(slug):
+    return _slug_to_pk.get(slug)
+
+
+def remember(slug, pk):
+    with _lock:
+        old_slug = _pk_to_slug.pop(pk, None)
+        if old_slug is not None:
+            _slug_to_pk.pop(old_slug, None)
+        _slug_to_pk[slug] = pk
+        _pk_to_slug[pk] = slug
+
+
+def forget(pk):
+    with _lock:
+        slug = _pk_to_slug.pop(pk, None)
+        if slug is not None:
+            _slug_to_pk.pop(slug, None)
+
+
+def clear():
+    with _lock:
+        _slug_to_pk.clear()
+        _pk_to_slug.clear()
+
+
+def resolve(queryset, slug):
+    """Return the post in ``queryset`` with this slug, or None"""
+    pk = _slug_to_pk.get(slug)
+    if pk is not None:
+        post = queryset.filter(pk=pk, slug=slug).first()
+        if post is not None:
+            return post
+        forget(pk)
+
+    post = queryset.filter(slug=slug).first()
+    if post is not None:
+        remember(slug, post.pk)
+    return post
@@ -0,0 +1,95 @@
+"""
+Pre-encoded snapshots of blog list payloads.
+
+The published list only changes when a BlogPost is saved or deleted, so the
+JSON bytes are rendered once at write time and stored in BlogSnapshot.
+Read requests then serve the stored bytes without touching the serializers.
+"""
+import threading
+from contextlib import contextmanager
+
+from django.db import transaction
+from core.renderers import ORJSONRenderer
+
+from .models import BlogPost, BlogSnapshot
+from .serializers import BlogPostListSerializer
+
+PUBLISHED_LIST = 'published-list'
+
+_state = threading.local()
+
+
+def build_published_list():
+    """Render the published list exactly as BlogPostViewSet.list would."""
+    posts = BlogPost.objects.filter(is_published=True)
+    data = BlogPostListSerializer(posts, many=True).data
+    return ORJSONRenderer().render(data)
+
+
+BUILDERS = {
+    PUBLISHED_LIST: build_published_list,
+}
+
+
+def rebuild(key=None):
+    """Rebuild one snapshot, or all of them when key is None"""
+    keys = [key] if key else list(BUILDERS)
+    for snapshot_key in keys:
+        BlogSnapshot.objects.update_or_create(
+            key=snapshot_key,
+            defaults={'payload': BUILDERS[snapshot_key]()},
+        )
+
+
+def get_payload(key):
+    """
+    Return the stored bytes for a snapshot, building it on first use.
+    """
+    payload = BlogSnapshot.objects.filter(key=key).values_list('payload', flat=True).first()
+    if payload is None:
+        rebuild(key)
+        payload = BlogSnapshot.objects.filter(key=key).values_list('payload', flat=True).first()
+    return bytes(payload)
+
+
+def check(key):
+    """Return True if the stored snapshot matches the live query"""
+    stored = BlogSnapshot.objects.filter(key=key).values_list('payload', flat=True).first()
+    return stored is not None and bytes(stored) == BUILDERS[key]()
+
+
+def _rebuild_all():
+    rebuild()
+
+
+def schedule_rebuild(using=None):
+    """
+    Rebuild all snapshots once the current transaction commits.
+
+    Several writes inside one atomic block share a single rebuild, and
+    writes inside a ``deferred()`` block are collapsed into one rebuild
+    when the block exits.
+    """
+    if getattr(_state, 'depth', 0):
+        _state.dirty = True
+        return
+    connection = transaction.get_connection(using)
+    if any(func is _rebuild_all for _, func, _ in connection.run_on_commit):
+        return
+    transaction.on_commit(_rebuild_all, using=using)
+
+
+@contextmanager
+def deferred():
+    """
+    Suspend per-write rebuilds for bulk operations such as management
+    commands, and rebuild once at the end if anything changed.
+    """
+    _state.depth = getattr(_state, 'depth', 0) + 1
+    try:
+        yield
+    finally:
+        _state.depth -= 1
+        if _state.depth == 0 and getattr(_state, 'dirty', False):
+            _state.dirty = False
+            schedule_rebuild()
@@ -1,3 +1,1145 @@
-from django.test import TestCase
+import gzip
+import json
+import re
+import shutil
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+from xml.dom import minidom
 
-# Create your tests here.
+from django.contrib import admin
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, Max
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import feedgenerator, timezone
+
+from core.models import ContentVersion
+from core.renderers import ORJSONRenderer
+
+from . import compression, featured, feeds, related, rollups, search, slugs, snapshots, viewcounts
+from .admin import BlogPostAdmin
+from .models import (
+    BlogCategoryStat, BlogPopularPost, BlogPost, BlogPostEncoding, BlogPostViewCount, BlogSnapshot, RelatedPost,
+)
+from .serializers import BlogPostListSerializer, BlogPostSerializer
+from .services import GroqAIService
+
+
+def create_post(**kwargs):
+    """Create a published post with sensible defaults"""
+    index = BlogPost.objects.count()
+    defaults = {
+        'title': f'Post {index}',
+        'excerpt': f'Excerpt {index}',
+        'content': f'<h2>Intro</h2><p>Body of post {index}</p>',
+        'date': date(2026, 1, 1) + timedelta(days=index),
+        'category': 'Django',
+        'slug': f'post-{index}',
+    }
+    defaults.update(kwargs)
+    return BlogPost.objects.create(**defaults)
+
+
+class BlogPostQueryPlanTests(TestCase):
+    """
+    Every BlogPost query issued by the public views must be served by an
+    index: no full table scan and no temp B-tree sort for the ordering.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(30):
+            create_post(featured=(i == 29), is_published=(i % 10 != 0))
+        # Related lists are updated on commit, which never happens in a TestCase
+        related.rebuild()
+
+    def explain(self, sql, params=()):
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def assertIndexed(self, sql, params=()):
+        plan = self.explain(sql, params)
+        for detail in plan:
+            self.assertIsNone(
+                re.fullmatch(r'SCAN blog_blogpost', detail),
+                f'Full table scan in plan {plan} for {sql}',
+            )
+            self.assertNotIn('TEMP B-TREE', detail, f'Temp B-tree sort in plan {plan} for {sql}')
+
+    def assertViewQueriesIndexed(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_ACCEPT='application/json')
+        self.assertEqual(response.status_code, 200, url)
+        blog_queries = [
+            query['sql'] for query in queries
+            if query['sql'].startswith('SELECT') and '"blog_blogpost"' in query['sql']
+        ]
+        self.assertTrue(blog_queries, f'No BlogPost queries captured for {url}')
+        for sql in blog_queries:
+            self.assertIndexed(sql)
+        return response
+
+    def test_list_views(self):
+        self.assertViewQueriesIndexed('/api/blog/posts/')
+        response = self.assertViewQueriesIndexed('/api/blog/posts/?page_size=5')
+        self.assertViewQueriesIndexed(response.json()['next'])
+        self.assertViewQueriesIndexed('/api/blog/posts/?ordering=read_minutes')
+        self.assertViewQueriesIndexed('/api/blog/posts/?ordering=-read_minutes&max_read_minutes=3')
+
+    def test_featured_and_recent(self):
+        self.assertViewQueriesIndexed('/api/blog/posts/featured/')
+        self.assertViewQueriesIndexed('/api/blog/posts/recent/')
+
+    def test_categories(self):
+        self.assertViewQueriesIndexed('/api/blog/posts/categories/')
+        with CaptureQueriesContext(connection) as queries:
+            BlogPost.objects.filter(is_published=True, category='Django').aggregate(Max('date'))
+        self.assertIndexed(queries[0]['sql'])
+
+    def test_archive_month(self):
+        post = BlogPost.objects.filter(is_published=True).first()
+        self.assertViewQueriesIndexed(f'/api/blog/archive/{post.date:%Y/%m}/')
+
+    def test_popular(self):
+        posts = BlogPost.objects.filter(is_published=True)[:5]
+        BlogPopularPost.objects.bulk_create([
+            BlogPopularPost(post=post, rank=rank, view_count=10 - rank) for rank, post in enumerate(posts, 1)
+        ])
+        response = self.assertViewQueriesIndexed('/api/blog/posts/popular/')
+        self.assertEqual(len(response.json()), 5)
+
+    def test_detail_views(self):
+        post = BlogPost.objects.filter(is_published=True).first()
+        self.assertViewQueriesIndexed(f'/api/blog/posts/{post.pk}/')
+        self.assertViewQueriesIndexed(f'/api/blog/posts/{post.slug}/')
+        self.assertViewQueriesIndexed(f'/api/blog/posts/by-slug/{post.slug}/')
+        self.assertViewQueriesIndexed(f'/api/blog/posts/{post.pk}/?nav=1')
+
+    def test_related_view(self):
+        post = BlogPost.objects.filter(is_published=True).first()
+        response = self.assertViewQueriesIndexed(f'/api/blog/posts/{post.pk}/related/')
+        self.assertTrue(response.json())
+
+    def test_feeds_and_sitemap(self):
+        for url in ('/api/blog/feed.xml', '/api/blog/atom.xml', '/sitemap.xml'):
+            cache.clear()
+            self.assertViewQueriesIndexed(url)
+
+    def test_daily_generation_lookup(self):
+        sql, params = BlogPost.objects.filter(date=timezone.now().date())[:1].query.sql_with_params()
+        self.assertIndexed(sql, params)
+
+
+class BlogPostStreamingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(5):
+            create_post()
+
+    def test_streamed_list_matches_buffered(self):
+        buffered = self.client.get('/api/blog/posts/?stream=0', HTTP_ACCEPT='application/json')
+        streamed = self.client.get('/api/blog/posts/?stream=1', HTTP_ACCEPT='application/json')
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(b''.join(streamed.streaming_content), buffered.content)
+
+    def test_paginated_request_is_not_streamed(self):
+        response = self.client.get('/api/blog/posts/?stream=1&page_size=2', HTTP_ACCEPT='application/json')
+        self.assertFalse(response.streaming)
+        self.assertEqual(len(response.json()['results']), 2)
+
+
+class BlogPostLookupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.post = create_post()
+
+    def test_non_ascii_digits_are_not_ids(self):
+        response = self.client.get('/api/blog/posts/%C2%B2/?fields=title', HTTP_ACCEPT='application/json')
+        self.assertEqual(response.status_code, 404)
+        for url in ('/api/blog/posts/%C2%B2/', '/api/blog/posts/%C2%B2/content/', '/api/blog/posts/%C2%B2/related/'):
+            self.assertEqual(self.client.get(url, HTTP_ACCEPT='application/json').status_code, 404, url)
+        response = self.client.get(f'/api/blog/posts/{self.post.pk}/?fields=title', HTTP_ACCEPT='application/json')
+        self.assertEqual(response.json(), {'title': self.post.title})
+
+
+class BlogSlugMapTests(TestCase):
+    def setUp(self):
+        slugs.clear()
+        self.post = create_post(slug='first-slug')
+
+    def test_lookup_is_one_query(self):
+        queryset = BlogPost.objects.filter(is_published=True)
+        with self.assertNumQueries(1):
+            self.assertEqual(slugs.resolve(queryset, 'first-slug'), self.post)
+        self.assertEqual(slugs.get_pk('first-slug'), self.post.pk)
+        # Remembered: fetched by primary key, still one query
+        with self.assertNumQueries(1):
+            self.assertEqual(slugs.resolve(queryset, 'first-slug'), self.post)
+        with self.assertNumQueries(1):
+            self.assertIsNone(slugs.resolve(queryset, 'unknown'))
+
+    def test_slug_change_forgets_entry(self):
+        slugs.resolve(BlogPost.objects.all(), 'first-slug')
+        self.post.slug = 'second-slug'
+        self.post.save()
+        self.assertIsNone(slugs.get_pk('first-slug'))
+        self.assertIsNone(slugs.resolve(BlogPost.objects.all(), 'first-slug'))
+        self.assertEqual(slugs.resolve(BlogPost.objects.all(), 'second-slug'), self.post)
+        response = self.client.get('/api/blog/posts/by-slug/first-slug/', HTTP_ACCEPT='application/json')
+        self.assertEqual(response.status_code, 404)
+
+    def test_delete_forgets_entry(self):
+        slugs.resolve(BlogPost.objects.all(), 'first-slug')
+        self.post.delete()
+        self.assertIsNone(slugs.get_pk('first-slug'))
+        self.assertIsNone(slugs.resolve(BlogPost.objects.all(), 'first-slug'))
+
+    def test_stale_entry_from_another_process(self):
+        # An entry another worker's write could not invalidate is guarded by the slug
+        slugs.remember('first-slug', self.post.pk)
+        BlogPost.objects.filter(pk=self.post.pk).update(slug='renamed-elsewhere')
+        self.assertIsNone(slugs.resolve(BlogPost.objects.all(), 'first-slug'))
+        self.assertIsNone(slugs.get_pk('first-slug'))
+
+
+class BlogPostCursorPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Three posts per day, so most page boundaries fall inside a run of equal dates
+        for i in range(9):
+            create_post(date=date(2026, 1, 1 + i // 3))
+        create_post(is_published=False)
+
+    def get(self, url, **params):
+        response = self.client.get(url, params, HTTP_ACCEPT='application/json')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def expected(self):
+        return list(BlogPost.objects.filter(is_published=True).order_by('-date', '-created_at').values_list('slug', flat=True))
+
+    def test_without_parameters_the_list_is_unpaginated(self):
+        self.assertEqual([post['slug'] for post in self.get('/api/blog/posts/')], self.expected())
+
+    def test_next_cursors_walk_every_post_once(self):
+        page = self.get('/api/blog/posts/', page_size=2)
+        self.assertIsNone(page['previous'])
+        slugs_seen = []
+        pages = [page]
+        while True:
+            slugs_seen += [post['slug'] for post in page['results']]
+            if not page['next']:
+                break
+            page = self.get(page['next'])
+            pages.append(page)
+        self.assertEqual(slugs_seen, self.expected())
+        self.assertEqual(len(pages), 5)
+
+        # Walking back with the previous cursors gives the same pages
+        for earlier in reversed(pages[:-1]):
+            page = self.get(page['previous'])
+            self.assertEqual(page['results'], earlier['results'])
+        self.assertIsNone(page['previous'])
+
+    def test_tied_dates_are_ordered_by_creation(self):
+        tied = list(BlogPost.objects.filter(date=date(2026, 1, 2)).order_by('-created_at').values_list('slug', flat=True))
+        first = self.get('/api/blog/posts/', page_size=4)
+        second = self.get(first['next'])
+        self.assertEqual([post['slug'] for post in first['results']][3:] + [post['slug'] for post in second['results']][:2], tied)
+
+    def test_page_size_is_capped(self):
+        self.assertEqual(len(self.get('/api/blog/posts/', page_size=1000)['results']), 9)
+
+    def test_invalid_cursor_is_rejected(self):
+        # Not base64, a bad offset, and a position that is not a date|created_at pair
+        for cursor in ('garbage', 'bz14', 'cD0yMDI2', 'cD0yMDI2LTAxLTAy'):
+            with self.subTest(cursor=cursor):
+                response = self.client.get('/api/blog/posts/', {'cursor': cursor}, HTTP_ACCEPT='application/json')
+                self.assertEqual(response.status_code, 404)
+
+
+class BlogPostSparseFieldsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.post = create_post(content='<p>Body</p>')
+
+    def test_fields_prune_response_and_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'/api/blog/posts/{self.post.pk}/?fields=slug,title', HTTP_ACCEPT='application/json')
+        self.assertEqual(response.json(), {'title': self.post.title, 'slug': self.post.slug})
+        selects = [query['sql'] for query in queries if query['sql'].startswith('SELECT "blog_blogpost"."id"')]
+        self.assertTrue(selects)
+        self.assertNotIn('"content"', selects[-1])
+
+    def test_omit(self):
+        response = self.client.get('/api/blog/posts/?omit=excerpt,image', HTTP_ACCEPT='application/json')
+        self.assertNotIn('excerpt', response.json()[0])
+        self.assertIn('slug', response.json()[0])
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get('/api/blog/posts/?fields=nope', HTTP_ACCEPT='application/json')
+        self.assertEqual(response.status_code, 400)
+
+
+class BlogSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.in_title = create_post(title='Caching with Redis', content='<p>Nothing to see here</p>')
+        cls.in_content = create_post(title='Deploying', content='<p>We moved the session store to <b>Redis</b> & co</p>')
+        cls.draft = create_post(title='Redis draft', is_published=False)
+
+    def search(self, query):
+        return self.client.get('/api/blog/posts/search/', {'q': query}, HTTP_ACCEPT='application/json')
+
+    def test_title_match_ranks_first_with_snippet(self):
+        results = self.search('redis').json()
+        self.assertEqual([post['slug'] for post in results], [self.in_title.slug, self.in_content.slug])
+        self.assertLess(results[0]['rank'], results[1]['rank'])
+        self.assertEqual(results[1]['snippet'], 'We moved the session store to <mark>Redis</mark> &amp; co')
+        self.assertNotIn('content', results[0])
+
+    def test_prefix_match(self):
+        self.assertEqual([post.pk for post in search.search('redi')], [self.in_title.pk, self.in_content.pk])
+
+    def test_unpublished_posts_are_excluded(self):
+        self.assertNotIn(self.draft.slug, [post['slug'] for post in self.search('draft').json()])
+
+    def test_index_follows_save_and_delete(self):
+        post = create_post(title='Kubernetes notes')
+        self.assertEqual([result.pk for result in search.search('kubernetes')], [post.pk])
+        post.title = 'Nomad notes'
+        post.save()
+        self.assertEqual(search.search('kubernetes'), [])
+        self.assertEqual([result.pk for result in search.search('nomad')], [post.pk])
+        post.delete()
+        self.assertEqual(search.search('nomad'), [])
+
+    def test_operators_in_query_are_ignored(self):
+        for query in ('"', '*', 'NEAR', 'redis OR', 'NEAR(redis', '-redis', 'title:redis'):
+            with self.subTest(query=query):
+                response = self.search(query)
+                self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.search('"').json(), [])
+        # Quotes and wildcards are dropped, leaving an ordinary term query
+        self.assertEqual(len(self.search('"redis*').json()), 2)
+
+    def test_empty_query_is_rejected(self):
+        self.assertEqual(self.search('').status_code, 400)
+        self.assertEqual(self.search('   ').status_code, 400)
+
+    def test_admin_search_uses_index(self):
+        model_admin = BlogPostAdmin(BlogPost, admin.site)
+        request = RequestFactory().get('/admin/blog/blogpost/')
+        queryset, may_have_duplicates = model_admin.get_search_results(request, BlogPost.objects.all(), 'redis')
+        self.assertFalse(may_have_duplicates)
+        self.assertEqual({post.pk for post in queryset}, {self.in_title.pk, self.in_content.pk, self.draft.pk})
+        queryset, _ = model_admin.get_search_results(request, BlogPost.objects.all(), '*')
+        self.assertEqual(queryset.count(), BlogPost.objects.count())
+
+
+class BlogPostSectionsTests(TestCase):
+    CONTENT = (
+        '<p>Café intro – “quoted”</p>'
+        '<h2>Ünïcode heading</h2><p>Naïve text 日本語</p>'
+        '<h3 class="sub">Détails</h3><p>More</p>'
+        '<h2>Ünïcode heading</h2><p>Émoji 🚀 end</p>'
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.post = create_post(content=cls.CONTENT)
+
+    def get(self, path, **params):
+        return self.client.get(f'/api/blog/posts/{self.post.pk}/{path}', params, HTTP_ACCEPT='application/json')
+
+    def test_toc_from_headings(self):
+        self.assertEqual(
+            [(entry['index'], entry['anchor'], entry['level'], entry['title']) for entry in self.post.toc],
+            [
+                (0, 'section-0', 0, ''),
+                (1, 'unicode-heading', 2, 'Ünïcode heading'),
+                (2, 'details', 3, 'Détails'),
+                (3, 'unicode-heading-2', 2, 'Ünïcode heading'),
+            ],
+        )
+
+    def test_byte_offsets_slice_non_ascii_content(self):
+        encoded = self.CONTENT.encode('utf-8')
+        html = [encoded[entry['start']:entry['end']].decode('utf-8') for entry in self.post.toc]
+        self.assertEqual(''.join(html), self.CONTENT)
+        self.assertEqual(html[3], '<h2>Ünïcode heading</h2><p>Émoji 🚀 end</p>')
+        for entry in self.post.toc:
+            with self.subTest(index=entry['index']):
+                self.assertEqual(self.get(f'sections/{entry["index"]}/').json()['html'], html[entry['index']])
+
+    def test_sections(self):
+        data = self.get('sections/', count=3).json()
+        self.assertEqual(len(data['toc']), 4)
+        self.assertNotIn('start', data['toc'][0])
+        self.assertEqual(''.join(section['html'] for section in data['sections']), self.CONTENT.rsplit('<h2>', 1)[0])
+        self.assertEqual(len(self.get('sections/', count=99).json()['sections']), 4)
+
+    def test_invalid_index_or_count(self):
+        self.assertEqual(self.get('sections/4/').status_code, 404)
+        self.assertEqual(self.get('sections/abc/').status_code, 404)
+        self.assertEqual(self.get('sections/-1/').status_code, 404)
+        self.assertEqual(self.get('sections/', count='two').status_code, 400)
+
+    def test_toc_follows_content(self):
+        self.post.content = '<h2>Only</h2><p>One</p>'
+        self.post.save()
+        self.assertEqual([entry['anchor'] for entry in self.get('sections/').json()['toc']], ['only'])
+
+
+class BlogPostCompressionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.post = create_post(content='<p>' + 'Compressible text. ' * 200 + '</p>')
+
+    def get(self, accept_encoding=None, path=''):
+        headers = {'HTTP_ACCEPT': 'application/json'}
+        if accept_encoding is not None:
+            headers['HTTP_ACCEPT_ENCODING'] = accept_encoding
+        return self.client.get(f'/api/blog/posts/{self.post.pk}/{path}', **headers)
+
+    def stored(self, post, kind='detail', encoding='identity'):
+        return bytes(BlogPostEncoding.objects.get(post=post, kind=kind, encoding=encoding).payload)
+
+    def live(self, post):
+        return ORJSONRenderer().render(BlogPostSerializer(BlogPost.objects.get(pk=post.pk)).data)
+
+    def test_parse_accept_encoding(self):
+        self.assertEqual(
+            compression.parse_accept_encoding('gzip, br;q=0.5, identity; q=0, *;q=bad'),
+            {'gzip': 1.0, 'br': 0.5, 'identity': 0.0, '*': 0.0},
+        )
+        self.assertEqual(compression.parse_accept_encoding(None), {})
+
+    def test_choose_encoding(self):
+        available = ['gzip', 'br']
+        cases = {
+            None: 'identity',
+            '': 'identity',
+            'gzip': 'gzip',
+            'gzip, br': 'br',
+            'gzip, deflate, br;q=0.9': 'gzip',
+            'br;q=0, gzip;q=0': 'identity',
+            'identity, gzip;q=0.5': 'identity',
+            '*': 'br',
+            '*;q=0.5, br;q=0': 'gzip',
+            'deflate': 'identity',
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                self.assertEqual(compression.choose_encoding(header, available), expected)
+        self.assertEqual(compression.choose_encoding('gzip, br', ['gzip']), 'gzip')
+
+    def test_negotiated_responses(self):
+        detail = self.stored(self.post)
+        response = self.get('gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(response.content), detail)
+
+        response = self.get('gzip;q=0')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(response.content, detail)
+
+        response = self.get('gzip', path='content/')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content).decode('utf-8'), self.post.content)
+
+        if compression.brotli is not None:
+            response = self.get('gzip, br')
+            self.assertEqual(response['Content-Encoding'], 'br')
+            self.assertEqual(compression.brotli.decompress(response.content), detail)
+
+    def test_conditional_get_per_encoding(self):
+        etag = self.get('gzip')['ETag']
+        self.assertNotEqual(etag, self.get('identity')['ETag'])
+        response = self.client.get(
+            f'/api/blog/posts/{self.post.pk}/', HTTP_ACCEPT='application/json',
+            HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_stored_detail_matches_serializer(self):
+        self.assertEqual(self.stored(self.post), self.live(self.post))
+        self.assertEqual(self.get().content, self.live(self.post))
+
+        post = BlogPost.objects.get(pk=self.post.pk)
+        post.title = 'Renamed'
+        post.save()
+        self.assertEqual(self.stored(post), self.live(post))
+
+        post.excerpt = 'Partial update'
+        post.save(update_fields=['excerpt'])
+        self.assertEqual(self.stored(post), self.live(post))
+
+        # Unsaved changes to other fields are not stored
+        post.title = 'Not saved'
+        post.save(update_fields=['excerpt'])
+        self.assertEqual(self.stored(post), self.live(post))
+
+        post.content = '<h2>New</h2><p>Shorter</p>'
+        post.save(update_fields=['content'])
+        self.assertEqual(self.stored(post), self.live(post))
+        self.assertEqual(gzip.decompress(self.stored(post, 'content', 'gzip')).decode('utf-8'), post.content)
+
+
+class BlogRelatedPostTests(TransactionTestCase):
+    # Real commits, so the on_commit updates run as they would in production
+
+    def setUp(self):
+        cache.clear()
+        # No shared default excerpt, so only the terms below relate posts
+        self.orm = create_post(excerpt='', title='Django ORM query optimization', content='<p>Django ORM queries with select_related and prefetch_related</p>')
+        self.tips = create_post(excerpt='', title='Django ORM tips', content='<p>More Django ORM queries, prefetch_related everywhere</p>')
+        self.views = create_post(excerpt='', title='Django class based views', content='<p>Views and mixins in Django</p>')
+        self.k8s = create_post(excerpt='', title='Kubernetes autoscaling', content='<p>Pods, nodes and cluster autoscaler</p>')
+        self.draft = create_post(excerpt='', title='Django ORM internals', content='<p>Django ORM queries compiler</p>', is_published=False)
+
+    def related(self, post):
+        response = self.client.get(f'/api/blog/posts/{post.pk}/related/', {'render': 'test'}, HTTP_ACCEPT='application/json')
+        return [item['slug'] for item in response.json()]
+
+    def test_shared_terms_rank_first(self):
+        self.assertEqual(self.related(self.orm), [self.tips.slug, self.views.slug])
+        self.assertEqual(self.related(self.tips)[0], self.orm.slug)
+        self.assertEqual(self.related(self.k8s), [])
+
+    def test_unpublished_posts_are_excluded(self):
+        self.assertNotIn(self.draft.slug, self.related(self.orm))
+        self.assertEqual(self.client.get(f'/api/blog/posts/{self.draft.pk}/related/').status_code, 404)
+
+        self.tips.is_published = False
+        self.tips.save()
+        self.assertEqual(self.related(self.orm), [self.views.slug])
+
+        self.draft.is_published = True
+        self.draft.save()
+        self.assertEqual(self.related(self.orm)[0], self.draft.slug)
+
+    def test_edit_and_delete_update_lists(self):
+        self.k8s.title = 'Django ORM on Kubernetes'
+        self.k8s.content = '<p>Django ORM queries with prefetch_related on Kubernetes</p>'
+        self.k8s.save()
+        self.assertIn(self.k8s.slug, self.related(self.orm))
+        self.assertIn(self.orm.slug, self.related(self.k8s))
+
+        self.tips.delete()
+        self.assertNotIn(self.tips.slug, self.related(self.orm))
+        self.assertFalse(RelatedPost.objects.filter(related_id=self.tips.pk).exists())
+
+        # The incremental lists hold the same posts as a full rebuild
+        incremental = {post.slug: set(self.related(post)) for post in (self.orm, self.views, self.k8s)}
+        related.rebuild()
+        cache.clear()
+        self.assertEqual({post.slug: set(self.related(post)) for post in (self.orm, self.views, self.k8s)}, incremental)
+
+    def test_one_update_per_transaction(self):
+        with mock.patch.object(related, 'update_posts', wraps=related.update_posts) as update_posts:
+            with transaction.atomic():
+                first = create_post(excerpt='', title='Django ORM migrations', content='<p>Django ORM schema</p>')
+                second = create_post(excerpt='', title='Django ORM managers', content='<p>Django ORM querysets</p>')
+                self.orm.delete()
+                self.assertEqual(update_posts.call_count, 0)
+            self.assertEqual(update_posts.call_count, 1)
+        self.assertEqual(set(update_posts.call_args.args[0]), {first.pk, second.pk})
+        self.assertIn(second.slug, self.related(first))
+        self.assertFalse(RelatedPost.objects.filter(related_id=self.orm.pk).exists())
+
+
+class BlogSnapshotTests(TransactionTestCase):
+    # Real commits, so the on_commit rebuilds run as they would in production
+
+    def setUp(self):
+        cache.clear()
+        self.post = create_post()
+        create_post(is_published=False)
+
+    def stored(self):
+        payload = BlogSnapshot.objects.filter(key=snapshots.PUBLISHED_LIST).values_list('payload', flat=True).first()
+        return None if payload is None else bytes(payload)
+
+    def live(self):
+        return snapshots.build_published_list()
+
+    def count_rebuilds(self):
+        return mock.patch.object(snapshots, 'rebuild', wraps=snapshots.rebuild)
+
+    def test_write_rebuilds_once_on_commit(self):
+        with self.count_rebuilds() as rebuild:
+            with transaction.atomic():
+                create_post()
+                self.post.title = 'Renamed'
+                self.post.save()
+                self.assertEqual(rebuild.call_count, 0)
+                self.assertNotEqual(self.stored(), self.live())
+            self.assertEqual(rebuild.call_count, 1)
+        self.assertEqual(self.stored(), self.live())
+
+        self.post.delete()
+        self.assertEqual(self.stored(), self.live())
+        self.assertNotIn(b'"Renamed"', self.stored())
+
+    def test_rolled_back_write_does_not_rebuild(self):
+        with self.count_rebuilds() as rebuild:
+            with self.assertRaises(ValueError), transaction.atomic():
+                create_post()
+                raise ValueError
+        self.assertEqual(rebuild.call_count, 0)
+
+    def test_deferred_coalesces_rebuilds(self):
+        with self.count_rebuilds() as rebuild:
+            with snapshots.deferred():
+                with snapshots.deferred():
+                    create_post()
+                create_post()
+                self.post.delete()
+                self.assertEqual(rebuild.call_count, 0)
+            self.assertEqual(rebuild.call_count, 1)
+
+            with snapshots.deferred():
+                pass
+            self.assertEqual(rebuild.call_count, 1)
+        self.assertEqual(self.stored(), self.live())
+
+    def test_snapshot_matches_live_list(self):
+        create_post(title='Fresh “post” ✓')
+        response = self.client.get('/api/blog/posts/', HTTP_ACCEPT='application/json')
+        self.assertEqual(response.content, self.stored())
+        self.assertEqual(response.content, ORJSONRenderer().render(
+            BlogPostListSerializer(BlogPost.objects.filter(is_published=True), many=True).data
+        ))
+        self.assertEqual(len(response.json()), 2)
+
+    def test_bulk_writes_rebuild(self):
+        with self.count_rebuilds() as rebuild:
+            BlogPost.objects.filter(pk=self.post.pk).update(title='Bulk renamed')
+            self.assertEqual(rebuild.call_count, 1)
+            self.assertIn(b'"Bulk renamed"', self.stored())
+
+            with transaction.atomic():
+                BlogPost.objects.update(category='React')
+                BlogPost.objects.bulk_create([BlogPost(
+                    title='Bulk created', excerpt='', date=date(2026, 5, 1), category='React', slug='bulk-created',
+                )])
+                self.post.title = 'Bulk updated'
+                BlogPost.objects.bulk_update([self.post], ['title'])
+            self.assertEqual(rebuild.call_count, 2)
+            self.assertEqual(self.stored(), self.live())
+
+            # Nothing matched, nothing to rebuild
+            BlogPost.objects.filter(slug='missing').update(title='Nobody')
+            self.assertEqual(rebuild.call_count, 2)
+        self.assertEqual(len(json.loads(self.stored())), 2)
+
+    def test_check_command(self):
+        out = StringIO()
+        call_command('rebuild_blog_snapshots', '--check', stdout=out)
+        self.assertIn('[OK]', out.getvalue())
+
+        # Raw SQL bypasses the ORM entirely and leaves the snapshot stale
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE blog_blogpost SET title = 'Changed behind the ORM' WHERE id = %s", [self.post.pk])
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command('rebuild_blog_snapshots', '--check', stdout=out)
+        self.assertIn('[STALE]', out.getvalue())
+
+        call_command('rebuild_blog_snapshots', stdout=StringIO())
+        call_command('rebuild_blog_snapshots', '--check', stdout=StringIO())
+
+
+class BlogPostReadingStatsTests(TestCase):
+    def test_stats_are_computed_from_text(self):
+        post = create_post(content='<h2>Title here</h2><p>one <strong>two</strong> three</p>')
+        self.assertEqual(post.word_count, 5)
+        self.assertEqual(post.read_minutes, 1)
+        self.assertEqual(post.read_time, '1 min read')
+
+        post.content = '<p>' + 'word ' * 1000 + '</p>'
+        post.save(update_fields=['content'])
+        post.refresh_from_db()
+        self.assertEqual(post.word_count, 1000)
+        self.assertEqual(post.read_minutes, 7)
+        self.assertEqual(post.read_time, '7 min read')
+
+    def test_list_filter_and_ordering(self):
+        for words in (2000, 100, 900):
+            create_post(content='<p>' + 'word ' * words + '</p>')
+        response = self.client.get('/api/blog/posts/?ordering=read_minutes', HTTP_ACCEPT='application/json')
+        self.assertEqual([post['read_minutes'] for post in response.json()], [1, 6, 13])
+        response = self.client.get('/api/blog/posts/?max_read_minutes=6', HTTP_ACCEPT='application/json')
+        self.assertEqual(sorted(post['word_count'] for post in response.json()), [100, 900])
+        response = self.client.get('/api/blog/posts/?max_read_minutes=soon', HTTP_ACCEPT='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_backfill_command(self):
+        post = create_post(content='<p>' + 'word ' * 600 + '</p>')
+        BlogPost.objects.update(word_count=0, read_minutes=0, read_time='')
+        call_command('backfill_reading_stats', chunk_size=1, stdout=StringIO())
+        post.refresh_from_db()
+        self.assertEqual((post.word_count, post.read_minutes, post.read_time), (600, 4, '4 min read'))
+        detail = self.client.get(f'/api/blog/posts/{post.pk}/', HTTP_ACCEPT='application/json')
+        self.assertEqual(detail.json()['read_minutes'], 4)
+
+
+class BlogCategoryRollupTests(TestCase):
+    def stats(self):
+        return [(row.category, row.post_count, row.latest_date) for row in BlogCategoryStat.objects.all()]
+
+    def group_by(self):
+        rows = (
+            BlogPost.objects.filter(is_published=True)
+            .order_by('category')
+            .values_list('category')
+            .annotate(Count('id'), Max('date'))
+        )
+        return list(rows)
+
+    def edit(self, post, **changes):
+        # Saved from a fresh load, so the delta comes from _loaded_values rather than a recompute
+        post = BlogPost.objects.get(pk=post.pk)
+        for field, value in changes.items():
+            setattr(post, field, value)
+        with mock.patch.object(rollups, 'recompute', side_effect=AssertionError('recomputed')):
+            post.save()
+        return post
+
+    def test_category_change(self):
+        first = create_post(category='Django', date=date(2026, 3, 1))
+        create_post(category='Django', date=date(2026, 2, 1))
+        create_post(category='React', date=date(2026, 1, 1))
+
+        self.edit(first, category='React')
+        self.assertEqual(self.stats(), [('Django', 1, date(2026, 2, 1)), ('React', 2, date(2026, 3, 1))])
+
+        self.edit(first, category='Vue')
+        self.assertEqual(self.stats(), [('Django', 1, date(2026, 2, 1)), ('React', 1, date(2026, 1, 1)), ('Vue', 1, date(2026, 3, 1))])
+        self.assertEqual(self.stats(), self.group_by())
+
+    def test_unpublish_and_republish(self):
+        latest = create_post(date=date(2026, 3, 1))
+        create_post(date=date(2026, 2, 1))
+
+        self.edit(latest, is_published=False)
+        self.assertEqual(self.stats(), [('Django', 1, date(2026, 2, 1))])
+
+        # Editing a draft leaves the counts alone
+        self.edit(latest, category='React')
+        self.assertEqual(self.stats(), [('Django', 1, date(2026, 2, 1))])
+
+        self.edit(latest, is_published=True)
+        self.assertEqual(self.stats(), [('Django', 1, date(2026, 2, 1)), ('React', 1, date(2026, 3, 1))])
+        self.assertEqual(self.stats(), self.group_by())
+
+    def test_delete(self):
+        latest = create_post(category='Django', date=date(2026, 3, 1))
+        only = create_post(category='React')
+        create_post(category='Django', date=date(2026, 2, 1))
+
+        BlogPost.objects.get(pk=latest.pk).delete()
+        self.assertEqual(self.stats(), [('Django', 1, date(2026, 2, 1)), ('React', 1, only.date)])
+
+        BlogPost.objects.get(pk=only.pk).delete()
+        self.assertEqual(self.stats(), [('Django', 1, date(2026, 2, 1))])
+        self.assertEqual(self.stats(), self.group_by())
+
+    def test_recompute_matches_group_by(self):
+        for index, category in enumerate(['Django', 'React', 'Django', 'Vue', 'React', 'Django']):
+            create_post(category=category, date=date(2026, 1, 1) + timedelta(days=index * 10))
+        create_post(category='Vue', is_published=False)
+        self.assertEqual(self.stats(), self.group_by())
+
+        # A raw write bypasses the signals, so only --check notices
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE blog_blogpost SET category = 'Svelte' WHERE category = 'React'")
+        with self.assertRaisesMessage(CommandError, 'BlogCategoryStat'):
+            call_command('recompute_blog_categories', check=True, stdout=StringIO())
+
+        call_command('recompute_blog_categories', stdout=StringIO())
+        self.assertEqual(self.stats(), self.group_by())
+        self.assertIn(('Svelte', 2, date(2026, 2, 10)), self.stats())
+        call_command('recompute_blog_categories', check=True, stdout=StringIO())
+
+
+class BlogArchiveTests(TestCase):
+    def get(self, url):
+        return self.client.get(url, HTTP_ACCEPT='application/json')
+
+    def buckets(self):
+        return [(row['year'], row['month'], row['post_count']) for row in self.get('/api/blog/archive/').json()]
+
+    def test_rollup_follows_changes(self):
+        first = create_post(date=date(2026, 3, 5))
+        second = create_post(date=date(2026, 3, 20))
+        create_post(date=date(2025, 12, 31))
+        self.assertEqual(self.buckets(), [(2026, 3, 2), (2025, 12, 1)])
+
+        # Backdated
+        first.date = date(2025, 12, 1)
+        first.save()
+        self.assertEqual(self.buckets(), [(2026, 3, 1), (2025, 12, 2)])
+
+        second.is_published = False
+        second.save()
+        self.assertEqual(self.buckets(), [(2025, 12, 2)])
+
+        first.delete()
+        self.assertEqual(self.buckets(), [(2025, 12, 1)])
+        self.assertEqual(rollups.check(), [])
+
+    def test_month_posts(self):
+        create_post(date=date(2026, 1, 31), slug='january')
+        create_post(date=date(2026, 2, 1), slug='february')
+        create_post(date=date(2026, 2, 14), slug='valentine')
+        create_post(date=date(2026, 2, 20), slug='draft', is_published=False)
+        response = self.get('/api/blog/archive/2026/02/')
+        self.assertEqual([post['slug'] for post in response.json()], ['valentine', 'february'])
+        self.assertNotIn('content', response.json()[0])
+        self.assertEqual(self.get('/api/blog/archive/2025/12/').json(), [])
+        self.assertEqual(self.get('/api/blog/archive/2026/13/').status_code, 404)
+
+
+@override_settings(BLOG_VIEW_FLUSH_INTERVAL=0)
+class BlogViewCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.posts = [create_post() for _ in range(3)]
+
+    def setUp(self):
+        viewcounts.clear()
+
+    def view(self, lookup, count=1):
+        for _ in range(count):
+            self.client.get(f'/api/blog/posts/{lookup}/', HTTP_ACCEPT='application/json')
+
+    def popular(self):
+        response = self.client.get('/api/blog/posts/popular/', HTTP_ACCEPT='application/json')
+        return [(post['slug'], post['view_count']) for post in response.json()]
+
+    def test_views_are_written_in_one_flush(self):
+        first, second, third = self.posts
+        self.view(first.pk, 2)
+        self.view(second.slug, 3)
+        self.view(f'by-slug/{second.slug}')
+        self.view('missing-post')
+        self.assertFalse(BlogPostViewCount.objects.exists())
+        self.assertEqual(self.popular(), [])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(viewcounts.flush(), 2)
+        upserts = [query for query in queries if 'INSERT INTO "blog_blogpostviewcount"' in query['sql']]
+        self.assertEqual(len(upserts), 1, queries.captured_queries)
+        self.assertEqual(self.popular(), [(second.slug, 4), (first.slug, 2)])
+
+        self.view(first.pk, 3)
+        self.view(third.pk)
+        viewcounts.flush()
+        self.assertEqual(self.popular(), [(first.slug, 5), (second.slug, 4), (third.slug, 1)])
+
+    def test_views_do_not_invalidate_other_responses(self):
+        post = self.posts[0]
+        detail = self.client.get(f'/api/blog/posts/{post.pk}/', HTTP_ACCEPT='application/json')
+        viewcounts.flush()
+        popular = self.client.get('/api/blog/posts/popular/', HTTP_ACCEPT='application/json')
+
+        self.view(post.pk)
+        viewcounts.flush()
+        again = self.client.get(f'/api/blog/posts/{post.pk}/', HTTP_ACCEPT='application/json')
+        self.assertEqual(again['ETag'], detail['ETag'])
+        self.assertNotEqual(
+            self.client.get('/api/blog/posts/popular/', HTTP_ACCEPT='application/json')['ETag'], popular['ETag']
+        )
+
+    def test_unpublished_posts_are_not_ranked(self):
+        first, second, _ = self.posts
+        self.view(first.pk, 2)
+        self.view(second.pk)
+        second.is_published = False
+        second.save()
+        viewcounts.flush()
+        self.assertEqual(self.popular(), [(first.slug, 2)])
+
+
+class BlogPostNavigationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.oldest = create_post(date=date(2026, 1, 1))
+        cls.same_day = [create_post(date=date(2026, 1, 5)) for _ in range(2)]
+        create_post(date=date(2026, 1, 7), is_published=False)
+        cls.newest = create_post(date=date(2026, 1, 9))
+
+    def get(self, url):
+        return self.client.get(url, HTTP_ACCEPT='application/json').json()
+
+    def link(self, post):
+        return {'slug': post.slug, 'title': post.title, 'date': post.date.isoformat()}
+
+    def test_prev_and_next_in_chronological_order(self):
+        first, second = self.same_day
+        data = self.get(f'/api/blog/posts/{first.pk}/?nav=1')
+        self.assertEqual((data['prev'], data['next']), (self.link(self.oldest), self.link(second)))
+        data = self.get(f'/api/blog/posts/by-slug/{second.slug}/?nav=1')
+        self.assertEqual((data['prev'], data['next']), (self.link(first), self.link(self.newest)))
+        data = self.get(f'/api/blog/posts/{self.oldest.slug}/?nav=1')
+        self.assertEqual((data['prev'], data['next']), (None, self.link(first)))
+        self.assertIsNone(self.get(f'/api/blog/posts/{self.newest.pk}/?nav=1')['next'])
+
+    def test_neighbours_are_loaded_with_the_post(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.get(f'/api/blog/posts/{self.newest.pk}/?nav=1')
+        post_queries = [query for query in queries if 'JSON_OBJECT' in query['sql']]
+        self.assertEqual(len(post_queries), 1)
+        self.assertNotIn('prev', self.get(f'/api/blog/posts/{self.newest.pk}/'))
+
+
+class BlogFeaturedPostTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def get_featured(self):
+        response = self.client.get('/api/blog/posts/featured/', HTTP_ACCEPT='application/json')
+        return response.json() if response.content else None
+
+    def test_featuring_unfeatures_the_previous_post(self):
+        first = create_post(featured=True)
+        second = create_post()
+        self.assertEqual(self.get_featured()['id'], first.pk)
+
+        second.featured = True
+        second.save()
+        first.refresh_from_db()
+        self.assertFalse(first.featured)
+        self.assertEqual(self.get_featured()['id'], second.pk)
+        detail = self.client.get(f'/api/blog/posts/{first.pk}/', HTTP_ACCEPT='application/json').json()
+        self.assertFalse(detail['featured'])
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            BlogPost.objects.filter(pk=first.pk).update(featured=True)
+
+    def test_pointer_is_cached(self):
+        post = create_post(featured=True)
+        self.get_featured()
+        with self.assertNumQueries(1):
+            self.assertEqual(featured.get_post().pk, post.pk)
+
+        # Editing the featured post keeps the pointer
+        post.title = 'Edited'
+        post.save()
+        self.assertEqual(cache.get(featured.CACHE_KEY), post.pk)
+
+        post.is_published = False
+        post.save()
+        self.assertIsNone(cache.get(featured.CACHE_KEY))
+        self.assertIsNone(self.get_featured())
+
+    def test_stale_pointer_is_resolved_again(self):
+        old = create_post()
+        post = create_post(featured=True)
+        # As left behind by another process
+        cache.set(featured.CACHE_KEY, old.pk)
+        self.assertEqual(self.get_featured()['id'], post.pk)
+        self.assertEqual(cache.get(featured.CACHE_KEY), post.pk)
+
+
+class FakeGroqService(GroqAIService):
+    """GroqAIService without the API: same title for every post, slow calls"""
+    CATEGORIES = ['React', 'Django']
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = self.peak = 0
+
+    def generate_blog_post(self, topic=None, category=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        return {
+            'title': 'Generated Post', 'excerpt': 'Excerpt', 'content': '<p>Generated body</p>',
+            'category': category, 'read_time': '1 min read', 'author': 'BuildWithSharma',
+        }
+
+    def generate_image_url(self, title, category, topic=None):
+        return 'https://example.com/image.png'
+
+
+class GenerateDailyBlogTests(TestCase):
+    def call(self, *args):
+        service = FakeGroqService()
+        stdout = StringIO()
+        with mock.patch('blog.management.commands.generate_daily_blog.GroqAIService', return_value=service):
+            call_command('generate_daily_blog', *args, stdout=stdout)
+        return service, stdout.getvalue()
+
+    def test_concurrent_batch(self):
+        service, output = self.call('--count', '4', '--concurrency', '4')
+        self.assertGreater(service.peak, 1)
+        slugs = set(BlogPost.objects.values_list('slug', flat=True))
+        self.assertEqual(slugs, {'generated-post', 'generated-post-1', 'generated-post-2', 'generated-post-3'})
+        self.assertEqual(set(BlogPost.objects.values_list('category', flat=True)), {'React', 'Django'})
+        self.assertIn('Generated 4 of 4 blog posts', output)
+        self.assertIn('Per-call latency', output)
+
+    def test_date_range_skips_existing_dates(self):
+        create_post(date=date(2025, 6, 2))
+        self.call('--start-date', '2025-06-01', '--end-date', '2025-06-04', '--concurrency', '2')
+        dates = sorted(BlogPost.objects.filter(slug__startswith='generated-post').values_list('date', flat=True))
+        self.assertEqual(dates, [date(2025, 6, 1), date(2025, 6, 3), date(2025, 6, 4)])
+
+    def test_invalid_options(self):
+        with self.assertRaises(CommandError):
+            self.call('--count', '2', '--start-date', '2025-06-01')
+        with self.assertRaises(CommandError):
+            self.call('--start-date', '2025-06-05', '--end-date', '2025-06-01')
+
+
+class RegenerateBlogContentTests(TestCase):
+    def setUp(self):
+        self.checkpoint = Path(tempfile.mkdtemp()) / 'checkpoint.jsonl'
+        self.addCleanup(shutil.rmtree, self.checkpoint.parent)
+        self.short = [create_post(content='<p>Too short</p>') for _ in range(3)]
+        self.long = create_post(content='<p>' + 'long ' * 200 + '</p>')
+
+    def call(self, *args):
+        service = FakeGroqService()
+        service.generate_blog_post = mock.Mock(wraps=service.generate_blog_post)
+        with mock.patch('blog.management.commands.regenerate_blog_content.GroqAIService', return_value=service):
+            call_command(
+                'regenerate_blog_content', '--all', '--checkpoint', str(self.checkpoint), *args, stdout=StringIO(),
+            )
+        return service
+
+    def test_regenerates_short_posts_in_batches(self):
+        with CaptureQueriesContext(connection) as queries:
+            service = self.call('--concurrency', '3', '--batch-size', '2')
+        self.assertEqual(service.generate_blog_post.call_count, 3)
+        updates = [query for query in queries if query['sql'].startswith('UPDATE "blog_blogpost"')]
+        self.assertEqual(len(updates), 2)
+        for post in self.short:
+            post.refresh_from_db()
+            self.assertEqual(post.content, '<p>Generated body</p>')
+            self.assertEqual((post.word_count, post.excerpt), (2, 'Excerpt'))
+        self.assertEqual(sorted(post.pk for post in search.search('generated')), sorted(post.pk for post in self.short))
+        self.assertFalse(self.checkpoint.exists())
+
+    def test_resumes_from_checkpoint(self):
+        done = self.short[0]
+        self.checkpoint.write_text(
+            json.dumps({'id': done.pk, 'content': '<p>From checkpoint</p>', 'excerpt': 'Saved'}) + '\n{"id": 1'
+        )
+        service = self.call()
+        self.assertEqual(service.generate_blog_post.call_count, 2)
+        done.refresh_from_db()
+        self.assertEqual(done.content, '<p>From checkpoint</p>')
+        self.long.refresh_from_db()
+        self.assertNotEqual(self.long.content, '<p>Generated body</p>')
+
+    def test_checkpoint_does_not_overwrite_edited_posts(self):
+        edited, written = self.short[0], self.short[1]
+        edited.content = '<p>' + 'edited ' * 100 + '</p>'
+        edited.save()
+        written.content = '<p>Written by an earlier run</p>'
+        written.save()
+        # Checkpoint entries for a post edited after generation and for the long post
+        self.checkpoint.write_text(''.join(
+            json.dumps({'id': post.pk, 'content': '<p>From checkpoint</p>', 'excerpt': 'Saved'}) + '\n'
+            for post in (edited, written, self.long)
+        ))
+        service = self.call()
+        self.assertEqual(service.generate_blog_post.call_count, 1)
+        for post in (edited, self.long):
+            content = post.content
+            post.refresh_from_db()
+            self.assertEqual(post.content, content)
+        written.refresh_from_db()
+        self.assertEqual(written.content, '<p>From checkpoint</p>')
+
+
+class BlogFeedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(5):
+            create_post(title=f'Post {i} & <friends>', is_published=(i != 3))
+
+    def setUp(self):
+        cache.clear()
+
+    def test_rss_matches_django_feed(self):
+        response = self.client.get('/api/blog/feed.xml')
+        self.assertEqual(response['Content-Type'], 'application/rss+xml; charset=utf-8')
+
+        posts = list(BlogPost.objects.filter(is_published=True))
+        feed = feedgenerator.Rss201rev2Feed(
+            title=feeds.FEED_TITLE, link=feeds.site_url('/blog'), description=feeds.FEED_DESCRIPTION,
+            feed_url=feeds.site_url('/api/blog/feed.xml'), language='en-us',
+        )
+        for post in posts:
+            feed.add_item(
+                title=post.title, link=feeds.post_url(post.slug), description=post.excerpt,
+                author_name=post.author, pubdate=feeds._as_datetime(post.date), updateddate=post.updated_at,
+                unique_id=feeds.post_url(post.slug), unique_id_is_permalink=True, categories=[post.category],
+            )
+        self.assertEqual(response.content.decode(), feed.writeString('utf-8'))
+
+    def test_new_post_renders_one_fragment(self):
+        self.client.get('/api/blog/atom.xml')
+        create_post(title='Fresh')
+        with mock.patch.object(feeds, 'render_item', wraps=feeds.render_item) as render_item:
+            response = self.client.get('/api/blog/atom.xml')
+        self.assertEqual(render_item.call_count, 1)
+        entries = minidom.parseString(response.content).getElementsByTagName('entry')
+        self.assertEqual(len(entries), 5)
+        self.assertEqual(entries[0].getElementsByTagName('title')[0].firstChild.data, 'Fresh')
+        not_modified = self.client.get('/api/blog/atom.xml', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_unpublish_moves_last_modified(self):
+        past = timezone.now() - timedelta(hours=1)
+        BlogPost.objects.update(updated_at=past)
+        ContentVersion.objects.update(updated_at=past)
+        paths = ('/api/blog/feed.xml', '/api/blog/atom.xml', '/sitemap.xml')
+        last_modified = {path: self.client.get(path)['Last-Modified'] for path in paths}
+        for path in paths:
+            with self.subTest(path=path):
+                not_modified = self.client.get(path, HTTP_IF_MODIFIED_SINCE=last_modified[path])
+                self.assertEqual(not_modified.status_code, 304)
+
+        # Not the newest post, so the remaining rows keep their timestamps
+        post = BlogPost.objects.filter(is_published=True).order_by('date').first()
+        post.is_published = False
+        post.save(update_fields=['is_published'])
+        for path in paths:
+            with self.subTest(path=path):
+                response = self.client.get(path, HTTP_IF_MODIFIED_SINCE=last_modified[path])
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn(post.slug, response.content.decode())
+
+    def test_sitemap_splits_into_index(self):
+        sitemap = minidom.parseString(self.client.get('/sitemap.xml').content)
+        self.assertEqual(len(sitemap.getElementsByTagName('url')), 2 + 4)
+
+        with mock.patch.object(feeds, 'SITEMAP_LIMIT', 4):
+            index = minidom.parseString(self.client.get('/sitemap.xml').content)
+            locs = [node.firstChild.data for node in index.getElementsByTagName('loc')]
+            self.assertEqual(locs, [feeds.site_url('/sitemap-1.xml'), feeds.site_url('/sitemap-2.xml')])
+            urls = []
+            for page in (1, 2):
+                document = minidom.parseString(self.client.get(f'/sitemap-{page}.xml').content)
+                urls += [node.firstChild.data for node in document.getElementsByTagName('loc')]
+            self.assertEqual(self.client.get('/sitemap-3.xml').status_code, 404)
+        self.assertEqual(urls, [node.firstChild.data for node in sitemap.getElementsByTagName('loc')])
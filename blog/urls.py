@@ -1,11 +1,14 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import BlogPostViewSet
+from .views import BlogArchiveViewSet, BlogPostViewSet, atom_feed, rss_feed
 
 router = DefaultRouter()
 router.register(r'posts', BlogPostViewSet, basename='blogpost')
+router.register(r'archive', BlogArchiveViewSet, basename='blogarchive')
 
 urlpatterns = [
+    path('feed.xml', rss_feed, name='blog-rss-feed'),
+    path('atom.xml', atom_feed, name='blog-atom-feed'),
     path('', include(router.urls)),
 ]
 
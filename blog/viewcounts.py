@@ -0,0 +1,165 @@
+"""
+Write-behind view counter for blog post detail views.
+
+An UPDATE per page view would queue every reader behind SQLite's single
+writer lock, so views are only counted in a per-process buffer. A
+background thread flushes it every ``BLOG_VIEW_FLUSH_INTERVAL`` seconds,
+and once more when the process exits, as one batched upsert into
+BlogPostViewCount, then re-ranks the BlogPopularPost table the popular
+endpoint reads. Views buffered by a process that is killed are lost,
+which is acceptable for a popularity signal.
+
+Views are buffered under the URL lookup (id or slug), resolved to post ids
+with one query per flush, and tagged with the database name so counts
+recorded against another database (e.g. the test database) are dropped
+rather than written to the current one.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+
+from . import slugs
+from .models import BlogPopularPost, BlogPost, BlogPostViewCount
+
+logger = logging.getLogger(__name__)
+
+# Length of the precomputed popular ranking
+POPULAR_SIZE = 20
+
+_lock = threading.Lock()
+_pending = Counter()
+# (pid, thread) of the flush thread, restarted in forked workers
+_worker = None
+
+
+def _database():
+    return str(connection.settings_dict['NAME'])
+
+
+def record(lookup):
+    """Count one view of the post with this id or slug"""
+    key = (_database(), str(lookup))
+    with _lock:
+        _pending[key] += 1
+    if settings.BLOG_VIEW_FLUSH_INTERVAL and (_worker is None or _worker[0] != os.getpid()):
+        _start_worker()
+
+
+def clear():
+    """Drop the buffered views of this process"""
+    with _lock:
+        _pending.clear()
+
+
+def _start_worker():
+    global _worker
+    with _lock:
+        if _worker is not None and _worker[0] == os.getpid():
+            return
+        thread = threading.Thread(target=_run, name='blog-view-counts', daemon=True)
+        _worker = (os.getpid(), thread)
+    thread.start()
+
+
+def _run():
+    while True:
+        time.sleep(settings.BLOG_VIEW_FLUSH_INTERVAL)
+        try:
+            flush()
+        except Exception:
+            logger.exception('Flushing blog view counts failed')
+        finally:
+            # The thread keeps its own connection; don't hold it between flushes
+            connection.close()
+
+
+def _resolve(batch):
+    """Map ``{lookup: views}`` to ``{post id: views}``, dropping unknown posts"""
+    ids = {int(lookup) for lookup in batch if slugs.is_pk(lookup)}
+    rows = list(BlogPost.objects.filter(Q(pk__in=ids) | Q(slug__in=list(batch))).values_list('pk', 'slug'))
+    by_pk = {pk for pk, _ in rows}
+    by_slug = {slug: pk for pk, slug in rows}
+
+    counts = Counter()
+    for lookup, views in batch.items():
+        # Same precedence as BlogPostViewSet.get_object(): id first, then slug
+        if slugs.is_pk(lookup) and int(lookup) in by_pk:
+            counts[int(lookup)] += views
+        elif lookup in by_slug:
+            counts[by_slug[lookup]] += views
+    return counts
+
+
+def _upsert(counts):
+    table = connection.ops.quote_name(BlogPostViewCount._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"""
+            INSERT INTO {table} (post_id, view_count) VALUES (%s, %s)
+            ON CONFLICT (post_id) DO UPDATE SET view_count = view_count + excluded.view_count
+            """,
+            list(counts.items()),
+        )
+
+
+def rank_popular():
+    """
+    Rebuild the BlogPopularPost ranking from the counters. Nothing is
+    written (and no cache is invalidated) when the ranking is unchanged.
+    """
+    top = list(
+        BlogPostViewCount.objects.filter(post__is_published=True)
+        .order_by('-view_count', 'post')
+        .values_list('post_id', 'view_count')[:POPULAR_SIZE]
+    )
+    if top == list(BlogPopularPost.objects.values_list('post_id', 'view_count')):
+        return False
+    with transaction.atomic():
+        BlogPopularPost.objects.all().delete()
+        BlogPopularPost.objects.bulk_create([
+            BlogPopularPost(post_id=post_id, rank=rank, view_count=view_count)
+            for rank, (post_id, view_count) in enumerate(top, 1)
+        ])
+    return True
+
+
+def flush():
+    """
+    Write the views buffered in this process and re-rank the popular posts.
+    Returns the number of posts whose counters were updated.
+    """
+    database = _database()
+    with _lock:
+        batch = Counter({lookup: views for (name, lookup), views in _pending.items() if name == database})
+        _pending.clear()
+    if not batch:
+        return 0
+
+    try:
+        counts = _resolve(batch)
+        if counts:
+            with transaction.atomic():
+                _upsert(counts)
+                rank_popular()
+    except Exception:
+        # Keep the views for the next flush
+        with _lock:
+            for lookup, views in batch.items():
+                _pending[(database, lookup)] += views
+        raise
+    return len(counts)
+
+
+@atexit.register
+def _flush_at_exit():
+    try:
+        flush()
+    except Exception:
+        logger.exception('Flushing blog view counts at exit failed')
@@ -1,51 +1,474 @@
-from rest_framework import viewsets
+from calendar import timegm
+from datetime import date, datetime
+
+from django.db.models import BinaryField, Q
+from django.db.models.functions import Cast, Substr
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import require_safe
+from rest_framework import filters, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
-from .models import BlogPost
-from .serializers import BlogPostSerializer, BlogPostListSerializer
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+from core import export, versioning
+from core.mixins import ConditionalGetMixin, ResponseCacheMixin, SparseFieldsMixin
+from core.streaming import StreamingListMixin
+from .models import BlogPost, BlogPostEncoding, BlogArchiveStat, BlogCategoryStat, BlogPopularPost
+from .serializers import (
+    BlogPostSerializer, BlogPostListSerializer, BlogPostPopularSerializer, BlogPostSearchSerializer,
+    BlogArchiveStatSerializer, BlogCategoryStatSerializer,
+)
+from . import compression, feeds, navigation, search, slugs, snapshots, viewcounts
+from . import featured as featured_posts
+from . import related as related_posts
+
+
+def get_int_param(request, name, default, minimum, maximum):
+    """Read an integer query parameter, clamped to [minimum, maximum]"""
+    try:
+        value = int(request.query_params.get(name, default))
+    except ValueError:
+        raise ValidationError({name: 'A valid integer is required.'})
+    return min(max(value, minimum), maximum)
+
+
+def read_sections(post, entries):
+    """
+    Return the HTML of consecutive TOC entries, slicing the content column
+    by byte offset in SQL so the rest of the post is never loaded
+    """
+    if not entries:
+        return []
+    start, end = entries[0]['start'], entries[-1]['end']
+    chunk = BlogPost.objects.filter(pk=post.pk).annotate(
+        chunk=Substr(Cast('content', BinaryField()), start + 1, end - start)
+    ).values_list('chunk', flat=True).get()
+    chunk = bytes(chunk)
+    return [
+        {
+            'index': entry['index'],
+            'anchor': entry['anchor'],
+            'level': entry['level'],
+            'title': entry['title'],
+            'html': chunk[entry['start'] - start:entry['end'] - start].decode('utf-8'),
+        }
+        for entry in entries
+    ]
 
 
 class NoPagination(PageNumberPagination):
     page_size = None
 
 
-class BlogPostViewSet(viewsets.ReadOnlyModelViewSet):
+class BlogPostCursorPagination(CursorPagination):
+    """
+    Opt-in keyset pagination for the blog list.
+
+    Clients that send ``?cursor=`` or ``?page_size=`` get pages ordered by
+    the model's ``(-date, -created_at)`` ordering with opaque next/previous
+    cursors. Requests without either parameter keep the original
+    unpaginated list response.
+
+    Several posts often share a date, so the cursor position is the
+    ``date|created_at`` pair rather than DRF's single ordering field, whose
+    offset bookkeeping skips posts when paging back through ties.
+    """
+    ordering = ('-date', '-created_at')
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def _get_position_from_instance(self, instance, ordering):
+        return f'{instance.date.isoformat()}|{instance.created_at.isoformat()}'
+
+    def filter_by_position(self, queryset, position, reverse):
+        """Posts after ``position`` in the (reversed, for previous pages) ordering"""
+        try:
+            day, created = position.split('|')
+            day, created = date.fromisoformat(day), datetime.fromisoformat(created)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        lookup = 'gt' if reverse else 'lt'
+        return queryset.filter(
+            Q(**{f'date__{lookup}': day}) | Q(date=day, **{f'created_at__{lookup}': created})
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        offset, reverse, position = self.cursor or (0, False, None)
+
+        if reverse:
+            queryset = queryset.order_by(*[field.lstrip('-') for field in self.ordering])
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if position is not None:
+            queryset = self.filter_by_position(queryset, position, reverse)
+
+        # One extra row tells whether there is a following page
+        results = list(queryset[offset:offset + self.page_size + 1])
+        self.page = results[:self.page_size]
+        following = self._get_position_from_instance(results[-1], self.ordering) if len(results) > len(self.page) else None
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.next_position = position is not None or offset > 0, position
+            self.has_previous, self.previous_position = following is not None, following
+        else:
+            self.has_next, self.next_position = following is not None, following
+            self.has_previous, self.previous_position = position is not None or offset > 0, position
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+
+class BlogPostViewSet(ResponseCacheMixin, ConditionalGetMixin, StreamingListMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     queryset = BlogPost.objects.filter(is_published=True)
-    pagination_class = NoPagination
+    pagination_class = BlogPostCursorPagination
+    sparse_field_actions = ('list', 'retrieve', 'by_slug')
+    # categories and related read these tables
+    cache_dependencies = ['blog.BlogCategoryStat', 'blog.RelatedPost']
+    filter_backends = [filters.OrderingFilter]
+    ordering_fields = ['date', 'read_minutes']
     
-    def get_serializer_class(self):
+    def get_queryset(self):
+        queryset = super().get_queryset()
         if self.action == 'list':
+            # The list serializer never reads the large text columns
+            queryset = queryset.defer('content', 'toc')
+            if 'max_read_minutes' in self.request.query_params:
+                max_minutes = get_int_param(self.request, 'max_read_minutes', 0, 0, 32767)
+                queryset = queryset.filter(read_minutes__lte=max_minutes)
+        elif self.action in ('sections', 'section'):
+            # Only the table of contents is needed, content is sliced in SQL
+            queryset = queryset.defer('content')
+        return queryset
+    
+    def get_serializer_class(self):
+        if self.action in ('list', 'recent', 'related'):
             return BlogPostListSerializer
+        if self.action == 'search':
+            return BlogPostSearchSerializer
+        if self.action == 'popular':
+            return BlogPostPopularSerializer
+        if self.action == 'categories':
+            return BlogCategoryStatSerializer
         return BlogPostSerializer
     
+    def is_plain_json_request(self, request):
+        """True for JSON requests without options that change the payload"""
+        return request.accepted_renderer.format == 'json' and set(request.query_params) <= {'format'}
+    
+    def get_conditional_labels(self, model):
+        labels = super().get_conditional_labels(model)
+        if self.action == 'popular':
+            # Only the ranking is tracked, not the raw counters, so views
+            # never invalidate the other blog responses
+            labels.append('blog.BlogPopularPost')
+        return labels
+    
+    def get_cache_tags(self):
+        tags = super().get_cache_tags()
+        if self.action == 'popular':
+            tags.append('blog.BlogPopularPost')
+        return tags
+    
+    def wants_navigation(self, request):
+        """``?nav=1`` adds the previous / next post links to detail responses"""
+        return request.query_params.get('nav') in ('1', 'true')
+    
+    def get_content_encoding(self):
+        return compression.choose_encoding(self.request.META.get('HTTP_ACCEPT_ENCODING'))
+    
+    def get_conditional_variant(self):
+        if self.action in ('retrieve', 'by_slug', 'content'):
+            return self.get_content_encoding()
+        return ''
+    
+    def get_encoded_response(self, kind, content_type):
+        """
+        Serve a stored BlogPostEncoding variant for the requested post in a
+        single query, or return None if there is no matching variant
+        """
+        encoding = self.get_content_encoding()
+        lookup = self.kwargs.get('slug') or self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        variants = BlogPostEncoding.objects.filter(kind=kind, encoding=encoding, post__is_published=True)
+        if 'slug' not in self.kwargs and slugs.is_pk(lookup):
+            variants = variants.filter(post_id=lookup)
+        elif slugs.get_pk(lookup) is not None:
+            variants = variants.filter(post_id=slugs.get_pk(lookup), post__slug=lookup)
+        else:
+            variants = variants.filter(post__slug=lookup)
+        
+        # (post, kind, encoding) is unique, so no ordering is needed
+        payloads = list(variants.values_list('payload', flat=True)[:1])
+        if not payloads:
+            return None
+        response = HttpResponse(bytes(payloads[0]), content_type=content_type)
+        if encoding != 'identity':
+            response['Content-Encoding'] = encoding
+        return response
+    
+    def list(self, request, *args, **kwargs):
+        # Plain JSON list requests are answered from the pre-encoded snapshot
+        if self.is_plain_json_request(request):
+            payload = snapshots.get_payload(snapshots.PUBLISHED_LIST)
+            return HttpResponse(payload, content_type=request.accepted_renderer.media_type)
+        return super().list(request, *args, **kwargs)
+    
     @action(detail=False, methods=['get'])
     def featured(self, request):
-        featured_post = BlogPost.objects.filter(is_published=True, featured=True).first()
+        featured_post = featured_posts.get_post(self.restrict_fields(BlogPost.objects.all()))
         if featured_post:
-            serializer = BlogPostSerializer(featured_post)
+            serializer = self.get_serializer(featured_post)
             return Response(serializer.data)
         return Response(None)
     
     @action(detail=False, methods=['get'])
     def recent(self, request):
-        recent_posts = BlogPost.objects.filter(is_published=True, featured=False)[:5]
-        serializer = BlogPostListSerializer(recent_posts, many=True)
+        recent_posts = self.restrict_fields(BlogPost.objects.filter(is_published=True, featured=False))[:5]
+        serializer = self.get_serializer(recent_posts, many=True)
         return Response(serializer.data)
     
-    def retrieve(self, request, pk=None):
+    @action(detail=False, methods=['get'])
+    def categories(self, request):
         """
-        Override retrieve to support slug-based lookup
+        Published post count and latest post date per category
         """
-        # Try to get by ID first
-        try:
-            post = self.get_object()
-        except:
-            # If ID lookup fails, try slug
-            post = BlogPost.objects.filter(slug=pk, is_published=True).first()
-            if not post:
-                from rest_framework.exceptions import NotFound
-                raise NotFound("Blog post not found")
+        stats = BlogCategoryStat.objects.filter(post_count__gt=0)
+        serializer = self.get_serializer(stats, many=True)
+        return Response(serializer.data)
+    
+    @action(detail=False, methods=['get'])
+    def popular(self, request):
+        """
+        Most viewed published posts, from the ranking rebuilt on each view count flush
+        """
+        limit = get_int_param(request, 'limit', 10, 1, viewcounts.POPULAR_SIZE)
+        # The ranking table is tiny, so read it first and fetch the posts by id
+        ranking = dict(BlogPopularPost.objects.values_list('post_id', 'view_count'))
+        posts = BlogPost.objects.filter(pk__in=ranking, is_published=True).order_by().defer('content', 'toc')
+        order = {post_id: index for index, post_id in enumerate(ranking)}
+        posts = sorted(self.restrict_fields(posts), key=lambda post: order[post.pk])[:limit]
+        for post in posts:
+            post.view_count = ranking[post.pk]
+        serializer = self.get_serializer(posts, many=True)
+        return Response(serializer.data)
+    
+    @action(detail=False, methods=['get'])
+    def search(self, request):
+        """
+        Full-text search over title, excerpt and content, best match first
+        """
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            raise ValidationError({'q': 'This query parameter is required.'})
+        limit = get_int_param(request, 'limit', 20, 1, 50)
+        
+        posts = search.search(query, limit=limit)
+        serializer = self.get_serializer(posts, many=True)
+        return Response(serializer.data)
+    
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        # Cached and 304 responses count too; the counter is write-behind.
+        # Requests of the static export are not views.
+        if (self.action in ('retrieve', 'by_slug') and request.method == 'GET'
+                and response.status_code in (200, 304) and not export.is_export_request(request)):
+            viewcounts.record(self.kwargs.get('slug') or self.kwargs[self.lookup_url_kwarg or self.lookup_field])
+        return response
+    
+    def retrieve(self, request, *args, **kwargs):
+        response = None
+        if self.is_plain_json_request(request):
+            response = self.get_encoded_response('detail', request.accepted_renderer.media_type)
+        if response is None:
+            response = super().retrieve(request, *args, **kwargs)
+        patch_vary_headers(response, ['Accept-Encoding'])
+        return response
+    
+    @action(detail=True, methods=['get'])
+    def content(self, request, pk=None):
+        """
+        Raw content HTML, served from the pre-compressed variants
+        """
+        content_type = 'text/html; charset=utf-8'
+        response = self.get_encoded_response('content', content_type)
+        if response is None:
+            response = HttpResponse(self.get_object().content, content_type=content_type)
+        patch_vary_headers(response, ['Accept-Encoding'])
+        return response
+    
+    def get_object(self):
+        """
+        Resolve the post from either a numeric ID or a slug in one query
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action in ('retrieve', 'by_slug') and self.wants_navigation(self.request):
+            queryset = navigation.with_neighbours(queryset)
+        lookup = self.kwargs.get('slug') or self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        
+        post = None
+        if 'slug' not in self.kwargs and slugs.is_pk(lookup):
+            post = queryset.filter(pk=lookup).first()
+        if post is None:
+            post = slugs.resolve(queryset, lookup)
+        if post is None:
+            raise NotFound("Blog post not found")
         
-        serializer = self.get_serializer(post)
-        return Response(serializer.data)
\ No newline at end of file
+        self.check_object_permissions(self.request, post)
+        return post
+    
+    @action(detail=False, methods=['get'], url_path=r'by-slug/(?P<slug>[-\w]+)')
+    def by_slug(self, request, slug=None):
+        """
+        Retrieve a post by slug only
+        """
+        return self.retrieve(request, slug=slug)
+    
+    @action(detail=True, methods=['get'])
+    def sections(self, request, pk=None):
+        """
+        Table of contents plus the first ``count`` sections of the content
+        """
+        post = self.get_object()
+        count = get_int_param(request, 'count', 2, 0, len(post.toc))
+        return Response({
+            'id': post.id,
+            'slug': post.slug,
+            'title': post.title,
+            'toc': [
+                {key: entry[key] for key in ('index', 'anchor', 'level', 'title')}
+                for entry in post.toc
+            ],
+            'sections': read_sections(post, post.toc[:count]),
+        })
+    
+    @action(detail=True, methods=['get'], url_path=r'sections/(?P<index>\d+)')
+    def section(self, request, pk=None, index=None):
+        """
+        A single section of the content by its TOC index
+        """
+        post = self.get_object()
+        index = int(index)
+        if index >= len(post.toc):
+            raise NotFound("Section not found")
+        return Response(read_sections(post, [post.toc[index]])[0])
+    
+    @action(detail=True, methods=['get'])
+    def related(self, request, pk=None):
+        """
+        Top-k most similar published posts, from the precomputed neighbour lists
+        """
+        limit = get_int_param(request, 'limit', 5, 1, related_posts.TOP_K)
+        lookup = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        if slugs.is_pk(lookup):
+            source = {'related_from__post_id': lookup}
+        else:
+            source = {'related_from__post__slug': lookup}
+        posts = BlogPost.objects.filter(
+            is_published=True, related_from__post__is_published=True, **source
+        ).order_by('related_from__rank').defer('content', 'toc')
+        posts = list(self.restrict_fields(posts)[:limit])
+        if not posts:
+            # Distinguish "no related posts" from an unknown post
+            self.get_object()
+        serializer = self.get_serializer(posts, many=True)
+        return Response(serializer.data)
+
+
+class BlogArchiveViewSet(ResponseCacheMixin, ConditionalGetMixin, SparseFieldsMixin, viewsets.GenericViewSet):
+    """
+    Year/month buckets of published posts, read from the BlogArchiveStat
+    rollup, and the published posts of a single month
+    """
+    queryset = BlogArchiveStat.objects.filter(post_count__gt=0)
+    serializer_class = BlogArchiveStatSerializer
+    pagination_class = None
+    sparse_field_actions = ('list',)
+    # Month pages serialize the posts themselves
+    conditional_dependencies = ['blog.BlogPost']
+    
+    def get_serializer_class(self):
+        if self.action == 'month':
+            return BlogPostListSerializer
+        return super().get_serializer_class()
+    
+    def list(self, request):
+        serializer = self.get_serializer(self.get_queryset(), many=True)
+        return Response(serializer.data)
+    
+    @action(detail=False, methods=['get'], url_path=r'(?P<year>\d{4})/(?P<month>\d{2})')
+    def month(self, request, year=None, month=None):
+        """
+        Published posts dated within the month, newest first
+        """
+        year, month = int(year), int(month)
+        if not 1 <= year < 9999 or not 1 <= month <= 12:
+            raise NotFound("Archive month not found")
+        # A date range rather than __year/__month lookups, so the date index is used
+        start = date(year, month, 1)
+        end = date(year + month // 12, month % 12 + 1, 1)
+        posts = BlogPost.objects.filter(is_published=True, date__gte=start, date__lt=end).defer('content', 'toc')
+        serializer = self.get_serializer(self.restrict_fields(posts), many=True)
+        return Response(serializer.data)
+
+
+def xml_response(request, rows, render, content_type, *etag_parts):
+    """
+    Answer a feed / sitemap request built from ``[(id, updated_at)]`` rows,
+    with 304 handling before any fragment is looked up
+    """
+    etag = quote_etag(feeds.get_etag(rows, request.path, *etag_parts))
+    # The rows cannot show a post that was unpublished or deleted; the
+    # BlogPost counter's timestamp does
+    versions = versioning.get_versions([BlogPost._meta.label]).values()
+    updated = max([updated_at for _, updated_at in rows] + [updated_at for _, updated_at in versions], default=None)
+    last_modified = timegm(updated.utctimetuple()) if updated else None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = HttpResponse(render(), content_type=content_type)
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+@require_safe
+def rss_feed(request):
+    rows = feeds.get_feed_rows()
+    return xml_response(request, rows, lambda: feeds.render_feed('rss', rows), feeds.RssFeed.content_type)
+
+
+@require_safe
+def atom_feed(request):
+    rows = feeds.get_feed_rows()
+    return xml_response(request, rows, lambda: feeds.render_feed('atom', rows), feeds.AtomFeed.content_type)
+
+
+@require_safe
+def sitemap(request):
+    """The sitemap, or a sitemap index once it outgrows one file"""
+    rows = feeds.get_sitemap_rows()
+    pages = feeds.sitemap_page_count(rows)
+    if pages > 1:
+        return xml_response(request, rows, lambda: feeds.render_sitemap_index(rows), feeds.SITEMAP_CONTENT_TYPE, pages)
+    return xml_response(request, rows, lambda: feeds.render_sitemap(rows), feeds.SITEMAP_CONTENT_TYPE)
+
+
+@require_safe
+def sitemap_page(request, page):
+    rows = feeds.get_sitemap_rows()
+    if not 1 <= page <= feeds.sitemap_page_count(rows):
+        raise Http404('Sitemap page not found')
+    start, end = feeds.page_slice(page)
+    return xml_response(
+        request, rows[start:end], lambda: feeds.render_sitemap(rows, page), feeds.SITEMAP_CONTENT_TYPE,
+    )
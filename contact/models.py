@@ -1,5 +1,7 @@
 from django.db import models
 
+from core.versioning import TrackedQuerySet
+
 
 class ContactInfo(models.Model):
     email = models.EmailField()
@@ -9,6 +11,8 @@ class ContactInfo(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = TrackedQuerySet.as_manager()
+    
     class Meta:
         verbose_name_plural = 'Contact Info'
     
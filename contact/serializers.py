@@ -1,11 +1,14 @@
 from rest_framework import serializers
+from core.fast import FastListSerializer
+from core.serializers import DynamicFieldsModelSerializer
 from .models import ContactInfo, ContactSubmission
 
 
-class ContactInfoSerializer(serializers.ModelSerializer):
+class ContactInfoSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = ContactInfo
         fields = ['id', 'email', 'phone', 'location', 'is_active']
+        list_serializer_class = FastListSerializer
 
 
 class ContactSubmissionSerializer(serializers.ModelSerializer):
@@ -2,17 +2,19 @@ from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
+from core.mixins import ConditionalGetMixin, ResponseCacheMixin, SparseFieldsMixin
 from .models import ContactInfo, ContactSubmission
 from .serializers import ContactInfoSerializer, ContactSubmissionSerializer
 
 
-class ContactInfoViewSet(viewsets.ReadOnlyModelViewSet):
+class ContactInfoViewSet(ResponseCacheMixin, ConditionalGetMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     queryset = ContactInfo.objects.filter(is_active=True)
     serializer_class = ContactInfoSerializer
+    sparse_field_actions = ('list', 'retrieve', 'current')
     
     @action(detail=False, methods=['get'])
     def current(self, request):
-        contact_info = ContactInfo.objects.filter(is_active=True).first()
+        contact_info = self.get_queryset().first()
         if contact_info:
             serializer = self.get_serializer(contact_info)
             return Response(serializer.data)
@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import ContentVersion
+
+
+@admin.register(ContentVersion)
+class ContentVersionAdmin(admin.ModelAdmin):
+    list_display = ['label', 'version', 'updated_at']
+    readonly_fields = ['label', 'version', 'updated_at']
+    ordering = ['label']
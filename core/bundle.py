@@ -0,0 +1,146 @@
+"""
+Homepage bundle: every section the landing page needs in one response.
+
+Each section lists the model labels it reads. Their ContentVersion counters
+(one query for all of them) give every section an ETag without touching the
+content tables, and the section data is cached under that ETag, so after a
+change only the affected sections are rebuilt, with one query per table.
+"""
+import hashlib
+
+from django.core.cache import cache
+
+from about.models import AboutContent, AboutHighlight
+from about.serializers import AboutContentSerializer, AboutHighlightSerializer
+from blog import featured
+from blog.models import BlogPost
+from blog.serializers import BlogPostListSerializer, BlogPostSerializer
+from contact.models import ContactInfo
+from contact.serializers import ContactInfoSerializer
+from experience.models import Experience
+from experience.serializers import ExperienceSerializer
+from services.models import Service
+from services.serializers import ServiceSerializer
+from technologies.models import Technology
+from technologies.serializers import TechnologySerializer
+
+from . import versioning
+
+CACHE_PREFIX = 'bundle'
+CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def build_services():
+    services = Service.objects.filter(is_active=True).prefetch_related('features')
+    return ServiceSerializer(services, many=True).data
+
+
+def build_about_content():
+    return AboutContentSerializer(AboutContent.objects.filter(is_active=True), many=True).data
+
+
+def build_about_highlights():
+    return AboutHighlightSerializer(AboutHighlight.objects.filter(is_active=True), many=True).data
+
+
+def build_experience():
+    experiences = Experience.objects.filter(is_active=True).prefetch_related('achievements')
+    return ExperienceSerializer(experiences, many=True).data
+
+
+def build_technologies():
+    return TechnologySerializer(Technology.objects.filter(is_active=True), many=True).data
+
+
+def build_contact():
+    contact_info = ContactInfo.objects.filter(is_active=True).first()
+    return ContactInfoSerializer(contact_info).data if contact_info else None
+
+
+def build_blog_featured():
+    featured_post = featured.get_post()
+    return BlogPostSerializer(featured_post).data if featured_post else None
+
+
+def build_blog_recent():
+    recent_posts = BlogPost.objects.filter(is_published=True, featured=False).defer('content', 'toc')[:5]
+    return BlogPostListSerializer(recent_posts, many=True).data
+
+
+# (section name, model labels it depends on, builder), in response order
+SECTIONS = [
+    ('services', ['services.Service', 'services.ServiceFeature'], build_services),
+    ('about_content', ['about.AboutContent'], build_about_content),
+    ('about_highlights', ['about.AboutHighlight'], build_about_highlights),
+    ('experience', ['experience.Experience', 'experience.ExperienceAchievement'], build_experience),
+    ('technologies', ['technologies.Technology'], build_technologies),
+    ('contact', ['contact.ContactInfo'], build_contact),
+    ('blog_featured', ['blog.BlogPost'], build_blog_featured),
+    ('blog_recent', ['blog.BlogPost'], build_blog_recent),
+]
+
+LABELS = sorted({label for _, labels, _ in SECTIONS for label in labels})
+
+
+def _hash(text):
+    return hashlib.md5(text.encode('utf-8')).hexdigest()
+
+
+def get_state():
+    """
+    Return ``({section: etag}, last_modified)`` from the current
+    ContentVersion counters
+    """
+    versions = versioning.get_versions(LABELS)
+    # The timestamps keep ETags unique if the counters are ever reset
+    tags = {
+        label: f'{label}:{version}:{updated_at.isoformat()}'
+        for label, (version, updated_at) in versions.items()
+    }
+    etags = {}
+    for name, labels, _ in SECTIONS:
+        etags[name] = _hash('|'.join([name] + [tags.get(label, f'{label}:0') for label in labels]))
+    timestamps = [updated_at for _, updated_at in versions.values()]
+    return etags, max(timestamps) if timestamps else None
+
+
+def get_bundle_etag(etags):
+    return _hash('|'.join(etags[name] for name, _, _ in SECTIONS))
+
+
+def get_sections(etags, skip=()):
+    """
+    Return ``{section: {'etag': ..., 'data': ...}}`` in response order.
+    Sections in ``skip`` (names whose ETag the client already has) are
+    returned as ``{'etag': ..., 'unchanged': True}`` without being built.
+    """
+    wanted = [name for name, _, _ in SECTIONS if name not in skip]
+    keys = {name: f'{CACHE_PREFIX}:section:{name}:{etags[name]}' for name in wanted}
+    cached = cache.get_many(keys.values())
+
+    sections = {}
+    missing = {}
+    for name, _, builder in SECTIONS:
+        if name in skip:
+            sections[name] = {'etag': etags[name], 'unchanged': True}
+            continue
+        key = keys[name]
+        if key not in cached:
+            cached[key] = missing[key] = builder()
+        sections[name] = {'etag': etags[name], 'data': cached[key]}
+    if missing:
+        cache.set_many(missing, CACHE_TIMEOUT)
+    return sections
+
+
+def get_rendered(etags, renderer):
+    """
+    The full bundle rendered with ``renderer``, cached per format and
+    bundle ETag
+    """
+    key = f'{CACHE_PREFIX}:{renderer.format}:{get_bundle_etag(etags)}'
+    payload = cache.get(key)
+    if payload is None:
+        payload = renderer.render(get_sections(etags))
+        cache.set(key, payload, CACHE_TIMEOUT)
+    return payload
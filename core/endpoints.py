@@ -0,0 +1,85 @@
+"""
+Enumerate the concrete GET URLs of the public API.
+
+Walks the URL patterns included from ``backend/urls.py`` under ``api/``,
+keeps the viewset routes that answer GET (skipping the router root views
+and the ``.<format>`` suffix variants) plus plain API views without URL
+arguments, such as the homepage bundle, and fills in URL arguments from
+the first published object so every endpoint can be requested, e.g. by
+benchmarks, parity checks and the static export.
+"""
+from django.urls import URLResolver, get_resolver, reverse
+from rest_framework.routers import APIRootView
+
+API_PREFIX = 'api/'
+
+# Query parameters needed for routes that require them, by URL name
+DEFAULT_PARAMS = {
+    'blogpost-search': {'q': 'django'},
+}
+
+# Zero padding of URL arguments read from model fields (archive year/month)
+ARG_FORMATS = {
+    'year': '{:04d}',
+    'month': '{:02d}',
+}
+
+
+def _walk(patterns, prefix=''):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _walk(pattern.url_patterns, prefix + str(pattern.pattern))
+        else:
+            yield prefix + str(pattern.pattern), pattern
+
+
+def _url_kwargs(viewset, pattern):
+    """Values for the pattern's URL arguments, or None if there is no data"""
+    kwargs = {}
+    for name in pattern.pattern.regex.groupindex:
+        if name == 'index':
+            kwargs[name] = 0
+            continue
+        instance = viewset.queryset.order_by('pk').first()
+        if instance is None:
+            return None
+        if name in ARG_FORMATS:
+            kwargs[name] = ARG_FORMATS[name].format(getattr(instance, name))
+        else:
+            kwargs[name] = instance.slug if name == 'slug' else instance.pk
+    return kwargs
+
+
+def get_routes():
+    """
+    Return ``[(url name, view class, action, url pattern)]`` for GET routes.
+    The action of a plain API view is ``'get'``.
+    """
+    routes = []
+    for route, pattern in _walk(get_resolver().url_patterns):
+        callback = pattern.callback
+        view = getattr(callback, 'cls', None)
+        actions = getattr(callback, 'actions', None)
+        if not route.startswith(API_PREFIX) or view is None or 'format' in pattern.pattern.regex.groupindex:
+            continue
+        if actions is None:
+            # Plain API views, except the router root views
+            if issubclass(view, APIRootView) or pattern.pattern.regex.groupindex or not hasattr(view, 'get'):
+                continue
+            actions = {'get': 'get'}
+        if 'get' not in actions or 'get' not in view.http_method_names:
+            continue
+        routes.append((pattern.name, view, actions['get'], pattern))
+    return routes
+
+
+def iter_endpoints():
+    """
+    Yield ``(url name, action, path, query params)`` for every GET route that
+    can be resolved against the current data
+    """
+    for name, viewset, action, pattern in get_routes():
+        kwargs = _url_kwargs(viewset, pattern)
+        if kwargs is None:
+            continue
+        yield name, action, reverse(name, kwargs=kwargs), dict(DEFAULT_PARAMS.get(name, {}))
@@ -0,0 +1,188 @@
+"""
+Static export of the public API.
+
+Every GET endpoint found by ``core.endpoints`` is requested through the
+regular views and written under an output directory, mirroring the URL:
+``/api/blog/posts/3/`` becomes ``api/blog/posts/3/index.json``, next to
+``index.json.gz`` and ``index.json.br`` for ``gzip_static`` /
+``brotli_static``. Detail routes are exported for every object, blog posts
+both by id and by slug. Routes that need query parameters (search) or
+extra URL arguments (single sections) stay dynamic.
+
+``manifest.json`` records the SHA-256 of every exported file. A re-export
+only rewrites (and recompresses) files whose content changed and removes
+files for objects that no longer exist. All files are written to a
+temporary name and moved into place, so readers never see partial files.
+
+Export requests are built in-process and marked with an attribute that no
+client can set, so views can tell them apart from real traffic, e.g. to
+leave the blog view counters alone.
+"""
+import hashlib
+import io
+import json
+import os
+import tempfile
+from pathlib import Path
+from urllib.parse import unquote_to_bytes
+
+from django.core.handlers.wsgi import WSGIRequest
+from django.urls import resolve, reverse
+
+from blog import slugs
+from blog.compression import COMPRESSORS
+
+from .endpoints import DEFAULT_PARAMS, get_routes
+
+MANIFEST = 'manifest.json'
+INDEX = 'index'
+
+# File extension by response media type
+EXTENSIONS = {
+    'application/json': 'json',
+    'text/html': 'html',
+}
+
+# Suffix of the precompressed sibling per content-coding
+SUFFIXES = {'gzip': 'gz', 'br': 'br'}
+
+LOOKUP_ARGS = {'pk', 'slug'}
+
+def is_export_request(request):
+    """True if the request was made by the static export"""
+    return getattr(request, '_static_export', False)
+
+
+def _lookups(view, args):
+    """Yield URL kwargs for every object a detail route can serve"""
+    model = view.queryset.model
+    has_slug = any(field.name == 'slug' for field in model._meta.concrete_fields)
+    fields = ['pk', 'slug'] if has_slug else ['pk']
+    for row in view.queryset.order_by('pk').values_list(*fields):
+        pk, slug = row[0], row[1] if has_slug else None
+        if 'slug' in args:
+            if slug:
+                yield {'slug': slug}
+            continue
+        yield {'pk': pk}
+        # Detail routes of models with a slug accept it in place of the id
+        if slug and not slugs.is_pk(slug):
+            yield {'pk': slug}
+
+
+def iter_paths():
+    """Yield the URL path of every exportable GET endpoint"""
+    for name, view, action, pattern in get_routes():
+        if name in DEFAULT_PARAMS:
+            continue
+        args = set(pattern.pattern.regex.groupindex)
+        if not args:
+            yield reverse(name)
+        elif args <= LOOKUP_ARGS:
+            for kwargs in _lookups(view, args):
+                yield reverse(name, kwargs=kwargs)
+
+
+def build_request(path, host):
+    """A bare GET request for ``path``, as the WSGI handler would build it"""
+    request = WSGIRequest({
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': unquote_to_bytes(path).decode('iso-8859-1'),
+        'SCRIPT_NAME': '',
+        'QUERY_STRING': '',
+        'SERVER_NAME': host,
+        'SERVER_PORT': '80',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'HTTP_ACCEPT': 'application/json',
+        'wsgi.url_scheme': 'http',
+        'wsgi.input': io.BytesIO(),
+    })
+    request._static_export = True
+    return request
+
+
+def fetch(path, host):
+    """Run a GET request for ``path`` through its view, skipping the middleware"""
+    request = build_request(path, host)
+    match = resolve(request.path_info)
+    response = match.func(request, *match.args, **match.kwargs)
+    if hasattr(response, 'render'):
+        response.render()
+    return response
+
+
+def file_name(path, content_type):
+    """Output file for a URL path, relative to the export root"""
+    media_type = content_type.split(';')[0].strip()
+    extension = EXTENSIONS.get(media_type, 'json')
+    return f"{path.strip('/')}/{INDEX}.{extension}"
+
+
+def write_atomic(target, data):
+    """Write bytes to ``target`` through a temporary file in the same directory"""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f'.{target.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as handle:
+            handle.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_manifest(root):
+    try:
+        with open(root / MANIFEST, 'rb') as handle:
+            return json.load(handle)['files']
+    except (FileNotFoundError, ValueError, KeyError):
+        return {}
+
+
+def _remove(root, name):
+    for candidate in [name] + [f'{name}.{suffix}' for suffix in SUFFIXES.values()]:
+        path = root / candidate
+        path.unlink(missing_ok=True)
+        # Drop directories left empty, up to the export root
+        parent = path.parent
+        while parent != root and parent.is_dir() and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+
+
+def export(root, host='localhost', force=False):
+    """
+    Export every endpoint under ``root``. Returns counts of written,
+    unchanged and removed files.
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    previous = {} if force else load_manifest(root)
+
+    files = {}
+    stats = {'written': 0, 'unchanged': 0, 'removed': 0}
+    for path in iter_paths():
+        response = fetch(path, host)
+        if response.status_code != 200 or response.has_header('Content-Encoding'):
+            continue
+        name = file_name(path, response['Content-Type'])
+        data = response.content
+        digest = hashlib.sha256(data).hexdigest()
+        files[name] = digest
+        if previous.get(name) == digest and (root / name).exists():
+            stats['unchanged'] += 1
+            continue
+
+        write_atomic(root / name, data)
+        for encoding, compress in COMPRESSORS.items():
+            write_atomic(root / f'{name}.{SUFFIXES[encoding]}', compress(data))
+        stats['written'] += 1
+
+    for name in set(previous) - set(files):
+        _remove(root, name)
+        stats['removed'] += 1
+
+    manifest = {'files': dict(sorted(files.items()))}
+    write_atomic(root / MANIFEST, json.dumps(manifest, indent=2).encode('utf-8'))
+    return stats
@@ -0,0 +1,251 @@
+"""
+values()-based serialization for read-only list responses.
+
+A ModelSerializer builds a model instance per row, walks its fields and
+dispatches ``to_representation`` for every value. For the plain read
+serializers in this project most of that work is a no-op: CharField,
+IntegerField, BooleanField and FloatField return the database value as is.
+
+``compile_serializer()`` turns a serializer instance into a plan over a
+single ``values_list()`` query: columns that need no conversion are read
+straight from the row tuple, everything else (dates, datetimes, choices)
+goes through the original field's ``to_representation`` (datetimes through
+an equivalent converter that looks the time zone up once per batch),
+properties listed
+in ``Meta.field_dependencies`` are evaluated against the row, and nested
+``many=True`` serializers over reverse relations are fetched with one
+query per batch, in the same order ``prefetch_related`` would use. The
+output is identical to the serializer's. Serializers with anything else
+(method fields, dotted sources, ...) are not compiled and keep the regular
+path.
+"""
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework import ISO_8601
+from rest_framework import fields as drf_fields
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+# to_representation() implementations that return database values unchanged
+PASSTHROUGH = {
+    drf_fields.CharField.to_representation,
+    drf_fields.IntegerField.to_representation,
+    drf_fields.BooleanField.to_representation,
+    drf_fields.FloatField.to_representation,
+    drf_fields.ReadOnlyField.to_representation,
+}
+
+BATCH_SIZE = 500
+
+_cache = {}
+
+
+class NotCompilable(Exception):
+    pass
+
+
+# Getters take the value tuple and a per-batch context holding the nested
+# rows by relation name and the active time zone.
+
+def _column_getter(index, convert):
+    if convert is None:
+        return lambda row, context: row[index]
+
+    def getter(row, context):
+        value = row[index]
+        return None if value is None else convert(value)
+    return getter
+
+
+def _is_plain_datetime_field(field):
+    """True if the field renders with DRF's default ISO 8601 datetime logic"""
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    return (
+        type(field).to_representation is drf_fields.DateTimeField.to_representation
+        and not hasattr(field, 'timezone')
+        and output_format is not None
+        and output_format.lower() == ISO_8601
+    )
+
+
+def _datetime_getter(index, field):
+    """
+    DateTimeField.to_representation for aware datetimes, using the time zone
+    looked up once per batch instead of once per value
+    """
+    def getter(row, context):
+        value = row[index]
+        if value is None:
+            return None
+        if context['timezone'] is None or isinstance(value, str) or not timezone.is_aware(value):
+            return field.to_representation(value)
+        value = value.astimezone(context['timezone']).isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return getter
+
+
+def _property_getter(fget, names, indexes):
+    def getter(row, context):
+        return fget(SimpleNamespace(**{name: row[index] for name, index in zip(names, indexes)}))
+    return getter
+
+
+def _related_getter(name, pk_index):
+    return lambda row, context: context['related'][name].get(row[pk_index], [])
+
+
+class CompiledSerializer:
+    """
+    Serialization plan for one serializer and field set. ``prefix`` columns
+    (e.g. the foreign key of a nested relation) are selected before the
+    serializer's own columns.
+    """
+
+    def __init__(self, serializer, prefix=()):
+        self.model = serializer.Meta.model
+        opts = self.model._meta
+        dependencies = getattr(serializer.Meta, 'field_dependencies', {})
+        concrete = {field.name: field for field in opts.concrete_fields}
+
+        self.columns = list(prefix) + [opts.pk.attname]
+        self.pk_index = len(prefix)
+        self.relations = []
+        self.getters = []
+
+        def column(name):
+            attname = concrete[name].attname
+            if attname not in self.columns:
+                self.columns.append(attname)
+            return self.columns.index(attname)
+
+        for name, field in serializer.fields.items():
+            source = field.source
+            if isinstance(field, serializers.ListSerializer):
+                self.getters.append((name, self.compile_relation(name, source, field.child)))
+            elif isinstance(field, serializers.BaseSerializer):
+                raise NotCompilable(name)
+            elif source in concrete and not concrete[source].is_relation:
+                if _is_plain_datetime_field(field):
+                    self.getters.append((name, _datetime_getter(column(source), field)))
+                    continue
+                convert = field.to_representation
+                if type(field).to_representation in PASSTHROUGH:
+                    convert = None
+                self.getters.append((name, _column_getter(column(source), convert)))
+            elif (
+                source in dependencies
+                and isinstance(field, drf_fields.ReadOnlyField)
+                and isinstance(getattr(self.model, source, None), property)
+            ):
+                names = dependencies[source]
+                indexes = [column(dependency) for dependency in names]
+                self.getters.append((name, _property_getter(getattr(self.model, source).fget, names, indexes)))
+            else:
+                raise NotCompilable(name)
+
+    def compile_relation(self, name, source, child):
+        try:
+            relation = self.model._meta.get_field(source)
+        except FieldDoesNotExist:
+            raise NotCompilable(name)
+        if not relation.one_to_many:
+            raise NotCompilable(name)
+        foreign_key = relation.field
+        self.relations.append((name, foreign_key.name, CompiledSerializer(child, prefix=(foreign_key.attname,))))
+        return _related_getter(name, self.pk_index)
+
+    def fetch_related(self, rows):
+        """Group the nested rows of every relation by parent pk"""
+        related = {}
+        if not self.relations:
+            return related
+        pks = [row[self.pk_index] for row in rows]
+        for name, lookup, child in self.relations:
+            # The default manager gives the same ordering as prefetch_related()
+            queryset = child.model._default_manager.filter(**{f'{lookup}__in': pks})
+            groups = {}
+            for row, item in child.build(list(queryset.values_list(*child.columns))):
+                groups.setdefault(row[0], []).append(item)
+            related[name] = groups
+        return related
+
+    def build(self, rows):
+        """Yield ``(row, representation)`` for a batch of value tuples"""
+        context = {
+            'related': self.fetch_related(rows),
+            'timezone': timezone.get_current_timezone() if settings.USE_TZ else None,
+        }
+        getters = self.getters
+        for row in rows:
+            yield row, {name: getter(row, context) for name, getter in getters}
+
+    def serialize(self, queryset):
+        """Return the list of representations for ``queryset``"""
+        rows = list(queryset.prefetch_related(None).values_list(*self.columns))
+        data = []
+        for start in range(0, len(rows), BATCH_SIZE):
+            data.extend(item for _, item in self.build(rows[start:start + BATCH_SIZE]))
+        return data
+
+    def iterate(self, queryset, batch_size=BATCH_SIZE):
+        """Yield the representation of every row in ``queryset`` without caching the rows"""
+        rows = queryset.prefetch_related(None).values_list(*self.columns)
+        batch = []
+        for row in rows.iterator(chunk_size=batch_size):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                for _, item in self.build(batch):
+                    yield item
+                batch = []
+        for _, item in self.build(batch):
+            yield item
+
+
+def compile_serializer(serializer):
+    """
+    Return the CompiledSerializer for a (possibly field-pruned) serializer
+    instance, or None if it cannot be served from ``values()``
+    """
+    key = (type(serializer), tuple(serializer.fields))
+    if key not in _cache:
+        try:
+            _cache[key] = CompiledSerializer(serializer)
+        except NotCompilable:
+            _cache[key] = None
+    return _cache[key]
+
+
+class FastListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer that serializes unevaluated querysets through a
+    CompiledSerializer, and anything else (lists, evaluated or raw querysets,
+    uncompilable serializers) the usual way
+    """
+
+    def get_compiled(self, data):
+        if not isinstance(data, QuerySet) or data._result_cache is not None:
+            return None
+        if data.model is not self.child.Meta.model:
+            return None
+        return compile_serializer(self.child)
+
+    def to_representation(self, data):
+        compiled = self.get_compiled(data)
+        if compiled is None:
+            return super().to_representation(data)
+        return compiled.serialize(data)
+
+    def iter_representation(self, data, chunk_size=BATCH_SIZE):
+        """Yield one representation at a time, for streaming responses"""
+        compiled = self.get_compiled(data)
+        if compiled is not None:
+            return compiled.iterate(data, batch_size=chunk_size)
+        if isinstance(data, QuerySet):
+            data = data.iterator(chunk_size=chunk_size)
+        return (self.child.to_representation(item) for item in data)
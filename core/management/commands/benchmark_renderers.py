@@ -0,0 +1,132 @@
+"""
+Django management command to benchmark the response renderers
+Renders the data of every API endpoint with DRF's JSONRenderer, the orjson
+renderer and the MessagePack renderer, checks that the outputs agree and
+reports throughput
+"""
+import json
+import time
+from datetime import date, timedelta
+
+import msgpack
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client
+from rest_framework.renderers import JSONRenderer
+from blog.models import BlogPost
+from core.endpoints import iter_endpoints
+from core.renderers import MessagePackRenderer, ORJSONRenderer
+
+RENDERERS = [
+    ('drf json', JSONRenderer()),
+    ('orjson', ORJSONRenderer()),
+    ('msgpack', MessagePackRenderer()),
+]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark and compare the JSON, orjson and MessagePack renderers over every API endpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=100,
+            help='Number of renders per renderer and endpoint (default: 100)',
+        )
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=200,
+            help='Number of temporary published blog posts to add for the run (default: 200)',
+        )
+        parser.add_argument(
+            '--content-size',
+            type=int,
+            default=20000,
+            help='Content length in characters of the temporary posts (default: 20000)',
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        client = Client()
+        mismatches = []
+        value_only = []
+        totals = [0.0] * len(RENDERERS)
+
+        # Temporary rows are bulk inserted (no signals) and rolled back afterwards
+        with transaction.atomic():
+            endpoints = list(iter_endpoints())
+            large = self.create_posts(options['rows'], options['content_size'])
+            if large is not None:
+                endpoints.append(('blogpost-detail (large)', 'retrieve', f'/api/blog/posts/{large.pk}/', {}))
+            self.stdout.write(f'{iterations} renders per renderer, time per render:')
+
+            for name, action, path, params in endpoints:
+                # An extra parameter skips the pre-encoded snapshot and variants
+                response = client.get(path, {**params, 'render': 'benchmark'}, HTTP_ACCEPT='application/json')
+                data = getattr(response, 'data', None)
+                if response.status_code != 200 or data is None:
+                    continue
+
+                timings = []
+                outputs = []
+                for index, (_, renderer) in enumerate(RENDERERS):
+                    outputs.append(renderer.render(data))
+                    start = time.perf_counter()
+                    for _ in range(iterations):
+                        renderer.render(data)
+                    elapsed = (time.perf_counter() - start) / iterations
+                    timings.append(elapsed)
+                    totals[index] += elapsed
+
+                expected = json.loads(outputs[0])
+                if outputs[1] != outputs[0]:
+                    # Floats in exponent notation are spelled differently (1e-06 / 1e-6)
+                    (value_only if json.loads(outputs[1]) == expected else mismatches).append(f'{name} (orjson)')
+                if msgpack.unpackb(outputs[2]) != expected:
+                    mismatches.append(f'{name} (msgpack)')
+
+                self.stdout.write(
+                    f'  {name:<24} {len(outputs[0]) / 1024:9.1f} KiB  '
+                    + '  '.join(
+                        f'{label} {elapsed * 1000:8.3f} ms'
+                        for (label, _), elapsed in zip(RENDERERS, timings)
+                    )
+                )
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(
+            '  total' + ' ' * 33 + '  '.join(
+                f'{label} {elapsed * 1000:8.3f} ms ({totals[0] / elapsed:4.1f}x)'
+                for (label, _), elapsed in zip(RENDERERS, totals)
+            )
+        )
+        if value_only:
+            self.stdout.write(self.style.WARNING(f"Same values but different bytes for: {', '.join(value_only)}"))
+        if mismatches:
+            self.stdout.write(self.style.ERROR(f"Output differs for: {', '.join(mismatches)}"))
+        else:
+            self.stdout.write(self.style.SUCCESS('All renderers agree on every endpoint'))
+
+    def create_posts(self, count, content_size):
+        start = date(2000, 1, 1)
+        paragraph = '<p>Benchmark “content” with unicode — and markup. </p>'
+        content = (paragraph * (content_size // len(paragraph) + 1))[:content_size]
+        BlogPost.objects.bulk_create(
+            [
+                BlogPost(
+                    title=f'Benchmark post {i}',
+                    slug=f'benchmark-renderer-post-{i}',
+                    excerpt='A short excerpt for the benchmark post.',
+                    content=content,
+                    date=start + timedelta(days=i % 5000),
+                    read_time='5 min read',
+                    category='Benchmark',
+                )
+                for i in range(count)
+            ],
+            batch_size=500,
+        )
+        return BlogPost.objects.filter(slug__startswith='benchmark-renderer-post-').order_by('pk').first()
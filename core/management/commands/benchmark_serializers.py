@@ -0,0 +1,113 @@
+"""
+Django management command to benchmark list serialization
+Compares the regular ModelSerializer path with the values()-based fast path
+(core.fast) for every read serializer, and checks both render the same JSON
+"""
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from about.models import AboutContent, AboutHighlight
+from about.serializers import AboutContentSerializer, AboutHighlightSerializer
+from blog.models import BlogCategoryStat, BlogPost
+from blog.serializers import BlogCategoryStatSerializer, BlogPostListSerializer, BlogPostSerializer
+from contact.models import ContactInfo
+from contact.serializers import ContactInfoSerializer
+from experience.models import Experience
+from experience.serializers import ExperienceSerializer
+from services.models import Service
+from services.serializers import ServiceSerializer
+from technologies.models import Technology
+from technologies.serializers import TechnologySerializer
+
+
+def get_cases():
+    return [
+        ('blog list', BlogPostListSerializer, BlogPost.objects.filter(is_published=True).defer('content', 'toc')),
+        ('blog detail fields', BlogPostSerializer, BlogPost.objects.filter(is_published=True)),
+        ('blog categories', BlogCategoryStatSerializer, BlogCategoryStat.objects.all()),
+        ('services', ServiceSerializer, Service.objects.filter(is_active=True).prefetch_related('features')),
+        ('experiences', ExperienceSerializer, Experience.objects.filter(is_active=True).prefetch_related('achievements')),
+        ('about content', AboutContentSerializer, AboutContent.objects.filter(is_active=True)),
+        ('about highlights', AboutHighlightSerializer, AboutHighlight.objects.filter(is_active=True)),
+        ('technologies', TechnologySerializer, Technology.objects.filter(is_active=True)),
+        ('contact info', ContactInfoSerializer, ContactInfo.objects.filter(is_active=True)),
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark ModelSerializer against the values()-based fast serializers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=50,
+            help='Number of serializations per path and endpoint (default: 50)',
+        )
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=1000,
+            help='Number of temporary published blog posts to add for the run (default: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        renderer = JSONRenderer()
+
+        # Temporary rows are bulk inserted (no signals) and rolled back afterwards
+        with transaction.atomic():
+            self.create_posts(options['rows'])
+            self.stdout.write(f'{iterations} serializations per path:')
+
+            mismatches = []
+            for name, serializer_class, queryset in get_cases():
+                # A list forces the regular per-instance path, a queryset the fast one
+                paths = [
+                    ('model', lambda: serializer_class(list(queryset.all()), many=True).data),
+                    ('fast', lambda: serializer_class(queryset.all(), many=True).data),
+                ]
+                timings = []
+                outputs = []
+                for _, serialize in paths:
+                    outputs.append(renderer.render(serialize()))
+                    start = time.perf_counter()
+                    for _ in range(iterations):
+                        serialize()
+                    timings.append((time.perf_counter() - start) / iterations)
+
+                rows = queryset.count()
+                self.stdout.write(
+                    f'  {name:<20} {rows:6d} rows  model {timings[0] * 1000:8.2f} ms  '
+                    f'fast {timings[1] * 1000:8.2f} ms  {timings[0] / timings[1]:5.2f}x'
+                )
+                if outputs[0] != outputs[1]:
+                    mismatches.append(name)
+
+            transaction.set_rollback(True)
+
+        if mismatches:
+            self.stdout.write(self.style.ERROR(f"Output differs for: {', '.join(mismatches)}"))
+        else:
+            self.stdout.write(self.style.SUCCESS('Both paths render identical JSON for every endpoint'))
+
+    def create_posts(self, count):
+        start = date(2000, 1, 1)
+        BlogPost.objects.bulk_create(
+            [
+                BlogPost(
+                    title=f'Benchmark post {i}',
+                    slug=f'benchmark-serializer-post-{i}',
+                    excerpt='A short excerpt for the benchmark post.',
+                    content='<p>Benchmark body</p>',
+                    date=start + timedelta(days=i % 5000),
+                    read_time='5 min read',
+                    category='Benchmark',
+                )
+                for i in range(count)
+            ],
+            batch_size=500,
+        )
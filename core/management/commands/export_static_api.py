@@ -0,0 +1,38 @@
+"""
+Django management command to export the public API as static files
+Renders every read endpoint to an output directory with gzip / brotli
+siblings, for nginx or a CDN to serve without running Python. Only files
+whose content changed since the last export are rewritten
+"""
+from django.core.management.base import BaseCommand
+from core import export
+
+
+class Command(BaseCommand):
+    help = 'Export every public API endpoint to static JSON files with precompressed siblings'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'output_dir',
+            help='Directory to write the exported files and manifest.json to',
+        )
+        parser.add_argument(
+            '--host',
+            default='localhost',
+            help='Host name to send the requests with; must be in ALLOWED_HOSTS (default: localhost)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Rewrite every file, ignoring the existing manifest',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Exporting the API to {options['output_dir']}...")
+        stats = export.export(options['output_dir'], host=options['host'], force=options['force'])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Export complete: {stats['written']} written, {stats['unchanged']} unchanged, "
+                f"{stats['removed']} removed"
+            )
+        )
@@ -0,0 +1,192 @@
+"""
+Reusable viewset mixins shared by the content apps.
+"""
+import hashlib
+from calendar import timegm
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from . import response_cache, versioning
+from .serializers import DynamicFieldsModelSerializer, has_sparse_fields
+
+
+def _has_updated_at(model):
+    return any(field.name == 'updated_at' for field in model._meta.concrete_fields)
+
+
+class ShortCircuit(Exception):
+    """Raised from ``initial()`` to return a ready-made response without running the handler"""
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
+class ConditionalGetMixin:
+    """
+    Send ETag / Last-Modified validators and answer conditional GETs with
+    304 before anything is serialized.
+
+    Validators are derived from cheap aggregates over ``get_queryset()``:
+    the row count and ``Max('updated_at')``, plus the ContentVersion
+    counters of the model and of any labels listed in
+    ``conditional_dependencies`` (e.g. nested rows that do not touch their
+    parent's timestamp). The model's own counter is always included: the
+    aggregates cannot see a row that was deleted or filtered out (e.g.
+    unpublished), so its timestamp is the lower bound of Last-Modified.
+    """
+    conditional_dependencies = ()
+
+    def get_conditional_labels(self, model):
+        return [model._meta.label, *self.conditional_dependencies]
+
+    def get_conditional_variant(self):
+        """
+        Extra representation details (e.g. the content-coding) that should
+        make the ETag differ between otherwise identical responses
+        """
+        return ''
+
+    def get_conditional_validators(self):
+        """Return ``(etag, last_modified)`` for the current request"""
+        queryset = self.filter_queryset(self.get_queryset()).order_by()
+        model = queryset.model
+
+        aggregates = {'count': Count('pk')}
+        if _has_updated_at(model):
+            aggregates['last_modified'] = Max('updated_at')
+        values = queryset.aggregate(**aggregates)
+        last_modified = values.get('last_modified')
+
+        parts = [
+            self.request.get_full_path(),
+            self.request.accepted_renderer.format,
+            self.get_conditional_variant(),
+            str(values['count']),
+            last_modified.isoformat() if last_modified else '',
+        ]
+        for label, (version, updated_at) in sorted(versioning.get_versions(self.get_conditional_labels(model)).items()):
+            parts.append(f'{label}:{version}')
+            if last_modified is None or updated_at > last_modified:
+                last_modified = updated_at
+
+        etag = quote_etag(hashlib.md5('|'.join(parts).encode('utf-8')).hexdigest())
+        return etag, last_modified
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.etag = self.last_modified = None
+        if request.method not in ('GET', 'HEAD'):
+            return
+
+        self.etag, self.last_modified = self.get_conditional_validators()
+        response = get_conditional_response(
+            request,
+            etag=self.etag,
+            last_modified=timegm(self.last_modified.utctimetuple()) if self.last_modified else None,
+        )
+        if response is not None:
+            raise ShortCircuit(response)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, ShortCircuit):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, 'etag', None) and response.status_code in (200, 304):
+            response.headers.setdefault('ETag', self.etag)
+            if self.last_modified:
+                response.headers.setdefault('Last-Modified', http_date(timegm(self.last_modified.utctimetuple())))
+        return response
+
+
+class ResponseCacheMixin:
+    """
+    Serve repeated GETs from the two-tier response cache
+    (``core.response_cache``).
+
+    Responses are tagged with the viewset's model, its
+    ``conditional_dependencies`` and any extra ``cache_dependencies``, and
+    keyed by path, format and conditional variant. On a hit the stored
+    ETag / Last-Modified also answer conditional requests, so the counter
+    lookup is the only query. List it before ConditionalGetMixin.
+    """
+    cache_dependencies = ()
+
+    def get_cache_tags(self):
+        labels = [self.queryset.model._meta.label, *self.conditional_dependencies, *self.cache_dependencies]
+        return sorted(set(labels))
+
+    def get_cache_key(self):
+        # The host is part of the key for absolute URLs such as pagination links
+        return response_cache.make_key(
+            self.request.get_host(),
+            self.request.get_full_path(),
+            self.request.accepted_renderer.format,
+            self.request.accepted_media_type or '',
+            self.get_conditional_variant(),
+        )
+
+    def get_cache_entry(self):
+        """Look the request up once, after content negotiation"""
+        if not self.cache_checked:
+            self.cache_checked = True
+            if self.request.method == 'GET':
+                self.cache_key = self.get_cache_key()
+                self.cache_signature = response_cache.get_signature(self.get_cache_tags())
+                self.cache_entry = response_cache.lookup(self.cache_key, self.cache_signature)
+        return self.cache_entry
+
+    def get_conditional_validators(self):
+        entry = self.get_cache_entry()
+        if entry is not None:
+            return entry.etag, entry.last_modified
+        return super().get_conditional_validators()
+
+    def initial(self, request, *args, **kwargs):
+        self.cache_checked = False
+        self.cache_key = self.cache_signature = self.cache_entry = None
+        super().initial(request, *args, **kwargs)
+        entry = self.get_cache_entry()
+        if entry is not None:
+            raise ShortCircuit(entry.to_response())
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.cache_key and self.cache_entry is None and response.status_code == 200 and not response.streaming:
+            if not getattr(response, 'is_rendered', True):
+                response.render()
+            entry = response_cache.CachedResponse.from_response(
+                response, self.cache_signature, getattr(self, 'etag', None), getattr(self, 'last_modified', None),
+            )
+            response_cache.store(self.cache_key, entry)
+        return response
+
+
+class SparseFieldsMixin:
+    """
+    Push ``?fields=`` / ``?omit=`` down to the queryset with ``.only()`` so
+    columns the response does not include are never loaded, and drop
+    prefetches for relations that were left out. Applies to the actions in
+    ``sparse_field_actions`` whose serializer is a DynamicFieldsModelSerializer.
+    """
+    sparse_field_actions = ('list', 'retrieve')
+
+    def restrict_fields(self, queryset, serializer_class=None):
+        if not has_sparse_fields(self.request):
+            return queryset
+        serializer_class = serializer_class or self.get_serializer_class()
+        if not issubclass(serializer_class, DynamicFieldsModelSerializer):
+            return queryset
+        serializer = serializer_class(context=self.get_serializer_context())
+        return serializer.restrict_queryset(queryset)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in self.sparse_field_actions:
+            queryset = self.restrict_fields(queryset)
+        return queryset
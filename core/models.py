@@ -0,0 +1,16 @@
+from django.db import models
+
+
+class ContentVersion(models.Model):
+    """
+    Change counter for a model, bumped on every write.
+
+    Used as a cheap validator for models that have no ``updated_at`` column
+    and for related rows that do not touch their parent's timestamp.
+    """
+    label = models.CharField(max_length=100, primary_key=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.label} v{self.version}"
@@ -0,0 +1,81 @@
+"""
+Response renderers selected by content negotiation.
+
+``ORJSONRenderer`` is a drop-in replacement for DRF's JSONRenderer backed by
+orjson. Dates, times and the other types orjson would encode on its own
+are passed to DRF's JSONEncoder, so the output decodes to the same values as
+DRF's compact, unescaped-unicode JSON (including the \\u2028 / \\u2029
+escaping). The bytes differ for floats: orjson writes exponents without a
+sign or padding (``1e16``, ``1e-7`` where DRF writes ``1e+16``, ``1e-07``)
+and small numbers in plain form (``0.00001``), and it turns NaN and infinity
+into ``null`` where DRF raises. Indented output (the browsable API,
+``Accept: application/json; indent=4``) and anything orjson cannot encode
+fall back to the stdlib renderer.
+
+``MessagePackRenderer`` serves ``application/msgpack`` (or ``?format=msgpack``)
+with the same value encoding as the JSON output.
+"""
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_encoder = encoders.JSONEncoder()
+
+
+def encode_default(obj):
+    """Encode values the way DRF's JSONEncoder does"""
+    return _encoder.default(obj)
+
+
+# Dates, times and dataclasses go through encode_default() like in DRF
+ORJSON_OPTIONS = 0 if orjson is None else (
+    orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer producing the same values through orjson (see the module docstring for floats)
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=encode_default, option=ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. integers wider than 64 bits
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renderer which serializes to MessagePack
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        assert msgpack is not None, 'MessagePackRenderer requires msgpack to be installed'
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=encode_default, use_bin_type=True)
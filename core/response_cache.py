@@ -0,0 +1,149 @@
+"""
+Two-tier cache for rendered API responses.
+
+The first tier is an LRU per process, bounded by the total size of the
+cached bodies. The second is the shared ``responses`` cache alias (file
+based by default), so gunicorn workers reuse each other's entries and a
+worker restart starts warm.
+
+Entries are tagged with model labels and carry the ContentVersion counters
+of those labels at render time. A lookup reads the current counters in one
+query and ignores entries whose counters differ, so any write that bumps a
+counter (save / delete / m2m signals and TrackedQuerySet bulk writes)
+invalidates every response tagged with that model without having to find
+its keys.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.http import HttpResponse
+
+from . import versioning
+
+SHARED_ALIAS = 'responses'
+
+# Headers that are never replayed from the cache
+EXCLUDED_HEADERS = {'set-cookie'}
+
+
+class CachedResponse:
+    """Body, status and headers of a rendered response plus its validators"""
+    __slots__ = ('signature', 'status', 'content', 'headers', 'etag', 'last_modified')
+
+    def __init__(self, signature, status, content, headers, etag=None, last_modified=None):
+        self.signature = signature
+        self.status = status
+        self.content = content
+        self.headers = headers
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @classmethod
+    def from_response(cls, response, signature, etag=None, last_modified=None):
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() not in EXCLUDED_HEADERS
+        }
+        return cls(signature, response.status_code, response.content, headers, etag, last_modified)
+
+    @property
+    def size(self):
+        return len(self.content) + sum(len(name) + len(value) for name, value in self.headers.items())
+
+    def to_response(self):
+        return HttpResponse(self.content, status=self.status, headers=self.headers)
+
+
+class LRUCache:
+    """Thread-safe LRU mapping that evicts the oldest entries beyond ``max_bytes``"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        size = entry.size
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old.size
+            if size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self.size += size
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+local = LRUCache(settings.RESPONSE_CACHE_LOCAL_MAX_BYTES)
+
+
+def get_shared():
+    return caches[SHARED_ALIAS]
+
+
+def make_key(*parts):
+    """
+    Cache key for a response variant. The database name is included so
+    several databases (e.g. the test database) never share entries.
+    """
+    text = '|'.join([str(connection.settings_dict['NAME']), *parts])
+    return 'response:' + hashlib.md5(text.encode('utf-8')).hexdigest()
+
+
+def get_signature(tags):
+    """
+    The current counters of ``tags``. The timestamps keep signatures
+    unique if the counters are ever reset (e.g. a new database)
+    """
+    versions = versioning.get_versions(tags)
+    signature = []
+    for label in sorted(tags):
+        version, updated_at = versions.get(label, (0, None))
+        signature.append((label, version, updated_at.isoformat() if updated_at else ''))
+    return tuple(signature)
+
+
+def lookup(key, signature):
+    """Return the CachedResponse for ``key`` if it was stored under ``signature``"""
+    entry = local.get(key)
+    if entry is not None and entry.signature == signature:
+        return entry
+    entry = get_shared().get(key)
+    if entry is None or entry.signature != signature:
+        return None
+    local.set(key, entry)
+    return entry
+
+
+def store(key, entry):
+    local.set(key, entry)
+    get_shared().set(key, entry)
+
+
+def clear():
+    """Drop every cached response in this process and the shared tier"""
+    local.clear()
+    get_shared().clear()
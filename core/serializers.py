@@ -0,0 +1,115 @@
+"""
+Serializer base classes shared by the content apps.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+
+
+def parse_field_list(value):
+    """Split a comma separated query parameter into field names"""
+    if value is None:
+        return None
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def get_requested_fields(request):
+    """Return the ``(fields, omit)`` lists requested in the query string"""
+    if request is None:
+        return None, None
+    params = request.query_params
+    return parse_field_list(params.get(FIELDS_PARAM)), parse_field_list(params.get(OMIT_PARAM))
+
+
+def has_sparse_fields(request):
+    return request is not None and (FIELDS_PARAM in request.query_params or OMIT_PARAM in request.query_params)
+
+
+class DynamicFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer whose top-level fields can be narrowed with
+    ``?fields=slug,title`` and/or ``?omit=content``, or explicitly with the
+    ``fields`` / ``omit`` keyword arguments.
+
+    Only the serializer created by the view (which receives the request in
+    its context) is pruned; nested serializers keep all their fields.
+    ``Meta.field_dependencies`` maps non-column fields such as properties
+    to the model fields they read, so views can still restrict the query.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        omit = kwargs.pop('omit', None)
+        super().__init__(*args, **kwargs)
+        if fields is None and omit is None:
+            fields, omit = get_requested_fields(self.context.get('request'))
+        if fields is None and omit is None:
+            return
+
+        available = set(self.fields)
+        unknown = (set(fields or ()) | set(omit or ())) - available
+        if unknown:
+            raise serializers.ValidationError({
+                FIELDS_PARAM: f"Unknown field(s): {', '.join(sorted(unknown))}. "
+                              f"Available: {', '.join(self.fields)}."
+            })
+
+        keep = set(available if fields is None else fields)
+        keep -= set(omit or ())
+        for name in available - keep:
+            self.fields.pop(name)
+
+    def get_model_fields(self):
+        """
+        Names of the concrete model fields needed to render the remaining
+        fields, or None if some field reads something that cannot be
+        determined (e.g. a property without a declared dependency)
+        """
+        opts = self.Meta.model._meta
+        dependencies = getattr(self.Meta, 'field_dependencies', {})
+        concrete = {field.name for field in opts.concrete_fields}
+        names = {opts.pk.name}
+        for field in self.fields.values():
+            source = field.source
+            if source in dependencies:
+                names.update(dependencies[source])
+            elif source in concrete:
+                names.add(source)
+            elif not self.get_relation_prefix(source):
+                return None
+        return names
+
+    def get_relation_prefix(self, source):
+        """The relation name if ``source`` is a reverse or many-to-many relation"""
+        try:
+            field = self.Meta.model._meta.get_field(source)
+        except FieldDoesNotExist:
+            return None
+        if field.is_relation and not field.concrete:
+            return source
+        if field.many_to_many:
+            return source
+        return None
+
+    def restrict_queryset(self, queryset):
+        """
+        Load only the columns and prefetches the remaining fields need
+        """
+        if queryset.model is not self.Meta.model:
+            return queryset
+        names = self.get_model_fields()
+        if names is not None:
+            queryset = queryset.only(*names)
+
+        lookups = queryset._prefetch_related_lookups
+        if lookups:
+            wanted = {self.get_relation_prefix(field.source) for field in self.fields.values()}
+            kept = [
+                lookup for lookup in lookups
+                if getattr(lookup, 'prefetch_to', lookup).split('__')[0] in wanted
+            ]
+            if len(kept) != len(lookups):
+                queryset = queryset.prefetch_related(None).prefetch_related(*kept)
+        return queryset
@@ -0,0 +1,465 @@
+import gzip
+import json
+import shutil
+import tempfile
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import msgpack
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from about.models import AboutContent, AboutHighlight
+from about.serializers import AboutContentSerializer, AboutHighlightSerializer
+from blog import viewcounts
+from blog.models import BlogCategoryStat, BlogPost, BlogPostViewCount
+from blog.serializers import BlogCategoryStatSerializer, BlogPostListSerializer, BlogPostSerializer
+from contact.models import ContactInfo
+from contact.serializers import ContactInfoSerializer
+from experience.models import Experience, ExperienceAchievement
+from experience.serializers import ExperienceSerializer
+from services.models import Service, ServiceFeature
+from services.serializers import ServiceSerializer
+from technologies.models import Technology
+from technologies.serializers import TechnologySerializer
+
+from . import export, response_cache
+from .models import ContentVersion
+from .endpoints import iter_endpoints
+from .fast import compile_serializer
+from .renderers import MessagePackRenderer, ORJSONRenderer
+
+
+def create_content():
+    """One or more rows for every public model, including blank and null values"""
+    AboutContent.objects.create(description='Story with “quotes” and separators')
+    AboutHighlight.objects.create(title='Clean code', description='', icon='Code', order=2)
+    AboutHighlight.objects.create(title='Teamwork', description='Together', icon='Users', order=1)
+    for i in range(3):
+        BlogPost.objects.create(
+            title=f'Post {i} — ünïcode', slug=f'post-{i}', excerpt='<p>Excerpt\u2028line</p>',
+            content='<h2>Intro</h2><p>Body</p>', date=date(2025, 1, 1 + i), read_time='3 min read',
+            category='Django', image='' if i else 'https://example.com/a.png', featured=(i == 0),
+            is_published=(i != 2),
+        )
+    BlogCategoryStat.objects.create(category='Empty', post_count=0, latest_date=None)
+    service = Service.objects.create(title='Web', description='Sites', icon='Code', order=1)
+    ServiceFeature.objects.create(service=service, name='Django', order=1)
+    ServiceFeature.objects.create(service=service, name='API', order=1)
+    Service.objects.create(title='Mail', description='Campaigns', icon='Mail', color='info', order=1)
+    current = Experience.objects.create(
+        title='Engineer', company='Acme', location='Remote', period_start='2021', description='Now', order=2,
+    )
+    ExperienceAchievement.objects.create(experience=current, text='Shipped', order=1)
+    Experience.objects.create(
+        title='Intern', company='Acme', location='Remote', period_start='2019', period_end='2021',
+        description='Before', order=1,
+    )
+    Technology.objects.create(name='Django', category='Backend', order=1)
+    ContactInfo.objects.create(email='hello@example.com', phone='', location='Earth')
+
+
+class FastSerializerParityTests(TestCase):
+    """
+    The values()-based list path must render byte-identical JSON to the
+    regular ModelSerializer path for every read serializer.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content()
+
+    def assertParity(self, serializer_class, queryset, **kwargs):
+        fast = serializer_class(queryset.all(), many=True, **kwargs)
+        self.assertIsNotNone(compile_serializer(fast.child), serializer_class.__name__)
+        regular = serializer_class(list(queryset.all()), many=True, **kwargs)
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(fast.data), renderer.render(regular.data))
+
+    def test_parity(self):
+        cases = [
+            (AboutContentSerializer, AboutContent.objects.all()),
+            (AboutHighlightSerializer, AboutHighlight.objects.all()),
+            (BlogPostSerializer, BlogPost.objects.all()),
+            (BlogPostListSerializer, BlogPost.objects.filter(is_published=True)),
+            (BlogPostListSerializer, BlogPost.objects.all()[1:3]),
+            (BlogCategoryStatSerializer, BlogCategoryStat.objects.all()),
+            (ServiceSerializer, Service.objects.prefetch_related('features')),
+            (ExperienceSerializer, Experience.objects.prefetch_related('achievements')),
+            (TechnologySerializer, Technology.objects.all()),
+            (ContactInfoSerializer, ContactInfo.objects.all()),
+        ]
+        for serializer_class, queryset in cases:
+            with self.subTest(serializer=serializer_class.__name__):
+                self.assertParity(serializer_class, queryset)
+
+    def test_parity_with_sparse_fields(self):
+        self.assertParity(BlogPostSerializer, BlogPost.objects.all(), fields=['slug', 'date', 'updated_at'])
+        self.assertParity(ExperienceSerializer, Experience.objects.all(), omit=['achievements', 'period_end'])
+        self.assertParity(ServiceSerializer, Service.objects.all(), fields=['title', 'features'])
+
+    def test_parity_in_other_time_zone(self):
+        with timezone.override('Asia/Kolkata'):
+            self.assertParity(BlogPostSerializer, BlogPost.objects.all())
+
+    def test_nested_relations_use_one_query_per_level(self):
+        with CaptureQueriesContext(connection) as queries:
+            ServiceSerializer(Service.objects.all(), many=True).data
+        self.assertEqual(len(queries), 2)
+
+    def test_endpoint_matches_model_serializer(self):
+        response = self.client.get('/api/services/services/', HTTP_ACCEPT='application/json')
+        services = list(Service.objects.filter(is_active=True).prefetch_related('features'))
+        self.assertEqual(response.content, JSONRenderer().render(ServiceSerializer(services, many=True).data))
+
+
+class RendererParityTests(TestCase):
+    """
+    The orjson renderer must produce the same values as DRF's JSONRenderer
+    (and the same bytes, floats aside), and MessagePack the same values,
+    for every API endpoint.
+    """
+
+    # Plain HttpResponses (HTML content, the bundle's own renderer) have no .data
+    RAW_RESPONSES = {'blogpost-content', 'bundle'}
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content()
+
+    def test_value_encoding(self):
+        data = {
+            'datetime': timezone.now(),
+            'naive': datetime(2025, 1, 2, 3, 4, 5, 6),
+            'date': date(2025, 1, 2),
+            'duration': timedelta(minutes=3),
+            'decimal': Decimal('1.50'),
+            'uuid': uuid.uuid4(),
+            'text': 'line\u2028separator \u2029 “quoted” \x01',
+            1: 'integer key',
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(
+            ORJSONRenderer().render(data, 'application/json; indent=4'),
+            JSONRenderer().render(data, 'application/json; indent=4'),
+        )
+        # MessagePack keeps non-string keys as they are
+        expected = json.loads(JSONRenderer().render(data))
+        expected[1] = expected.pop('1')
+        self.assertEqual(msgpack.unpackb(MessagePackRenderer().render(data), strict_map_key=False), expected)
+
+    def test_float_encoding(self):
+        # Search ranks (bm25 scores) are floats of any magnitude
+        data = {'values': [0.5, -1.25, 1e15, 1e16, 1e-4, 1e-5, 1e-7, -2.5e-06, 1.2345678901234568e17, 1.5e300]}
+        fast, stock = ORJSONRenderer().render(data), JSONRenderer().render(data)
+        self.assertEqual(json.loads(fast), json.loads(stock))
+        # Exponent forms are spelled differently
+        self.assertIn(b'1e16', fast)
+        self.assertIn(b'1e+16', stock)
+        self.assertIn(b'1e-7', fast)
+        self.assertIn(b'1e-07', stock)
+        self.assertEqual(msgpack.unpackb(MessagePackRenderer().render(data)), json.loads(stock))
+
+        # Non-finite floats become null instead of failing the request
+        self.assertEqual(ORJSONRenderer().render({'rank': float('nan'), 'max': float('inf')}), b'{"rank":null,"max":null}')
+        with self.assertRaises(ValueError):
+            JSONRenderer().render({'rank': float('nan')})
+
+    def test_every_endpoint(self):
+        endpoints = list(iter_endpoints())
+        self.assertTrue(endpoints)
+        for name, action, path, params in endpoints:
+            with self.subTest(endpoint=name):
+                # An extra parameter skips the pre-encoded snapshot and variants
+                params = {**params, 'render': 'test'}
+                response = self.client.get(path, params, HTTP_ACCEPT='application/json')
+                self.assertEqual(response.status_code, 200)
+                if name in self.RAW_RESPONSES:
+                    continue
+                self.assertEqual(json.loads(response.content), json.loads(JSONRenderer().render(response.data)))
+
+                packed = self.client.get(path, params, HTTP_ACCEPT='application/msgpack')
+                self.assertEqual(packed['Content-Type'], 'application/msgpack')
+                self.assertEqual(msgpack.unpackb(packed.content), json.loads(response.content))
+
+    def test_precomputed_payloads_match_live(self):
+        # Plain requests are served from the snapshot and stored variants
+        for name, action, path, params in iter_endpoints():
+            with self.subTest(endpoint=name):
+                plain = self.client.get(path, params, HTTP_ACCEPT='application/json')
+                live = self.client.get(path, {**params, 'render': 'test'}, HTTP_ACCEPT='application/json')
+                self.assertEqual(plain.status_code, 200)
+                self.assertEqual(plain.content, live.content)
+                self.assertEqual(plain['Content-Type'], live['Content-Type'])
+                if name in self.RAW_RESPONSES:
+                    continue
+                packed = self.client.get(path, params, HTTP_ACCEPT='application/msgpack')
+                self.assertEqual(msgpack.unpackb(packed.content), json.loads(plain.content))
+
+
+class ConditionalGetTests(TestCase):
+    """Last-Modified and ETag change when rows leave a list, not only when the newest row changes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content()
+
+    def setUp(self):
+        response_cache.clear()
+        # Everything was last written an hour ago
+        past = timezone.now() - timedelta(hours=1)
+        BlogPost.objects.update(updated_at=past)
+        ContentVersion.objects.update(updated_at=past)
+
+    def get(self, **headers):
+        # The snapshot is rebuilt on commit, which never happens in a TestCase
+        return self.client.get('/api/blog/posts/', {'render': 'test'}, HTTP_ACCEPT='application/json', **headers)
+
+    def assertModifiedSince(self, first, write):
+        write()
+        response = self.get(HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], first['ETag'])
+        self.assertNotEqual(response['Last-Modified'], first['Last-Modified'])
+        self.assertEqual(len(response.json()), 1)
+
+    def test_if_modified_since(self):
+        first = self.get()
+        not_modified = self.get(HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_unpublishing_an_older_post(self):
+        first = self.get()
+        post = BlogPost.objects.get(slug='post-0')
+        post.is_published = False
+        self.assertModifiedSince(first, post.save)
+
+    def test_deleting_an_older_post(self):
+        first = self.get()
+        self.assertModifiedSince(first, BlogPost.objects.get(slug='post-0').delete)
+
+    def test_bulk_unpublish(self):
+        first = self.get()
+        self.assertModifiedSince(first, lambda: BlogPost.objects.filter(slug='post-0').update(is_published=False))
+
+    def test_etag_follows_count(self):
+        first = self.get()
+        # A raw write changes the count but neither timestamp
+        with connection.cursor() as cursor:
+            cursor.execute('UPDATE blog_blogpost SET is_published = 0 WHERE slug = %s', ['post-0'])
+        response_cache.clear()
+        response = self.get(HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], first['ETag'])
+        self.assertEqual(response['Last-Modified'], first['Last-Modified'])
+
+
+class BundleTests(TestCase):
+    """The homepage bundle mirrors the individual endpoints and is cached per section."""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content()
+
+    def setUp(self):
+        cache.clear()
+
+    def get_bundle(self, **params):
+        return self.client.get('/api/bundle/', params, HTTP_ACCEPT='application/json')
+
+    def test_sections_match_endpoints(self):
+        data = json.loads(self.get_bundle().content)
+        endpoints = {
+            'services': '/api/services/services/',
+            'about_content': '/api/about/content/',
+            'about_highlights': '/api/about/highlights/',
+            'experience': '/api/experience/experiences/',
+            'technologies': '/api/technologies/technologies/',
+            'contact': '/api/contact/info/current/',
+            'blog_featured': '/api/blog/posts/featured/',
+            'blog_recent': '/api/blog/posts/recent/',
+        }
+        self.assertEqual(list(data), list(endpoints))
+        for name, path in endpoints.items():
+            with self.subTest(section=name):
+                response = self.client.get(path, {'render': 'test'}, HTTP_ACCEPT='application/json')
+                self.assertEqual(data[name]['data'], json.loads(response.content))
+
+    def test_cached_until_a_section_changes(self):
+        first = self.get_bundle()
+        with CaptureQueriesContext(connection) as queries:
+            second = self.get_bundle()
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(second.content, first.content)
+        not_modified = self.client.get('/api/bundle/', HTTP_ACCEPT='application/json', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+
+        Technology.objects.create(name='Python', category='Backend', order=2)
+        with CaptureQueriesContext(connection) as queries:
+            third = self.get_bundle()
+        # Only the technologies section is rebuilt
+        self.assertEqual(len(queries), 2)
+        before, after = json.loads(first.content), json.loads(third.content)
+        self.assertNotEqual(third['ETag'], first['ETag'])
+        self.assertEqual(len(after['technologies']['data']), 2)
+        for name in before:
+            if name != 'technologies':
+                self.assertEqual(after[name], before[name])
+
+    def test_known_sections_are_skipped(self):
+        data = json.loads(self.get_bundle().content)
+        known = ','.join(f"{name}:{data[name]['etag']}" for name in ('services', 'contact'))
+        skipped = json.loads(self.get_bundle(etags=known + ',experience:stale').content)
+        self.assertEqual(skipped['services'], {'etag': data['services']['etag'], 'unchanged': True})
+        self.assertEqual(skipped['contact'], {'etag': data['contact']['etag'], 'unchanged': True})
+        self.assertEqual(skipped['experience'], data['experience'])
+
+        packed = self.client.get('/api/bundle/', HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(msgpack.unpackb(packed.content), data)
+
+
+class StaticExportTests(TestCase):
+    """The static export mirrors the API and only rewrites changed files."""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content()
+
+    def setUp(self):
+        cache.clear()
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def test_export_matches_api(self):
+        stats = export.export(self.root, host='testserver')
+        self.assertEqual(stats['unchanged'], 0)
+        post = BlogPost.objects.get(slug='post-0')
+        detail = self.client.get(f'/api/blog/posts/{post.pk}/', HTTP_ACCEPT='application/json').content
+        for path in (f'api/blog/posts/{post.pk}', 'api/blog/posts/post-0', 'api/blog/posts/by-slug/post-0'):
+            with self.subTest(path=path):
+                self.assertEqual((self.root / path / 'index.json').read_bytes(), detail)
+                self.assertEqual(gzip.decompress((self.root / path / 'index.json.gz').read_bytes()), detail)
+        for path in ('api/blog/posts', 'api/blog/posts/featured', 'api/blog/posts/recent', 'api/bundle'):
+            self.assertTrue((self.root / path / 'index.json').exists(), path)
+        self.assertTrue((self.root / f'api/blog/posts/{post.pk}/content/index.html').exists())
+        # Unpublished posts are not exported
+        self.assertFalse((self.root / 'api/blog/posts/post-2').exists())
+
+    def test_incremental_export(self):
+        export.export(self.root, host='testserver')
+        manifest = json.loads((self.root / export.MANIFEST).read_bytes())['files']
+        self.assertEqual(export.export(self.root, host='testserver')['written'], 0)
+
+        Technology.objects.create(name='Python', category='Backend', order=2)
+        BlogPost.objects.get(slug='post-1').delete()
+        stats = export.export(self.root, host='testserver')
+        # The technology list and detail, the bundle and the blog lists changed
+        self.assertLess(stats['written'], len(manifest) // 2)
+        self.assertGreater(stats['removed'], 0)
+        self.assertFalse((self.root / 'api/blog/posts/post-1').exists())
+        on_disk = {
+            str(path.relative_to(self.root))
+            for path in self.root.rglob('index.*')
+            if path.suffix in ('.json', '.html')
+        }
+        self.assertEqual(set(json.loads((self.root / export.MANIFEST).read_bytes())['files']), on_disk)
+
+    def test_slug_lookups_match_views(self):
+        # A slug of Unicode digits is not an id to the views, so it is exported
+        BlogPost.objects.create(
+            title='Squared', slug='²', excerpt='', content='<p>Body</p>', date=date(2025, 2, 1),
+            category='Django', is_published=True,
+        )
+        export.export(self.root, host='testserver')
+        self.assertTrue((self.root / 'api/blog/posts/%C2%B2/index.json').exists())
+        self.assertTrue((self.root / 'api/blog/posts/by-slug/%C2%B2/index.json').exists())
+
+    @override_settings(BLOG_VIEW_FLUSH_INTERVAL=0)
+    def test_export_does_not_count_views(self):
+        viewcounts.clear()
+        export.export(self.root, host='testserver')
+        self.assertEqual(viewcounts.flush(), 0)
+        self.assertFalse(BlogPostViewCount.objects.exists())
+        # A real request still counts, whatever headers it sends
+        self.client.get('/api/blog/posts/post-0/', HTTP_ACCEPT='application/json', HTTP_X_STATIC_EXPORT='1')
+        self.assertEqual(viewcounts.flush(), 1)
+
+
+class ResponseCacheTests(TestCase):
+    """Cached responses are replayed until a write to a tagged model bumps its counter."""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content()
+
+    def setUp(self):
+        response_cache.clear()
+
+    def get(self, path, **headers):
+        return self.client.get(path, HTTP_ACCEPT='application/json', **headers)
+
+    def assertCached(self, path, expected):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get(path)
+        # Only the ContentVersion lookup
+        self.assertEqual(len(queries), 1, [query['sql'] for query in queries])
+        self.assertEqual(response.content, expected.content)
+        self.assertEqual(response['ETag'], expected['ETag'])
+        return response
+
+    def test_hit_from_both_tiers(self):
+        first = self.get('/api/services/services/')
+        self.assertCached('/api/services/services/', first)
+        response_cache.local.clear()
+        self.assertCached('/api/services/services/', first)
+        with CaptureQueriesContext(connection) as queries:
+            not_modified = self.get('/api/services/services/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(len(queries), 1)
+
+    def test_writes_invalidate(self):
+        path = '/api/services/services/'
+        writes = [
+            lambda: Service.objects.filter(title='Web').update(description='Updated'),
+            lambda: ServiceFeature.objects.bulk_update(
+                [ServiceFeature(pk=feature.pk, name='Renamed', order=feature.order) for feature in ServiceFeature.objects.all()],
+                ['name'],
+            ),
+            lambda: ServiceFeature.objects.bulk_create([ServiceFeature(service=Service.objects.first(), name='New')]),
+            lambda: ServiceFeature.objects.filter(name='New').delete(),
+            lambda: Service.objects.create(title='Ads', description='Campaigns', icon='Mail', order=3),
+        ]
+        previous = self.get(path)
+        for write in writes:
+            write()
+            response = self.get(path)
+            self.assertNotEqual(response.content, previous.content)
+            self.assertCached(path, response)
+            previous = response
+
+    def test_variants_are_cached_separately(self):
+        json_response = self.get('/api/technologies/technologies/')
+        packed = self.client.get('/api/technologies/technologies/', HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(packed['Content-Type'], 'application/msgpack')
+        self.assertEqual(msgpack.unpackb(packed.content), json.loads(json_response.content))
+        sparse = self.get('/api/technologies/technologies/?fields=name')
+        self.assertEqual(json.loads(sparse.content), [{'name': 'Django'}])
+
+    def test_lru_evicts_by_size(self):
+        lru = response_cache.LRUCache(max_bytes=250)
+        for key in 'abc':
+            lru.set(key, response_cache.CachedResponse((), 200, b'x' * 100, {}))
+        lru.get('b')
+        lru.set('d', response_cache.CachedResponse((), 200, b'x' * 100, {}))
+        self.assertEqual(len(lru), 2)
+        self.assertIsNone(lru.get('a'))
+        self.assertIsNone(lru.get('c'))
+        self.assertIsNotNone(lru.get('b'))
+        self.assertLessEqual(lru.size, 250)
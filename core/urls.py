@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import BundleView
+
+urlpatterns = [
+    path('', BundleView.as_view(), name='bundle'),
+]
@@ -0,0 +1,140 @@
+"""
+Per-model change counters backed by the ContentVersion table.
+
+Counters are bumped from the save/delete and m2m_changed signals of the
+tracked models, and from the bulk writes of ``TrackedQuerySet`` (update,
+bulk_update, bulk_create, delete), which send no per-row signals. Those
+bulk writes also send ``bulk_write`` so apps can refresh their own derived
+data.
+"""
+from functools import partial
+
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import Signal
+from django.utils import timezone
+
+from .models import ContentVersion
+
+# Models whose writes bump a ContentVersion counter
+TRACKED_MODELS = [
+    'about.AboutContent',
+    'about.AboutHighlight',
+    'blog.BlogArchiveStat',
+    'blog.BlogCategoryStat',
+    'blog.BlogPopularPost',
+    'blog.BlogPost',
+    'contact.ContactInfo',
+    'experience.Experience',
+    'experience.ExperienceAchievement',
+    'services.Service',
+    'services.ServiceFeature',
+    'technologies.Technology',
+]
+
+# Sent after a TrackedQuerySet bulk write with the model as sender and the database alias as using
+bulk_write = Signal()
+
+
+def _increment(labels):
+    now = timezone.now()
+    for label in labels:
+        updated = ContentVersion.objects.filter(label=label).update(
+            version=F('version') + 1,
+            updated_at=now,
+        )
+        if not updated:
+            ContentVersion.objects.get_or_create(label=label, defaults={'version': 1})
+
+
+def bump(*labels):
+    """
+    Increment the counters for the given model labels. Inside a transaction
+    they are bumped again on commit, after on_commit work such as the blog
+    snapshot rebuild, so nothing cached in between survives.
+    """
+    _increment(labels)
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        return
+    for label in labels:
+        pending = any(
+            getattr(func, 'func', None) is _increment and func.args == ([label],)
+            for _, func, _ in connection.run_on_commit
+        )
+        if not pending:
+            transaction.on_commit(partial(_increment, [label]))
+
+
+def get_versions(labels):
+    """Return {label: (version, updated_at)} for the given labels"""
+    if not labels:
+        return {}
+    rows = ContentVersion.objects.filter(label__in=labels).values_list('label', 'version', 'updated_at')
+    return {label: (version, updated_at) for label, version, updated_at in rows}
+
+
+class TrackedQuerySet(models.QuerySet):
+    """
+    QuerySet whose bulk writes bump the model's counter. Use it as the
+    default manager (``objects = TrackedQuerySet.as_manager()``) of models
+    that are written with update() / bulk_update() / bulk_create().
+    """
+
+    def _bump(self, changed):
+        if changed:
+            bump(self.model._meta.label)
+            bulk_write.send(sender=self.model, using=self.db)
+
+    def update(self, **kwargs):
+        rows = super().update(**kwargs)
+        self._bump(rows)
+        return rows
+
+    update.alters_data = True
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        rows = super().bulk_update(objs, fields, batch_size=batch_size)
+        self._bump(rows)
+        return rows
+
+    bulk_update.alters_data = True
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        self._bump(objs)
+        return objs
+
+    bulk_create.alters_data = True
+
+    def delete(self):
+        deleted, counts = super().delete()
+        self._bump(deleted)
+        return deleted, counts
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
+def _bump_sender(sender, **kwargs):
+    bump(sender._meta.label)
+
+
+def _bump_m2m(sender, instance, action, model, **kwargs):
+    if action.startswith('post_'):
+        bump(type(instance)._meta.label, model._meta.label)
+
+
+def connect_signals():
+    for label in TRACKED_MODELS:
+        model = apps.get_model(label)
+        post_save.connect(_bump_sender, sender=model, dispatch_uid=f'core.versioning.save.{label}')
+        post_delete.connect(_bump_sender, sender=model, dispatch_uid=f'core.versioning.delete.{label}')
+        for field in model._meta.many_to_many:
+            m2m_changed.connect(
+                _bump_m2m,
+                sender=field.remote_field.through,
+                dispatch_uid=f'core.versioning.m2m.{label}.{field.name}',
+            )
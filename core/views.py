@@ -0,0 +1,51 @@
+import hashlib
+from calendar import timegm
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from . import bundle
+
+
+class BundleView(APIView):
+    """
+    Every landing page section in one response. Each section carries its
+    own ETag; pass ``?etags=services:<etag>,blog_recent:<etag>`` to get
+    ``{"unchanged": true}`` instead of the data for sections you already have.
+    """
+    # Formats whose rendered bundle is cached as bytes
+    rendered_formats = ('json', 'msgpack')
+
+    def get_known_sections(self, request, etags):
+        known = set()
+        for item in request.query_params.get('etags', '').split(','):
+            name, _, etag = item.strip().partition(':')
+            if etags.get(name) == etag.strip('"'):
+                known.add(name)
+        return known
+
+    def is_prerendered(self, request):
+        return request.accepted_renderer.format in self.rendered_formats and 'indent' not in (request.accepted_media_type or '')
+
+    def get(self, request):
+        etags, last_modified = bundle.get_state()
+        parts = [bundle.get_bundle_etag(etags), request.accepted_renderer.format, request.get_full_path()]
+        etag = quote_etag(hashlib.md5('|'.join(parts).encode('utf-8')).hexdigest())
+        last_modified = timegm(last_modified.utctimetuple()) if last_modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            known = self.get_known_sections(request, etags)
+            if known or not self.is_prerendered(request):
+                response = Response(bundle.get_sections(etags, skip=known))
+            else:
+                renderer = request.accepted_renderer
+                response = HttpResponse(bundle.get_rendered(etags, renderer), content_type=renderer.media_type)
+
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
@@ -1,5 +1,7 @@
 from django.db import models
 
+from core.versioning import TrackedQuerySet
+
 
 class Experience(models.Model):
     title = models.CharField(max_length=200)
@@ -13,6 +15,8 @@ class Experience(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = TrackedQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-order']
     
@@ -31,6 +35,8 @@ class ExperienceAchievement(models.Model):
     text = models.CharField(max_length=500)
     order = models.IntegerField(default=0)
     
+    objects = TrackedQuerySet.as_manager()
+    
     class Meta:
         ordering = ['order']
     
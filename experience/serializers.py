@@ -1,14 +1,16 @@
 from rest_framework import serializers
+from core.fast import FastListSerializer
+from core.serializers import DynamicFieldsModelSerializer
 from .models import Experience, ExperienceAchievement
 
 
-class ExperienceAchievementSerializer(serializers.ModelSerializer):
+class ExperienceAchievementSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = ExperienceAchievement
         fields = ['id', 'text', 'order']
 
 
-class ExperienceSerializer(serializers.ModelSerializer):
+class ExperienceSerializer(DynamicFieldsModelSerializer):
     achievements = ExperienceAchievementSerializer(many=True, read_only=True)
     period = serializers.ReadOnlyField()
     
@@ -17,4 +19,6 @@ class ExperienceSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'company', 'location', 'period_start', 'period_end', 
                   'period', 'description', 'achievements', 'order', 'is_active', 
                   'created_at', 'updated_at']
+        list_serializer_class = FastListSerializer
+        field_dependencies = {'period': ['period_start', 'period_end']}
 
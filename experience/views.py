@@ -1,5 +1,7 @@
 from rest_framework import viewsets
 from rest_framework.pagination import PageNumberPagination
+from core.mixins import ConditionalGetMixin, ResponseCacheMixin, SparseFieldsMixin
+from core.streaming import StreamingListMixin
 from .models import Experience
 from .serializers import ExperienceSerializer
 
@@ -8,7 +10,8 @@ class NoPagination(PageNumberPagination):
     page_size = None
 
 
-class ExperienceViewSet(viewsets.ReadOnlyModelViewSet):
+class ExperienceViewSet(ResponseCacheMixin, ConditionalGetMixin, StreamingListMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Experience.objects.filter(is_active=True).prefetch_related('achievements')
     serializer_class = ExperienceSerializer
     pagination_class = NoPagination
+    conditional_dependencies = ['experience.ExperienceAchievement']
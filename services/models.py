@@ -1,5 +1,7 @@
 from django.db import models
 
+from core.versioning import TrackedQuerySet
+
 
 class Service(models.Model):
     COLOR_CHOICES = [
@@ -32,6 +34,8 @@ class Service(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = TrackedQuerySet.as_manager()
+    
     class Meta:
         ordering = ['order', 'title']
     
@@ -44,6 +48,8 @@ class ServiceFeature(models.Model):
     name = models.CharField(max_length=200)
     order = models.IntegerField(default=0)
     
+    objects = TrackedQuerySet.as_manager()
+    
     class Meta:
         ordering = ['order', 'name']
     
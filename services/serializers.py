@@ -1,17 +1,19 @@
-from rest_framework import serializers
+from core.fast import FastListSerializer
+from core.serializers import DynamicFieldsModelSerializer
 from .models import Service, ServiceFeature
 
 
-class ServiceFeatureSerializer(serializers.ModelSerializer):
+class ServiceFeatureSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = ServiceFeature
         fields = ['id', 'name', 'order']
 
 
-class ServiceSerializer(serializers.ModelSerializer):
+class ServiceSerializer(DynamicFieldsModelSerializer):
     features = ServiceFeatureSerializer(many=True, read_only=True)
     
     class Meta:
         model = Service
         fields = ['id', 'title', 'description', 'icon', 'color', 'order', 'features', 'is_active', 'created_at', 'updated_at']
+        list_serializer_class = FastListSerializer
 
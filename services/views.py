@@ -2,6 +2,8 @@ from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
+from core.mixins import ConditionalGetMixin, ResponseCacheMixin, SparseFieldsMixin
+from core.streaming import StreamingListMixin
 from .models import Service
 from .serializers import ServiceSerializer
 
@@ -10,13 +12,15 @@ class NoPagination(PageNumberPagination):
     page_size = None
 
 
-class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
+class ServiceViewSet(ResponseCacheMixin, ConditionalGetMixin, StreamingListMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Service.objects.filter(is_active=True).prefetch_related('features')
     serializer_class = ServiceSerializer
     pagination_class = NoPagination
+    conditional_dependencies = ['services.ServiceFeature']
+    sparse_field_actions = ('list', 'retrieve', 'active')
     
     @action(detail=False, methods=['get'])
     def active(self, request):
-        services = Service.objects.filter(is_active=True).prefetch_related('features')
+        services = self.get_queryset()
         serializer = self.get_serializer(services, many=True)
         return Response(serializer.data)
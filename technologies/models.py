@@ -1,5 +1,7 @@
 from django.db import models
 
+from core.versioning import TrackedQuerySet
+
 
 class Technology(models.Model):
     CATEGORY_CHOICES = [
@@ -20,6 +22,8 @@ class Technology(models.Model):
     order = models.IntegerField(default=0)
     is_active = models.BooleanField(default=True)
     
+    objects = TrackedQuerySet.as_manager()
+    
     class Meta:
         ordering = ['order', 'name']
         verbose_name_plural = 'Technologies'
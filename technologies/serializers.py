@@ -1,9 +1,11 @@
-from rest_framework import serializers
+from core.fast import FastListSerializer
+from core.serializers import DynamicFieldsModelSerializer
 from .models import Technology
 
 
-class TechnologySerializer(serializers.ModelSerializer):
+class TechnologySerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = Technology
         fields = ['id', 'name', 'category', 'order', 'is_active']
+        list_serializer_class = FastListSerializer
 
@@ -1,5 +1,7 @@
 from rest_framework import viewsets
 from rest_framework.pagination import PageNumberPagination
+from core.mixins import ConditionalGetMixin, ResponseCacheMixin, SparseFieldsMixin
+from core.streaming import StreamingListMixin
 from .models import Technology
 from .serializers import TechnologySerializer
 
@@ -8,7 +10,7 @@ class NoPagination(PageNumberPagination):
     page_size = None
 
 
-class TechnologyViewSet(viewsets.ReadOnlyModelViewSet):
+class TechnologyViewSet(ResponseCacheMixin, ConditionalGetMixin, StreamingListMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Technology.objects.filter(is_active=True)
     serializer_class = TechnologySerializer
     pagination_class = NoPagination